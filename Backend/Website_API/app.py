@@ -1,38 +1,124 @@
 import os
 from flask import Flask
 from flask_restful import Api
-from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
+from extensions import db
 from routes.users_routes.users_routes_resources import init_users_routes_resources
 from routes.groups_routes.groups_routes_resources import init_groups_routes_resources
 from routes.customers_routes.customers_routes_resources import init_customers_routes_resources
+from routes.tracking_routes.tracking_routes_resources import init_tracking_routes_resources
+from routes.analytics_routes.analytics_routes_resources import init_analytics_routes_resources
+from routes.segments_routes.segments_routes_resources import init_segments_routes_resources
+from routes.suppression_routes.suppression_routes_resources import init_suppression_routes_resources
+from routes.metrics_routes.metrics_routes_resources import init_metrics_routes_resources
+from routes.jobs_routes.jobs_routes_resources import init_jobs_routes_resources
+from utils.http.json_representation import init_json_representation
+from utils.http.compression import init_compression
+from utils.errors.input.input_validation import preload_input_data
+from commands.bounce_commands import init_bounce_commands
+from commands.customer_commands import init_customer_commands
+from commands.group_commands import init_group_commands
+from commands.job_commands import init_job_commands
 
 # Load environment variables from the .env file
 load_dotenv()
 
-app = Flask(__name__)
-api = Api(app)
-
 # Get the full database URL from the environment variable
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Configure Flask to use PostgreSQL (Neon DB) using the connection string from .env
-app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Disable Flask-SQLAlchemy event system
+# Load the heavy validation data (the city list) in `create_app` instead of on the first request,
+# set it when the app is preloaded before forking the workers so they share that memory
+PRELOAD_DATA = os.getenv("PRELOAD_DATA", "false").lower() == "true"
+
+
+def create_app(config: dict = None) -> Flask:
+    """
+    Creates the Flask application: its configuration, extensions, resources and commands.
+
+    Nothing here connects to the database (the engine is created on the first query), so the app can be
+    created in a parent process and shared by forked workers (e.g. `gunicorn --preload "app:create_app()"`).
+
+    Usage:
+        flask --app app run
+        flask --app app recount-customers
+
+    Args:
+        config (dict, optional): Configuration values that override the ones read from the environment.
+
+    Returns:
+        Flask: The application.
+    """
+    app = Flask(__name__)
+
+    # Configure Flask to use PostgreSQL (Neon DB) using the connection string from .env
+    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Disable Flask-SQLAlchemy event system
+    app.config["PRELOAD_DATA"] = PRELOAD_DATA
+    app.config.update(config or {})
+
+    # extensions
+
+    #database
+    db.init_app(app)
+
+    api = Api(app)
+
+    # Serialize the JSON responses with orjson
+    init_json_representation(api)
+
+    # Compress the large responses
+    init_compression(app)
+
+    # resources
+
+    #user resources
+    init_users_routes_resources(api)
+
+    #group resources
+    init_groups_routes_resources(api)
+
+    #customers resources
+    init_customers_routes_resources(api)
+
+    #tracking resources
+    init_tracking_routes_resources(api)
+
+    #analytics resources
+    init_analytics_routes_resources(api)
+
+    #segments resources
+    init_segments_routes_resources(api)
+
+    #suppression resources
+    init_suppression_routes_resources(api)
+
+    #metrics resources
+    init_metrics_routes_resources(api)
+
+    #jobs resources
+    init_jobs_routes_resources(api)
+
+    # commands
+
+    #bounce commands
+    init_bounce_commands(app)
+
+    #customer commands
+    init_customer_commands(app)
+
+    #group commands
+    init_group_commands(app)
 
-# Initialize the SQLAlchemy instance
-db = SQLAlchemy(app)
+    #job commands
+    init_job_commands(app)
 
-# resources
+    # data
 
-#user resources
-init_users_routes_resources(api)
+    if app.config["PRELOAD_DATA"]:
+        preload_input_data()
 
-#group resources
-init_groups_routes_resources(api)
+    return app
 
-#customers resources
-init_customers_routes_resources(api)
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    create_app().run(debug=True)
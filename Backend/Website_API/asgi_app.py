@@ -0,0 +1,17 @@
+from app import create_app
+from utils.http.asgi import AsgiRouter, ThreadPoolWsgiToAsgi
+from services.db.async_engine import dispose_async_engine
+from routes.asgi_routes.asgi_routes_resources import init_asgi_routes_resources
+
+# ASGI deployment mode:
+#   uvicorn asgi_app:application --workers 4
+# The read-heavy and tracking routes are served natively (async, no thread per request),
+# every other route by the Flask app in a pool of threads
+app = create_app()
+application = AsgiRouter(ThreadPoolWsgiToAsgi(app))
+
+# native resources
+init_asgi_routes_resources(application, app)
+
+# Close the connections of the async engine on shutdown
+application.on_shutdown(dispose_async_engine)
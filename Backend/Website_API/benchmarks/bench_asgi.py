@@ -0,0 +1,268 @@
+"""
+Benchmarks the two deployment modes of the API under many slow clients:
+
+- wsgi: the Flask app in the threaded Werkzeug server (`app.run`), one thread per connection.
+- asgi: `asgi_app:application` in uvicorn (one process), the read-heavy and tracking routes served natively.
+
+A temporary SQLite database is filled with a group of customers, then for each mode the server is started
+in a subprocess and loaded with:
+
+1. `--slow` slow clients: connections that send the headers of a request one byte per second
+   (clients on a bad mobile network, or a slowloris), kept open during the whole run.
+2. `--requests` fast requests with `--concurrency` concurrent keep-alive clients, alternating the open
+   pixel and the customers list (`--customers` customers, served from the listing cache after the first).
+
+It prints, per mode, the throughput and latency of the fast requests, the errors, the threads and
+memory (RSS) of the server process at the end of the run, and the counters of its open-events buffer
+(`GET /api/metrics/tracking/`): the opens written to the database and the opens lost. The Werkzeug server also
+serves the half-sent open requests of the slow clients when they disconnect, so its opens exceed the opens sent
+by the fast clients. Linux only (reads /proc).
+
+Usage (from Backend/Website_API):
+    python -m benchmarks.bench_asgi
+    python -m benchmarks.bench_asgi --slow 1000 --requests 5000 --concurrency 100
+    python -m benchmarks.bench_asgi --modes asgi
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from statistics import quantiles
+from time import perf_counter
+
+# The password of the benchmark user
+PASSWORD = "benchmark"
+
+SERVER_COMMANDS = {
+    "wsgi": [sys.executable, "-c",
+             "import sys; from werkzeug.serving import run_simple; from app import create_app; "
+             "run_simple('127.0.0.1', int(sys.argv[1]), create_app(), threaded=True)"],
+    "asgi": [sys.executable, "-m", "uvicorn", "asgi_app:application", "--host", "127.0.0.1",
+             "--log-level", "warning", "--no-access-log", "--port"],
+}
+
+
+def create_database(path: str, customers: int) -> str:
+    """
+    Creates a SQLite database with a user, a group of customers, and a token of the user.
+
+    Args:
+        path (str): The path of the database file.
+        customers (int): The number of customers of the group.
+
+    Returns:
+        str: The authorization token.
+    """
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("TRACKING_SECRET_KEY", "benchmark")
+    from app import create_app
+    from extensions import db
+    from models.user_model import User
+    from models.group_model import Group
+    from models.customer_model import Customer
+    from models.open_event_model import OpenEvent
+    from models.click_event_model import ClickEvent
+    from models.campaign_rollup_model import CampaignRollup
+    from services.token.token_op import get_new_token
+    from bcrypt import hashpw, gensalt
+
+    app = create_app()
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[User.__table__, Group.__table__, Customer.__table__, OpenEvent.__table__,
+                                                  ClickEvent.__table__, CampaignRollup.__table__])
+        db.session.add(User(user_id=1, first_name="Bench", last_name="Mark", email="bench@example.com",
+                            password=hashpw(PASSWORD.encode("utf-8"), gensalt()).decode("utf-8")))
+        db.session.add(Group(group_id=1, group_admin_id=1, group_name="Bench", group_description="Benchmark",
+                             created_at=date.today(), created_at_time=datetime.now().time(),
+                             customer_count=customers))
+        db.session.add_all([
+            Customer(group_id=1, first_name=f"First{index}", last_name=f"Last{index}", email=f"customer{index}@example.com",
+                     country="Israel", city="Haifa", birthday=date(1960, 1, 1) + timedelta(days=index % 15000))
+            for index in range(customers)
+        ])
+        db.session.commit()
+    return get_new_token("bench@example.com", 1)
+
+
+async def wait_for_server(port: int, timeout: float = 20.0):
+    """Waits until the server accepts connections."""
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"The server on port {port} did not start.")
+
+
+async def slow_client(port: int, stop: asyncio.Event):
+    """Sends the headers of a request one byte per second until `stop` is set."""
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    except OSError:
+        return
+    try:
+        writer.write(b"GET /api/tracking/open/1/1 HTTP/1.1\r\nHost: bench\r\nX-Slow: ")
+        while not stop.is_set():
+            writer.write(b"a")
+            await writer.drain()
+            try:
+                await asyncio.wait_for(stop.wait(), 1.0)
+            except asyncio.TimeoutError:
+                pass
+    except OSError:
+        pass
+    finally:
+        writer.close()
+
+
+async def read_response(reader, body: list = None) -> tuple:
+    """
+    Reads a response with a Content-Length body, returns its status and whether the connection stays open.
+    The body is appended to `body` if given.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("The server closed the connection.")
+    length = 0
+    keep_alive = status_line.startswith(b"HTTP/1.1")
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+        elif name.lower() == "connection":
+            keep_alive = value.strip().lower() == "keep-alive"
+    content = await reader.readexactly(length)
+    if body is not None:
+        body.append(content)
+    return int(status_line.split()[1]), keep_alive
+
+
+async def fast_client(port: int, paths: list, token: str, latencies: list, errors: list):
+    """Sends requests on one connection, kept alive when the server allows it (the Werkzeug server speaks HTTP/1.0)."""
+    reader = writer = None
+    for path in paths:
+        request = (f"GET {path} HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {token}\r\n"
+                   f"User-Agent: Mozilla/5.0 (iPhone)\r\n\r\n").encode("latin-1")
+        started = perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            status, keep_alive = await read_response(reader)
+            latencies.append(perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+            if not keep_alive:
+                writer.close()
+                reader = writer = None
+        except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+            errors.append(type(e).__name__)
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def tracking_stats(port: int, token: str) -> dict:
+    """Reads the counters of the open-events buffer of the server, once its flusher had the time to flush."""
+    await asyncio.sleep(2.0)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET /api/metrics/tracking/ HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {token}\r\n\r\n".encode("latin-1"))
+        body = []
+        await read_response(reader, body)
+    finally:
+        writer.close()
+    opens = json.loads(body[0])["opens"]
+    return {"opens_flushed": opens["flushed"], "opens_dropped": opens["dropped"]}
+
+
+def process_stats(pid: int) -> dict:
+    """Reads the threads and RSS of a process from /proc."""
+    stats = {}
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("Threads:"):
+                stats["threads"] = int(line.split()[1])
+            elif line.startswith("VmRSS:"):
+                stats["rss_mb"] = round(int(line.split()[1]) / 1024, 1)
+    return stats
+
+
+async def run_mode(mode: str, port: int, token: str, args) -> dict:
+    """Starts the server of a mode, loads it, and returns its measurements."""
+    command = SERVER_COMMANDS[mode] + [str(port)]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await wait_for_server(port)
+
+        stop = asyncio.Event()
+        slow_tasks = [asyncio.create_task(slow_client(port, stop)) for _ in range(args.slow)]
+        await asyncio.sleep(2.0)
+
+        list_path = "/api/customers/group/1/?sort=email&order=low_to_high&age=uninclude"
+        paths = ["/api/tracking/open/1/1" if index % 2 else list_path for index in range(args.requests)]
+        latencies, errors = [], []
+        started = perf_counter()
+        await asyncio.gather(*[
+            fast_client(port, paths[index::args.concurrency], token, latencies, errors)
+            for index in range(args.concurrency)
+        ])
+        elapsed = perf_counter() - started
+
+        stats = process_stats(server.pid)
+        stop.set()
+        await asyncio.gather(*slow_tasks)
+        stats.update(await tracking_stats(port, token))
+    finally:
+        server.terminate()
+        server.wait()
+
+    percentiles = quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "mode": mode,
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentiles[49] * 1000, 2),
+        "p99_ms": round(percentiles[98] * 1000, 2),
+        "errors": len(errors),
+        "opens_sent": paths.count("/api/tracking/open/1/1"),
+        **stats,
+    }
+
+
+async def main_async(args, token: str):
+    for offset, mode in enumerate(args.modes):
+        result = await run_mode(mode, args.port + offset, token, args)
+        print("  ".join(f"{key}={value}" for key, value in result.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=list(SERVER_COMMANDS), default=list(SERVER_COMMANDS))
+    parser.add_argument("--slow", type=int, default=500, help="The number of slow clients.")
+    parser.add_argument("--requests", type=int, default=2000, help="The number of fast requests.")
+    parser.add_argument("--concurrency", type=int, default=50, help="The number of concurrent fast clients.")
+    parser.add_argument("--customers", type=int, default=200, help="The number of customers of the listed group.")
+    parser.add_argument("--port", type=int, default=18080, help="The port of the first server.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        token = create_database(os.path.join(directory, "bench.db"), args.customers)
+        print(f"slow clients={args.slow}  requests={args.requests}  concurrency={args.concurrency}  customers={args.customers}")
+        asyncio.run(main_async(args, token))
+
+
+if __name__ == "__main__":
+    main()
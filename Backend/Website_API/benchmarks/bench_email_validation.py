@@ -0,0 +1,95 @@
+"""
+Benchmarks the email validation of `email_input`: the previous regex against `is_valid_email`.
+
+Generates a deterministic mix of valid and invalid addresses, validates all of them with every
+validator, and prints the best time of a few runs per validator and how many addresses each one accepts.
+
+Usage (from Backend/Website_API):
+    python -m benchmarks.bench_email_validation
+    python -m benchmarks.bench_email_validation --count 100000 --seed 7 --repeat 5
+"""
+import argparse
+import random
+import re
+import string
+from time import perf_counter
+from utils.email_address.email_syntax import is_valid_email
+
+# The pattern `email_input` used before `is_valid_email`, matched with `re.match` on every call
+LEGACY_PATTERN = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
+
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "example.co.uk", "mail.example.org", "company.co.il",
+           "university.ac.jp", "shop.com.br", "bücher.de", "startup.io"]
+
+# Mistakes that turn a valid address into an invalid one
+MISTAKES = [
+    lambda local, domain: f"{local}..x@{domain}",
+    lambda local, domain: f".{local}@{domain}",
+    lambda local, domain: f"{local}.@{domain}",
+    lambda local, domain: f"{local}@-{domain}",
+    lambda local, domain: f"{local}@{domain}.",
+    lambda local, domain: f"{local}@{domain.split('.')[0]}..com",
+    lambda local, domain: f"{local} @{domain}",
+    lambda local, domain: f"{local}{domain}",
+    lambda local, domain: f"{local}@{domain}@{domain}",
+    lambda local, domain: f"{local}@{domain.rsplit('.', 1)[0]}.con",
+    lambda local, domain: f"{local}@127.0.0.1",
+    lambda local, domain: f"{local * 8}@{domain}",
+]
+
+
+def generate_addresses(count: int, seed: int, invalid_ratio: float = 0.2) -> list:
+    """
+    Generates `count` addresses, about `invalid_ratio` of them with a typical mistake.
+
+    Args:
+        count (int): The number of addresses.
+        seed (int): The random seed, the same seed gives the same addresses.
+        invalid_ratio (float, optional): The share of invalid addresses. Defaults to 0.2.
+
+    Returns:
+        list[str]: The addresses.
+    """
+    generator = random.Random(seed)
+    letters = string.ascii_lowercase
+    addresses = []
+    for _ in range(count):
+        local = "".join(generator.choices(letters, k=generator.randint(3, 10)))
+        if generator.random() < 0.3:
+            local += "." + "".join(generator.choices(letters, k=generator.randint(2, 8)))
+        if generator.random() < 0.1:
+            local += "+news"
+        domain = generator.choice(DOMAINS)
+        if generator.random() < invalid_ratio:
+            addresses.append(generator.choice(MISTAKES)(local, domain))
+        else:
+            addresses.append(f"{local}@{domain}")
+    return addresses
+
+
+def run(name: str, validator, addresses: list, repeat: int):
+    """Validates every address `repeat` times and prints the best elapsed time and the number of accepted addresses."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        accepted = sum(1 for address in addresses if validator(address))
+        elapsed = min(elapsed, perf_counter() - started)
+    print(f"{name:<32} {elapsed:8.3f} s  {len(addresses) / elapsed:>12,.0f} addresses/s  {accepted:>10,} accepted")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000, help="The number of addresses (default: 1,000,000).")
+    parser.add_argument("--seed", type=int, default=42, help="The random seed (default: 42).")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of runs per validator (default: 3).")
+    args = parser.parse_args()
+
+    addresses = generate_addresses(args.count, args.seed)
+    print(f"{len(addresses):,} addresses")
+    run("legacy regex (re.match)", lambda address: bool(re.match(LEGACY_PATTERN, address)), addresses, args.repeat)
+    run("is_valid_email", is_valid_email, addresses, args.repeat)
+    run("is_valid_email + public suffix", lambda address: is_valid_email(address, check_domain=True), addresses, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
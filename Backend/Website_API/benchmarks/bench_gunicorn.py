@@ -0,0 +1,161 @@
+"""
+Benchmarks the throughput of the gunicorn profiles of `gunicorn_config.py` on the two kinds of workloads they target:
+
+- login: `POST /api/users/auth/?action=login`, dominated by the bcrypt check of the password (CPU-bound).
+- list: `GET /api/customers/group/1/`, one or two small queries per request (IO-bound). A local SQLite database
+  answers in microseconds, so every query is delayed by `--db-latency` milliseconds, the round trip to a
+  database server over the network.
+
+A temporary SQLite database is created like in `bench_asgi`, then for each profile gunicorn is started in a
+subprocess with `gunicorn_config.py` and loaded with `--concurrency` concurrent keep-alive clients. It prints, per
+profile and workload, the throughput, the latency percentiles and the errors. The profiles use the cores of this
+machine (see `CORES` in `gunicorn_config.py`), so compare them on the machine that runs the API.
+
+Usage (from Backend/Website_API):
+    python -m benchmarks.bench_gunicorn
+    python -m benchmarks.bench_gunicorn --profiles io --workloads list --list-requests 5000 --db-latency 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import quantiles
+from time import perf_counter, sleep
+from benchmarks.bench_asgi import PASSWORD, create_database, wait_for_server, read_response
+
+WORKLOADS = ["login", "list"]
+PROFILES = ["cpu", "io"]
+
+
+def create_latency_app():
+    """
+    Creates the app with every query delayed by BENCH_DB_LATENCY_MS milliseconds, the app served by the benchmark.
+
+    Returns:
+        Flask: The application.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from app import create_app
+
+    latency = float(os.getenv("BENCH_DB_LATENCY_MS", "0")) / 1000
+    if latency:
+        event.listen(Engine, "before_cursor_execute", lambda *args: sleep(latency))
+    return create_app()
+
+
+def build_request(workload: str, token: str) -> bytes:
+    """Builds the HTTP request of a workload."""
+    if workload == "login":
+        body = json.dumps({"email": "bench@example.com", "password": PASSWORD}).encode("utf-8")
+        return (b"POST /api/users/auth/?action=login HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n\r\n" + body)
+    return (f"GET /api/customers/group/1/?sort=email&order=low_to_high&age=uninclude HTTP/1.1\r\nHost: bench\r\n"
+            f"Authorization: Bearer {token}\r\n\r\n").encode("latin-1")
+
+
+async def client(port: int, request: bytes, count: int, latencies: list, errors: list):
+    """
+    Sends `count` requests on one connection, reconnecting when the server closes it.
+
+    Like HTTP clients do, a request is retried once on a new connection when a kept-alive connection is closed
+    before the response (a worker recycled by `max_requests` closes its idle connections).
+    """
+    reader = writer = None
+    for _ in range(count):
+        started = perf_counter()
+        for attempt in range(2):
+            reused = writer is not None
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                status, keep_alive = await read_response(reader)
+                latencies.append(perf_counter() - started)
+                if status != 200:
+                    errors.append(status)
+                if not keep_alive:
+                    writer.close()
+                    reader = writer = None
+                break
+            except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+                if writer is not None:
+                    writer.close()
+                reader = writer = None
+                if not reused or attempt:
+                    errors.append(type(e).__name__)
+                    break
+    if writer is not None:
+        writer.close()
+
+
+async def run_workload(port: int, workload: str, token: str, requests: int, concurrency: int) -> dict:
+    """Loads the server with the requests of a workload and returns its measurements."""
+    request = build_request(workload, token)
+    latencies, errors = [], []
+    counts = [requests // concurrency + (index < requests % concurrency) for index in range(concurrency)]
+    started = perf_counter()
+    await asyncio.gather(*[client(port, request, count, latencies, errors) for count in counts if count])
+    elapsed = perf_counter() - started
+
+    percentiles = quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentiles[49] * 1000, 2),
+        "p99_ms": round(percentiles[98] * 1000, 2),
+        "errors": len(errors),
+        "error_kinds": sorted(set(map(str, errors))),
+    }
+
+
+async def run_profile(profile: str, port: int, token: str, args) -> list:
+    """Starts gunicorn with a profile, runs the workloads, and returns their measurements."""
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn_config.py", "--bind", f"127.0.0.1:{port}",
+               "benchmarks.bench_gunicorn:create_latency_app()"]
+    environment = {**os.environ, "GUNICORN_PROFILE": profile, "BENCH_DB_LATENCY_MS": str(args.db_latency),
+                   "GUNICORN_LOG_LEVEL": "warning"}
+    server = subprocess.Popen(command, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results = []
+    try:
+        await wait_for_server(port)
+        for workload in args.workloads:
+            requests = args.login_requests if workload == "login" else args.list_requests
+            # Warm up the workers (imports, connections, listing cache)
+            await run_workload(port, workload, token, args.concurrency, args.concurrency)
+            result = await run_workload(port, workload, token, requests, args.concurrency)
+            results.append({"profile": profile, "workload": workload, **result})
+    finally:
+        server.terminate()
+        server.wait()
+    return results
+
+
+async def main_async(args, token: str):
+    for offset, profile in enumerate(args.profiles):
+        for result in await run_profile(profile, args.port + offset, token, args):
+            print("  ".join(f"{key}={value}" for key, value in result.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=PROFILES)
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=WORKLOADS)
+    parser.add_argument("--login-requests", type=int, default=100, help="The number of login requests.")
+    parser.add_argument("--list-requests", type=int, default=2000, help="The number of list requests.")
+    parser.add_argument("--concurrency", type=int, default=32, help="The number of concurrent clients.")
+    parser.add_argument("--db-latency", type=float, default=2.0, help="The delay of every query, in milliseconds.")
+    parser.add_argument("--customers", type=int, default=200, help="The number of customers of the listed group.")
+    parser.add_argument("--port", type=int, default=18090, help="The port of the first server.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        token = create_database(os.path.join(directory, "bench.db"), args.customers)
+        print(f"cores={os.cpu_count()}  concurrency={args.concurrency}  db latency={args.db_latency} ms")
+        asyncio.run(main_async(args, token))
+
+
+if __name__ == "__main__":
+    main()
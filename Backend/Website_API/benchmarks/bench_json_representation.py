@@ -0,0 +1,113 @@
+"""
+Benchmarks the JSON encoding of a large list response: the default Flask-RESTful representation
+(stdlib `json`, with `to_dict` calling `isoformat()` on every date) against `output_json` (orjson, with
+the dates left to the encoder).
+
+Builds the payload of `CustomersGroup.get` for N customers both ways, checks that both bodies decode to
+the same JSON, and prints the best time of a few runs for building and encoding the payload.
+
+Usage (from Backend/Website_API):
+    python -m benchmarks.bench_json_representation
+    python -m benchmarks.bench_json_representation --count 10000 --repeat 5
+"""
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from time import perf_counter
+import orjson
+from utils.http.json_representation import JSON_OPTIONS, default_json
+
+COUNTRIES = ["Israel", "France", "Germany", "United States", "Japan", None]
+CITIES = ["Tel Aviv", "Paris", "Berlin", "New York", "Tokyo", None]
+
+
+def generate_rows(count: int, seed: int) -> list:
+    """
+    Generates the column values of `count` customers, as loaded by the ORM.
+
+    Args:
+        count (int): The number of customers.
+        seed (int): The random seed.
+
+    Returns:
+        list[tuple]: `(customer_id, first_name, last_name, email, country, city, birthday, email_status, group_id)` per customer.
+    """
+    generator = random.Random(seed)
+    first_day = date(1950, 1, 1)
+    return [
+        (customer_id, f"First{customer_id}", f"Last{customer_id}", f"customer{customer_id}@example.com",
+         generator.choice(COUNTRIES), generator.choice(CITIES),
+         first_day + timedelta(days=generator.randint(0, 25000)) if generator.random() < 0.8 else None,
+         "active", 1)
+        for customer_id in range(1, count + 1)
+    ]
+
+
+def legacy_payload(rows: list) -> dict:
+    """The payload as built before: one `isoformat()` call per birthday in `to_dict`."""
+    return {"message": "The customers of the group", "customers": [
+        {"customer_id": customer_id, "first_name": first_name, "last_name": last_name, "email": email,
+         "country": country, "city": city, "birthday": birthday.isoformat() if birthday else None,
+         "email_status": email_status, "group_id": group_id}
+        for customer_id, first_name, last_name, email, country, city, birthday, email_status, group_id in rows
+    ]}
+
+
+def native_payload(rows: list) -> dict:
+    """The payload as built now: dates are left to the encoder."""
+    return {"message": "The customers of the group", "customers": [
+        {"customer_id": customer_id, "first_name": first_name, "last_name": last_name, "email": email,
+         "country": country, "city": city, "birthday": birthday,
+         "email_status": email_status, "group_id": group_id}
+        for customer_id, first_name, last_name, email, country, city, birthday, email_status, group_id in rows
+    ]}
+
+
+def stdlib_encode(payload: dict) -> bytes:
+    """Encodes like the default representation of Flask-RESTful (outside debug mode)."""
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def orjson_encode(payload: dict) -> bytes:
+    """Encodes like `output_json` (outside debug mode)."""
+    return orjson.dumps(payload, default=default_json, option=JSON_OPTIONS)
+
+
+def measure(function, argument, repeat: int):
+    """Returns the best elapsed time of `repeat` calls and the result of the last call."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        result = function(argument)
+        best = min(best, perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="The number of customers (default: 100,000).")
+    parser.add_argument("--seed", type=int, default=42, help="The random seed (default: 42).")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of runs (default: 5).")
+    args = parser.parse_args()
+
+    rows = generate_rows(args.count, args.seed)
+
+    legacy_build, legacy = measure(legacy_payload, rows, args.repeat)
+    native_build, native = measure(native_payload, rows, args.repeat)
+    stdlib_time, stdlib_body = measure(stdlib_encode, legacy, args.repeat)
+    orjson_time, orjson_body = measure(orjson_encode, native, args.repeat)
+
+    if json.loads(stdlib_body) != json.loads(orjson_body):
+        raise SystemExit("The two representations produced different JSON documents.")
+
+    print(f"{args.count:,} customers")
+    print(f"{'':<36} {'build':>9} {'encode':>9} {'total':>9} {'body':>12}")
+    print(f"{'stdlib json + isoformat() in to_dict':<36} {legacy_build:8.3f}s {stdlib_time:8.3f}s "
+          f"{legacy_build + stdlib_time:8.3f}s {len(stdlib_body):>10,} B")
+    print(f"{'orjson output_json':<36} {native_build:8.3f}s {orjson_time:8.3f}s "
+          f"{native_build + orjson_time:8.3f}s {len(orjson_body):>10,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmarks the startup of the API: the time and memory to import the app and run `create_app()`,
+and the memory of forked workers with and without the validation data preloaded in the parent.
+
+Each measurement runs in a new interpreter, so nothing is already imported:
+
+- lazy: `create_app()` without PRELOAD_DATA, then the first city validation (which loads the city names).
+- preload: `create_app()` with PRELOAD_DATA=true (the city names are loaded by the factory).
+- fork-lazy / fork-preload: the app is created in a parent process that forks `--workers` workers, like
+  `gunicorn --preload`; every worker validates a city and reports its private memory (the pages it does not share
+  with the parent) and its proportional set size (PSS, the shared pages divided between the processes).
+
+Linux only (reads /proc/<pid>/smaps_rollup).
+
+Usage (from Backend/Website_API):
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --workers 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+
+CHILD = r"""
+import json, os, signal, sys
+from time import perf_counter
+
+def memory(pid="self"):
+    stats = {}
+    with open(f"/proc/{pid}/smaps_rollup") as rollup:
+        for line in rollup:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                stats[name] = int(value.split()[0]) / 1024
+    return {"rss_mb": stats["Rss"], "pss_mb": stats["Pss"], "private_mb": stats["Private_Clean"] + stats["Private_Dirty"]}
+
+mode, workers = sys.argv[1], int(sys.argv[2])
+os.environ["PRELOAD_DATA"] = "true" if mode.endswith("preload") else "false"
+
+started = perf_counter()
+from app import create_app
+app = create_app()
+result = {"create_app_ms": (perf_counter() - started) * 1000}
+
+from utils.errors.input.input_validation import check_city
+if not mode.startswith("fork"):
+    started = perf_counter()
+    check_city("Haifa")
+    result["first_city_check_ms"] = (perf_counter() - started) * 1000
+    result.update(memory())
+    print(json.dumps(result))
+    sys.exit()
+
+# The workers of fork-lazy load the city names on their first city validation, each in its own memory
+children = []
+for _ in range(workers):
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        check_city("Haifa")
+        os.write(write_end, b"x")
+        # Stay alive until measured and killed by the parent
+        signal.pause()
+    os.close(write_end)
+    os.read(read_end, 1)
+    children.append(pid)
+
+worker_memory = [memory(pid) for pid in children]
+for pid in children:
+    os.kill(pid, 9)
+    os.waitpid(pid, 0)
+result.update({key: sum(stats[key] for stats in worker_memory) / len(worker_memory) for key in worker_memory[0]})
+result["total_pss_mb"] = memory()["pss_mb"] + sum(stats["pss_mb"] for stats in worker_memory)
+print(json.dumps(result))
+"""
+
+
+def run_child(mode: str, workers: int) -> dict:
+    """Runs one measurement in a new interpreter and returns its results."""
+    output = subprocess.run([sys.executable, "-c", CHILD, mode, str(workers)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="The number of runs of every mode (the median is printed).")
+    parser.add_argument("--workers", type=int, default=4, help="The number of forked workers of the fork modes.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    # Compile the modules once, so the runs measure loading them and not compiling them
+    run_child("preload", 1)
+
+    print(f"repeat={args.repeat}  workers={args.workers}  (medians, per worker for the fork modes)")
+    for mode in ["lazy", "preload", "fork-lazy", "fork-preload"]:
+        runs = [run_child(mode, args.workers) for _ in range(args.repeat)]
+        result = {key: round(median(run[key] for run in runs), 1) for key in runs[0]}
+        print(f"{mode:<13}" + "  ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import click
+from services.bounces.bounce_ingestion import ingest_bounce_reports, DEFAULT_BATCH_SIZE
+from services.bounces.mailbox_reader import MAILBOX_FORMATS
+
+
+def init_bounce_commands(app):
+    """
+    Registers the bounce commands on the Flask CLI.
+
+    Usage:
+        flask --app app ingest-bounces /var/mail/bounces
+        flask --app app ingest-bounces feedback.mbox --format mbox --workers 8
+
+    Args:
+        app (Flask): The Flask application.
+    """
+
+    @app.cli.command("ingest-bounces")
+    @click.argument("path", type=click.Path(exists=True))
+    @click.option("--format", "mailbox_format", type=click.Choice(MAILBOX_FORMATS), default=None,
+                  help="The mailbox format, detected from the path by default.")
+    @click.option("--workers", type=int, default=4, show_default=True, help="The number of parsing processes.")
+    @click.option("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, show_default=True,
+                  help="The number of messages applied to the database together.")
+    def ingest_bounces_command(path, mailbox_format, workers, batch_size):
+        """Applies the DSN (bounce) and ARF (complaint) messages of a local maildir or mbox."""
+        stats = ingest_bounce_reports(path, mailbox_format, workers, batch_size)
+        for key, value in stats.items():
+            click.echo(f"{key}: {value}")
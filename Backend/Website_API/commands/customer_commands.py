@@ -0,0 +1,83 @@
+import click
+from services.db.customers.db_op_email_keys import backfill_email_keys, delete_duplicate_customers, BACKFILL_BATCH_SIZE
+from services.db.customers.db_op_customer_stats import recount_group_customers
+
+
+def init_customer_commands(app):
+    """
+    Registers the customer commands on the Flask CLI.
+
+    Usage:
+        flask --app app backfill-email-keys
+        flask --app app backfill-email-keys --batch-size 10000
+        flask --app app delete-duplicate-customers
+        flask --app app recount-customers
+
+    Args:
+        app (Flask): The Flask application.
+    """
+
+    @app.cli.command("backfill-email-keys")
+    @click.option("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, show_default=True,
+                  help="The number of customers updated per transaction.")
+    def backfill_email_keys_command(batch_size):
+        """
+        Recomputes the canonical email key and domain of every customer.
+
+        On a database created before these columns existed, add them first:
+
+            ALTER TABLE customers ADD COLUMN email_key VARCHAR(255), ADD COLUMN email_domain VARCHAR(255);
+
+        then run this command, set both columns NOT NULL, run `delete-duplicate-customers` and create the indexes
+        of the Customer model.
+
+        The unique index on (email_key, group_id) rejects a key that is already used in the group. To change the
+        canonicalization rules on an existing database, drop it first and create it again after
+        `delete-duplicate-customers`.
+        """
+        stats = backfill_email_keys(
+            batch_size,
+            progress=lambda customer_id, scanned, updated: click.echo(
+                f"customer_id <= {customer_id}: {scanned} scanned, {updated} updated"
+            )
+        )
+        click.echo(f"scanned: {stats['scanned']}")
+        click.echo(f"updated: {stats['updated']}")
+
+    @app.cli.command("delete-duplicate-customers")
+    @click.option("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, show_default=True,
+                  help="The number of customers scanned per transaction.")
+    def delete_duplicate_customers_command(batch_size):
+        """
+        Deletes the customers whose email key is already used by an earlier customer of the same group.
+
+        Run it once before creating the unique index of the customers on a database created before it existed:
+
+            flask --app app delete-duplicate-customers
+            CREATE UNIQUE INDEX CONCURRENTLY uq_customers_email_key_group_id ON customers (email_key, group_id);
+            DROP INDEX CONCURRENTLY ix_customers_email_key_group_id;
+
+        The earliest customer (lowest customer_id) of every email in a group is kept. If the index creation fails
+        because duplicates were added meanwhile, drop the invalid index and run both steps again.
+        """
+        stats = delete_duplicate_customers(
+            batch_size,
+            progress=lambda customer_id, scanned, deleted: click.echo(
+                f"customer_id <= {customer_id}: {scanned} scanned, {deleted} deleted"
+            )
+        )
+        click.echo(f"scanned: {stats['scanned']}")
+        click.echo(f"deleted: {stats['deleted']}")
+
+    @app.cli.command("recount-customers")
+    def recount_customers_command():
+        """
+        Recomputes the customer counter of every group from the customers table.
+
+        On a database created before the counter existed, add it first:
+
+            ALTER TABLE groups ADD COLUMN customer_count INTEGER NOT NULL DEFAULT 0;
+
+        then run this command. It can be run again at any time to repair the counters.
+        """
+        click.echo(f"groups updated: {recount_group_customers()}")
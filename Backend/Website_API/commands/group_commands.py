@@ -0,0 +1,42 @@
+import click
+from services.db.groups.db_op_group_transfers import transfer_customers, TRANSFER_OPERATIONS, TRANSFER_BATCH_SIZE
+
+
+def init_group_commands(app):
+    """
+    Registers the group commands on the Flask CLI.
+
+    Usage:
+        flask --app app transfer-customers move 3 4
+        flask --app app transfer-customers copy 3 4 --customer-id 17 --customer-id 18
+        flask --app app transfer-customers merge 3 4 --batch-size 50000
+
+    Args:
+        app (Flask): The Flask application.
+    """
+
+    @app.cli.command("transfer-customers")
+    @click.argument("operation", type=click.Choice(TRANSFER_OPERATIONS))
+    @click.argument("source_group_id", type=int)
+    @click.argument("target_group_id", type=int)
+    @click.option("--customer-id", "customer_ids", type=int, multiple=True,
+                  help="Only transfer this customer of the source group (repeatable, not for merge).")
+    @click.option("--batch-size", type=int, default=TRANSFER_BATCH_SIZE, show_default=True,
+                  help="The number of customers transferred per statement.")
+    def transfer_customers_command(operation, source_group_id, target_group_id, customer_ids, batch_size):
+        """
+        Moves, copies or merges the customers of SOURCE_GROUP_ID into TARGET_GROUP_ID.
+
+        Customers whose email is already in the target group are skipped. A merge then deletes the source group.
+        """
+        try:
+            stats = transfer_customers(
+                operation, source_group_id, target_group_id, list(customer_ids) or None, batch_size,
+                progress=lambda customer_id, scanned, transferred, skipped: click.echo(
+                    f"customer_id <= {customer_id}: {scanned} scanned, {transferred} transferred, {skipped} skipped"
+                )
+            )
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        for key, value in stats.items():
+            click.echo(f"{key}: {value}")
@@ -0,0 +1,34 @@
+import os
+import socket
+import click
+from services.jobs.job_runner import run_worker, run_worker_pool
+
+
+def init_job_commands(app):
+    """
+    Registers the job commands on the Flask CLI.
+
+    Usage:
+        flask --app app jobs-worker
+        flask --app app jobs-worker --processes 8
+        flask --app app jobs-worker --drain
+
+    Args:
+        app (Flask): The Flask application.
+    """
+
+    @app.cli.command("jobs-worker")
+    @click.option("--processes", type=int, default=2, show_default=True, help="The number of worker processes.")
+    @click.option("--poll-interval", type=float, default=1.0, show_default=True,
+                  help="The seconds a worker waits when no job is queued.")
+    @click.option("--drain", is_flag=True, help="Run the queued jobs in this process, then exit.")
+    def jobs_worker_command(processes, poll_interval, drain):
+        """
+        Runs the queued background jobs (e.g. the group transfers and deletions) until stopped with Ctrl+C or SIGTERM.
+        """
+        if drain:
+            jobs_run = run_worker(f"{socket.gethostname()}:{os.getpid()}", poll_interval)
+            click.echo(f"jobs run: {jobs_run}")
+            return
+        click.echo(f"Starting {processes} job workers")
+        run_worker_pool(processes, poll_interval)
@@ -0,0 +1,5 @@
+from flask_sqlalchemy import SQLAlchemy
+
+# The extensions are created without an app and bound to it in `create_app`,
+# so the models can import them without importing (and creating) the app
+db = SQLAlchemy()
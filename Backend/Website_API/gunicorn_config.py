@@ -0,0 +1,95 @@
+"""
+Gunicorn configuration of the production server:
+
+    gunicorn -c gunicorn_config.py wsgi:app
+    GUNICORN_PROFILE=cpu gunicorn -c gunicorn_config.py wsgi:app
+
+Profiles (GUNICORN_PROFILE):
+- io (default): `gthread` workers, one per core, with GUNICORN_THREADS threads each (8 by default). For the listing,
+  tracking and CRUD routes, which mostly wait on the database: a thread waiting on a query releases the GIL to the others.
+  Keep the threads at most the SQLAlchemy pool of a worker (pool_size + max_overflow, 5 + 10 by default).
+- cpu: `sync` workers, one per core plus one, one request at a time. For the bcrypt-heavy auth routes (signup, login,
+  password change), where more threads than cores only add queueing. Put a buffering proxy (nginx) in front of it,
+  a sync worker is blocked by a slow client for the whole request.
+
+Workers are recycled to cap their memory: after GUNICORN_MAX_REQUESTS requests (with a random jitter, so they do not
+all restart at once), or after a request that leaves their peak RSS above GUNICORN_MAX_WORKER_MEMORY_MB.
+
+The app is preloaded in the master (GUNICORN_PRELOAD, true by default) with PRELOAD_DATA, so the workers share the
+pages of the code and of the city list. A preloaded app is not reloaded by `kill -HUP`, which only restarts the workers;
+to deploy new code without dropping requests, start a new master with `kill -USR2 <master>`, then stop the workers of
+the old one with `kill -WINCH <old master>` and the old master with `kill -QUIT <old master>`.
+Without preload, `kill -HUP <master>` reloads the code and the configuration gracefully.
+"""
+import os
+import gc
+import resource
+from multiprocessing import cpu_count
+from dotenv import load_dotenv
+
+# Load environment variables from the .env file
+load_dotenv()
+
+CORES = cpu_count()
+
+# Workers, threads and timeout of every profile, GUNICORN_WORKERS / GUNICORN_THREADS / GUNICORN_TIMEOUT override them
+PROFILES = {
+    "io": {"worker_class": "gthread", "workers": CORES, "threads": 8, "timeout": 60},
+    "cpu": {"worker_class": "sync", "workers": CORES + 1, "threads": 1, "timeout": 30},
+}
+
+GUNICORN_PROFILE = os.getenv("GUNICORN_PROFILE", "io")
+if GUNICORN_PROFILE not in PROFILES:
+    raise ValueError(f"Invalid GUNICORN_PROFILE: '{GUNICORN_PROFILE}'. Must be one of {list(PROFILES)}.")
+profile = PROFILES[GUNICORN_PROFILE]
+
+# A worker that ends a request above this peak RSS exits after it (0 disables the check)
+GUNICORN_MAX_WORKER_MEMORY_MB = int(os.getenv("GUNICORN_MAX_WORKER_MEMORY_MB", "512"))
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+worker_class = profile["worker_class"]
+workers = int(os.getenv("GUNICORN_WORKERS", profile["workers"]))
+threads = int(os.getenv("GUNICORN_THREADS", profile["threads"]))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", profile["timeout"]))
+# Seconds the workers get to finish their requests on reload or shutdown
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Worker recycling
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+if preload_app:
+    # Load the city list in the master, before the app is imported
+    os.environ.setdefault("PRELOAD_DATA", "true")
+
+# The heartbeat files of the workers in memory, a disk-backed /tmp can stall them (e.g. in containers)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """
+    Runs in the master before the workers are forked.
+
+    Moves the objects of the preloaded app to the permanent generation of the garbage collector, so the collections
+    of the workers do not write to (and copy) the pages they share with the master.
+    """
+    if preload_app:
+        gc.freeze()
+    server.log.info(f"Profile '{GUNICORN_PROFILE}': {workers} {worker_class} workers x {threads} threads")
+
+
+def post_request(worker, req, environ, resp):
+    """Stops the worker gracefully after this request if its peak RSS is above GUNICORN_MAX_WORKER_MEMORY_MB."""
+    if not GUNICORN_MAX_WORKER_MEMORY_MB:
+        return
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if peak_mb > GUNICORN_MAX_WORKER_MEMORY_MB and worker.alive:
+        worker.log.info(f"Worker {worker.pid} reached {peak_mb:.0f} MB, restarting it")
+        worker.alive = False
@@ -0,0 +1,29 @@
+from extensions import db
+
+class CampaignRollup(db.Model):
+    __tablename__ = 'campaign_rollups'  # Name of the table in the database
+    # One row per campaign x hour x country x device, updated incrementally by the event flushers
+    campaign_id = db.Column(db.Integer, primary_key=True)
+    bucket_hour = db.Column(db.DateTime, primary_key=True)
+    country = db.Column(db.String(120), primary_key=True, default='')  # '' when the country is unknown
+    device_code = db.Column(db.SmallInteger, primary_key=True, default=0)  # 0 when the device is unknown
+    opens = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f"<CampaignRollup campaign_id={self.campaign_id}, "
+                f"bucket_hour={self.bucket_hour}, "
+                f"country='{self.country}', "
+                f"device_code={self.device_code}, "
+                f"opens={self.opens}, "
+                f"clicks={self.clicks}>")
+
+    def to_dict(self):
+        return {
+            'campaign_id': self.campaign_id,
+            'bucket_hour': self.bucket_hour,
+            'country': self.country or None,
+            'device_code': self.device_code,
+            'opens': self.opens,
+            'clicks': self.clicks
+        }
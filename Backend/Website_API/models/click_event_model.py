@@ -0,0 +1,30 @@
+from extensions import db
+
+class ClickEvent(db.Model):
+    __tablename__ = 'click_events'  # Name of the table in the database
+    # SQLite only autoincrements an INTEGER primary key
+    click_event_id = db.Column(db.BigInteger().with_variant(db.Integer, "sqlite"), primary_key=True)
+    # No foreign keys on purpose, like open events the clicks are written in large batches
+    campaign_id = db.Column(db.Integer, nullable=False, index=True)
+    customer_id = db.Column(db.Integer, nullable=False)
+    link_index = db.Column(db.SmallInteger, nullable=False)
+    device_code = db.Column(db.SmallInteger, nullable=False, default=0)  # see utils/user_agent/user_agent_classifier.py
+    clicked_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return (f"<ClickEvent click_event_id={self.click_event_id}, "
+                f"campaign_id={self.campaign_id}, "
+                f"customer_id={self.customer_id}, "
+                f"link_index={self.link_index}, "
+                f"device_code={self.device_code}, "
+                f"clicked_at={self.clicked_at}>")
+
+    def to_dict(self):
+        return {
+            'click_event_id': self.click_event_id,
+            'campaign_id': self.campaign_id,
+            'customer_id': self.customer_id,
+            'link_index': self.link_index,
+            'device_code': self.device_code,
+            'clicked_at': self.clicked_at
+        }
@@ -1,6 +1,8 @@
-from app import db
+from extensions import db
 from models.group_model import Group
-from datetime import date
+from sqlalchemy.orm import validates
+from utils.email_address.canonical_email import canonical_email, email_domain
+from utils.converters.calculate_age import calculate_age
 
 class Customer(db.Model):
     __tablename__ = 'customers'  # Name of the table in the database
@@ -9,12 +11,46 @@ class Customer(db.Model):
     first_name = db.Column(db.String(80), nullable=False)
     last_name = db.Column(db.String(80), nullable=False)
     email = db.Column(db.String(120), nullable=False)
+    # Canonical form of the email (see `canonical_email`) and its domain, kept in sync by `set_email_keys`
+    email_key = db.Column(db.String(255), nullable=False)
+    email_domain = db.Column(db.String(255), nullable=False)
     country = db.Column(db.String(120), nullable=True)
     city = db.Column(db.String(120), nullable=True)
     birthday = db.Column(db.Date, nullable=True)
+    # Deliverability of the address: 'active', 'bounced' (hard bounce) or 'complained' (spam complaint)
+    email_status = db.Column(db.String(20), nullable=False, default='active', server_default='active')
 
-    # Relationship to the Group model (for the customer's group)
-    group = db.relationship('Group', backref='customers', lazy=True)
+    # Indexes used by the segment queries (group_id leads, so they also serve lookups by group)
+    __table_args__ = (
+        db.Index('ix_customers_group_id_country', 'group_id', 'country'),
+        db.Index('ix_customers_group_id_birthday', 'group_id', 'birthday'),
+        db.Index('ix_customers_city_prefix', 'city', postgresql_ops={'city': 'text_pattern_ops'}),
+        db.Index('ix_customers_group_id_email_domain', 'group_id', 'email_domain'),
+        # A customer is unique per group by canonical email. email_key leads so the index also serves lookups of an
+        # address across all groups (bounces, suppressions). See `delete_duplicate_customers` to create it on an
+        # existing database
+        db.Index('uq_customers_email_key_group_id', 'email_key', 'group_id', unique=True),
+    )
+
+    # Relationship to the Group model (for the customer's group). passive_deletes: deleting a group never loads its
+    # customers, the database deletes them (ON DELETE CASCADE)
+    group = db.relationship('Group', backref=db.backref('customers', lazy=True, passive_deletes=True), lazy=True)
+
+    @validates('email')
+    def set_email_keys(self, key, email):
+        """
+        Computes the canonical key and the domain of the email whenever the email is set.
+
+        Args:
+            key (str): The name of the attribute ('email').
+            email (str): The new email.
+
+        Returns:
+            str: The email, stored as given.
+        """
+        self.email_key = canonical_email(email)
+        self.email_domain = email_domain(self.email_key)
+        return email
 
     def __repr__(self):
         return (f"<Customer customer_id={self.customer_id}, "
@@ -24,6 +60,7 @@ class Customer(db.Model):
                 f"country='{self.country}', "
                 f"city='{self.city}', "
                 f"birthday={self.birthday}, "
+                f"email_status='{self.email_status}', "
                 f"group_id={self.group_id}>")
 
     def to_dict(self):
@@ -34,7 +71,8 @@ class Customer(db.Model):
             'email': self.email,
             'country': self.country,
             'city': self.city,
-            'birthday': self.birthday.isoformat() if self.birthday else None,
+            'birthday': self.birthday,
+            'email_status': self.email_status,
             'group_id': self.group_id
         }
     
@@ -45,8 +83,6 @@ class Customer(db.Model):
         Returns:
             dict: A dictionary representation of the Customer object with age.
         """
-        calculate_age = lambda b: (date.today().year - b.year - ((date.today().month, date.today().day) < (b.month, b.day))) if b else None
-        
         my_dic = self.to_dict()
         my_dic['age'] = calculate_age(self.birthday)
         return my_dic
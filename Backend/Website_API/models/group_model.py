@@ -1,17 +1,21 @@
-from app import db
+from extensions import db
 from models.user_model import User
 
 class Group(db.Model):
     __tablename__ = 'groups'  # Name of the table in the database
     group_id = db.Column(db.Integer, primary_key=True)
-    group_admin_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
+    group_admin_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False, index=True)
     group_name = db.Column(db.String(120), nullable=False)
     group_description = db.Column(db.String(300), nullable=False)
     created_at = db.Column(db.Date, nullable=False)
     created_at_time = db.Column(db.Time, nullable=False)  
+    # Bumped whenever the group or its customers change, used for the ETags of the customers list
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    # Number of customers of the group, maintained with the version so counting them does not read the customers table
+    customer_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     
-    # Relationship with User
-    user = db.relationship('User', backref='groups', lazy=True)
+    # Relationship with User. passive_deletes: deleting a user never loads their groups, the database deletes them
+    user = db.relationship('User', backref=db.backref('groups', lazy=True, passive_deletes=True), lazy=True)
 
     def __repr__(self):
         return (f"<Group group_id={self.group_id}, "
@@ -27,6 +31,6 @@ class Group(db.Model):
             'group_admin_id': self.group_admin_id,
             'group_name': self.group_name,
             'group_description': self.group_description,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'created_at_time': self.created_at_time.isoformat() if self.created_at_time else None
+            'created_at': self.created_at,
+            'created_at_time': self.created_at_time
         }
\ No newline at end of file
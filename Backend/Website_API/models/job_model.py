@@ -0,0 +1,60 @@
+from extensions import db
+from models.user_model import User
+
+class Job(db.Model):
+    __tablename__ = 'jobs'  # Name of the table in the database
+    job_id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)  # The name of the handler, see services/jobs/job_handlers.py
+    # The user who created the job, None for jobs created from the CLI. The job outlives its owner (e.g. the job
+    # deleting the user)
+    owner_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='SET NULL'), nullable=True, index=True)
+    params = db.Column(db.JSON, nullable=False)
+    # 'queued', 'running', 'succeeded', 'failed' or 'cancelled'
+    status = db.Column(db.String(20), nullable=False, default='queued', server_default='queued')
+    done = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    total = db.Column(db.Integer, nullable=True)  # None when the size of the work is unknown
+    checkpoint = db.Column(db.JSON, nullable=True)  # Where the handler resumes after an interruption
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.String(500), nullable=True)
+    cancel_requested = db.Column(db.Boolean, nullable=False, default=False, server_default='false')
+    attempts = db.Column(db.SmallInteger, nullable=False, default=0, server_default='0')
+    worker = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.Date, nullable=False)
+    created_at_time = db.Column(db.Time, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    # Refreshed by every progress report, a running job without heartbeat for JOB_LEASE_SECONDS is requeued
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # Workers claim the oldest queued job
+    __table_args__ = (
+        db.Index('ix_jobs_status_job_id', 'status', 'job_id'),
+    )
+
+    def __repr__(self):
+        return (f"<Job job_id={self.job_id}, "
+                f"kind='{self.kind}', "
+                f"owner_id={self.owner_id}, "
+                f"status='{self.status}', "
+                f"done={self.done}, "
+                f"total={self.total}>")
+
+    def to_dict(self):
+        # The checkpoint is internal to the handler
+        return {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'owner_id': self.owner_id,
+            'params': self.params,
+            'status': self.status,
+            'done': self.done,
+            'total': self.total,
+            'result': self.result,
+            'error': self.error,
+            'cancel_requested': self.cancel_requested,
+            'attempts': self.attempts,
+            'created_at': self.created_at,
+            'created_at_time': self.created_at_time,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
@@ -0,0 +1,28 @@
+from extensions import db
+
+class OpenEvent(db.Model):
+    __tablename__ = 'open_events'  # Name of the table in the database
+    # SQLite only autoincrements an INTEGER primary key
+    open_event_id = db.Column(db.BigInteger().with_variant(db.Integer, "sqlite"), primary_key=True)
+    # No foreign keys on purpose: events are written in large batches and must
+    # not fail (or pay for FK checks) when a customer is deleted in the meantime.
+    campaign_id = db.Column(db.Integer, nullable=False, index=True)
+    customer_id = db.Column(db.Integer, nullable=False)
+    device_code = db.Column(db.SmallInteger, nullable=False, default=0)  # see utils/user_agent/user_agent_classifier.py
+    opened_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return (f"<OpenEvent open_event_id={self.open_event_id}, "
+                f"campaign_id={self.campaign_id}, "
+                f"customer_id={self.customer_id}, "
+                f"device_code={self.device_code}, "
+                f"opened_at={self.opened_at}>")
+
+    def to_dict(self):
+        return {
+            'open_event_id': self.open_event_id,
+            'campaign_id': self.campaign_id,
+            'customer_id': self.customer_id,
+            'device_code': self.device_code,
+            'opened_at': self.opened_at
+        }
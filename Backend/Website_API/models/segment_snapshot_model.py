@@ -0,0 +1,31 @@
+from extensions import db
+from models.user_model import User
+
+class SegmentSnapshot(db.Model):
+    __tablename__ = 'segment_snapshots'  # Name of the table in the database
+    snapshot_id = db.Column(db.Integer, primary_key=True)
+    admin_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False, index=True)
+    segment = db.Column(db.JSON, nullable=True)  # The segment definition, None for snapshots built by set operations
+    size = db.Column(db.Integer, nullable=False)
+    codec_version = db.Column(db.SmallInteger, nullable=False)
+    customer_ids = db.Column(db.LargeBinary, nullable=False)  # see services/segments/customer_id_set.py
+    created_at = db.Column(db.Date, nullable=False)
+    created_at_time = db.Column(db.Time, nullable=False)
+
+    def __repr__(self):
+        return (f"<SegmentSnapshot snapshot_id={self.snapshot_id}, "
+                f"admin_id={self.admin_id}, "
+                f"size={self.size}, "
+                f"created_at={self.created_at}, "
+                f"created_at_time={self.created_at_time}>")
+
+    def to_dict(self):
+        # The ids are not included, they can be millions of them
+        return {
+            'snapshot_id': self.snapshot_id,
+            'admin_id': self.admin_id,
+            'segment': self.segment,
+            'size': self.size,
+            'created_at': self.created_at,
+            'created_at_time': self.created_at_time
+        }
@@ -0,0 +1,33 @@
+from extensions import db
+from models.user_model import User
+
+class Suppression(db.Model):
+    __tablename__ = 'suppressions'  # Name of the table in the database
+    # Send workers refresh their suppression lists incrementally by suppression_id (see services/suppression/suppression_list.py)
+    suppression_id = db.Column(db.BigInteger, primary_key=True)
+    # None means the address is suppressed for every admin (e.g. a hard bounce)
+    group_admin_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=True, index=True)
+    customer_id = db.Column(db.Integer, nullable=True)  # No foreign key, the suppression outlives the customer
+    email = db.Column(db.String(120), nullable=False)
+    email_hash = db.Column(db.BigInteger, nullable=False, index=True)  # see services/suppression/suppression_list.py
+    reason = db.Column(db.String(20), nullable=False)  # 'unsubscribe', 'bounce', 'complaint' or 'manual'
+    created_at = db.Column(db.Date, nullable=False)
+    created_at_time = db.Column(db.Time, nullable=False)
+
+    def __repr__(self):
+        return (f"<Suppression suppression_id={self.suppression_id}, "
+                f"group_admin_id={self.group_admin_id}, "
+                f"customer_id={self.customer_id}, "
+                f"email='{self.email}', "
+                f"reason='{self.reason}'>")
+
+    def to_dict(self):
+        return {
+            'suppression_id': self.suppression_id,
+            'group_admin_id': self.group_admin_id,
+            'customer_id': self.customer_id,
+            'email': self.email,
+            'reason': self.reason,
+            'created_at': self.created_at,
+            'created_at_time': self.created_at_time
+        }
@@ -1,4 +1,4 @@
-from app import db
+from extensions import db
 
 class User(db.Model):
     __tablename__ = 'users'  # Name of the table in the database
@@ -7,6 +7,8 @@ class User(db.Model):
     last_name = db.Column(db.String(80), nullable=False)
     email = db.Column(db.String(120), nullable=False, unique=True)
     password = db.Column(db.String(120), nullable=False)
+    # Bumped whenever one of the user's groups is created, changed or deleted, used for the ETags of the groups list
+    groups_version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
 
     def __repr__(self):
         return f"<User user_id={self.user_id}, first_name={self.first_name}, last_name={self.last_name}, email={self.email}>"
@@ -19,3 +21,12 @@ class User(db.Model):
             'last_name': self.last_name,
             'email': self.email
         }
+
+
+# Prefix search of the users page (lower(email) LIKE 'prefix%'): text_pattern_ops makes the index usable by LIKE
+# whatever the collation of the database
+db.Index(
+    'ix_users_email_lower_prefix',
+    db.func.lower(User.email).label('email_lower'),
+    postgresql_ops={'email_lower': 'text_pattern_ops'}
+)
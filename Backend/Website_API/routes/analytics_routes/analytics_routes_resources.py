@@ -0,0 +1,5 @@
+from .campaign_report import CampaignReport
+
+
+def init_analytics_routes_resources(api):
+    api.add_resource(CampaignReport, "/api/analytics/campaigns/<int:campaign_id>/")
@@ -0,0 +1,49 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.analytics.db_op_campaign_reports import get_campaign_report
+
+
+class CampaignReport(Resource):
+    def get(self, campaign_id: int):
+        """
+        Handles the GET request to retrieve the performance report of a campaign.
+
+        The report is read from the pre-aggregated rollups only, so its cost does not grow with the number of events.
+
+        Args:
+            campaign_id (int): The ID of the campaign.
+
+        Query Parameters:
+            breakdown (str): How to split the report.
+                        Allowed values: 'total', 'hour', 'country', 'device'.
+
+        Returns:
+            dict: A response containing the report of the campaign.
+            HTTP Status Code:
+                - 200: Success, the report is returned.
+                - 400: If the `breakdown` query parameter is invalid.
+                - 500: If an unexpected error occurs.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Retrieve 'breakdown' from the query parameters
+            breakdown = request.args.get("breakdown", "total")
+
+            #check Query Parameters
+            if breakdown not in ["total", "hour", "country", "device"]:
+                return {"message": "Invalid breakdown. Use 'total', 'hour', 'country', or 'device'."}, 400
+
+            #get report from db
+            report = get_campaign_report(campaign_id, breakdown)
+
+            # Return the response with the report
+            return {"message": "The report of the campaign", "report": report}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
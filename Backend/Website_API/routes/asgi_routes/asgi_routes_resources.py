@@ -0,0 +1,12 @@
+from .customers_group_async import CustomersGroupAsync
+from .groups_user_async import GroupsUserAsync
+from .tracking_async import OpenPixelAsync, ClickRedirectAsync
+
+
+def init_asgi_routes_resources(router, app):
+    router.add_resource(CustomersGroupAsync, "/api/customers/group/<int:group_id>/")
+    router.add_resource(GroupsUserAsync, "/api/groups/user/<int:user_id>/")
+    router.add_resource(OpenPixelAsync, "/api/tracking/open/<int:campaign_id>/<int:customer_id>",
+                        resource_class_kwargs={"app": app})
+    router.add_resource(ClickRedirectAsync, "/api/tracking/click/<string:token>",
+                        resource_class_kwargs={"app": app})
@@ -0,0 +1,67 @@
+from datetime import date
+from services.token.token_op import check_token
+from services.db.async_engine import fetch_all, fetch_scalar
+from services.db.versions.db_op_versions import group_version_statement
+from services.db.customers.db_op_customers_group import customers_of_group_statement, customers_from_rows
+from services.cache.listing_cache import listing_cache
+from routes.customers_routes.customers_group import CustomersGroup
+from utils.converters.parse_fields import parse_fields
+from utils.http.etag import make_etag, etag_matches, etag_headers
+
+
+class CustomersGroupAsync(CustomersGroup):
+    async def get(self, request, group_id: int):
+        """
+        The ASGI version of `CustomersGroup.get`: the same query parameters, validation, ETag, listing cache
+        and response, with the database read through the async engine so a slow query or client
+        does not hold a thread.
+
+        Args:
+            request (AsgiRequest): The request.
+            group_id (int): The ID of the group whose customers are to be retrieved.
+
+        Returns:
+            tuple: The response and HTTP status code (200, 304, 400, 401, 404 or 500), with headers on 200 and 304.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Retrieve 'sort' and 'order' from the query parameters
+            sort = request.args.get("sort")
+            order = request.args.get("order")
+            age = request.args.get("age")
+            fields = parse_fields(request.args.get("fields"))
+
+            #check Query Parameters
+            error_query_parameters = self.check_query_parameters(sort, order, age, fields)
+            if error_query_parameters:
+                return error_query_parameters
+
+            # check if group exist (the version is read by primary key)
+            version = await fetch_scalar(group_version_statement(group_id))
+            if version is None:
+                return {"message": f"Group with group_id {group_id} does not exist."}, 404
+
+            # check if the client already has this version (the ages change every day)
+            today = date.today().isoformat() if age == "include" else None
+            etag = make_etag("customers", group_id, f"v{version}", today)
+            if etag_matches(etag, request.if_none_match):
+                return b"", 304, etag_headers(etag)
+
+            #get customers from the cache or the db
+            async def read_customers():
+                statement, selected_fields, columns = customers_of_group_statement(group_id, sort, order, age, fields)
+                return customers_from_rows(await fetch_all(statement), selected_fields, columns, age)
+
+            cache_key = ("customers", group_id, version, today, sort, order, age, tuple(fields) if fields else None)
+            customers = await listing_cache.get_or_compute_async(cache_key, read_customers)
+
+            # Return the response with the list of groups
+            return {"message": "All the customers of the group", "customers": customers}, 200, etag_headers(etag)
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
@@ -0,0 +1,63 @@
+from services.token.token_op import check_token
+from services.db.async_engine import fetch_all, fetch_scalar
+from services.db.versions.db_op_versions import user_groups_version_statement
+from services.db.groups.db_op_groups_user import groups_of_user_statement
+from services.cache.listing_cache import listing_cache
+from routes.groups_routes.groups_user import GroupsUser
+from utils.converters.parse_fields import parse_fields
+from utils.http.etag import make_etag, etag_matches, etag_headers
+
+
+class GroupsUserAsync(GroupsUser):
+    async def get(self, request, user_id: int):
+        """
+        The ASGI version of `GroupsUser.get`: the same query parameters, validation, ETag, listing cache
+        and response, with the database read through the async engine.
+
+        Args:
+            request (AsgiRequest): The request.
+            user_id (int): The ID of the user whose groups are to be retrieved.
+
+        Returns:
+            tuple: The response and HTTP status code (200, 304, 400, 401, 404 or 500), with headers on 200 and 304.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Retrieve 'sort' and 'order' from the query parameters
+            sort = request.args.get("sort")
+            order = request.args.get("order")
+            fields = parse_fields(request.args.get("fields"))
+
+            #check Query Parameters
+            error_query_parameters = self.check_query_parameters(sort, order, fields)
+            if error_query_parameters:
+                return error_query_parameters
+
+            # check if user exist (the groups version is read by primary key)
+            version = await fetch_scalar(user_groups_version_statement(user_id))
+            if version is None:
+                return {"message": f"User with user_id {user_id} does not exist."}, 404
+
+            # check if the client already has this version of the groups
+            etag = make_etag("groups", user_id, f"v{version}")
+            if etag_matches(etag, request.if_none_match):
+                return b"", 304, etag_headers(etag)
+
+            #get groups from the cache or the db
+            async def read_groups():
+                statement, selected_fields = groups_of_user_statement(user_id, sort, order, fields)
+                return [dict(zip(selected_fields, row)) for row in await fetch_all(statement)]
+
+            cache_key = ("groups", user_id, version, sort, order, tuple(fields) if fields else None)
+            groups = await listing_cache.get_or_compute_async(cache_key, read_groups)
+
+            # Return the response with the list of groups
+            return {"message": "All the groups of the user", "groups": groups}, 200, etag_headers(etag)
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
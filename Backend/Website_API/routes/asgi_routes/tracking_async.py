@@ -0,0 +1,71 @@
+from werkzeug.urls import iri_to_uri
+from services.tracking.open_tracking import record_open
+from services.tracking.click_tracking import record_click
+from services.tracking.link_tokens import read_link_token
+from routes.tracking_routes.open_pixel import TRANSPARENT_GIF, PIXEL_HEADERS
+from utils.user_agent.user_agent_classifier import classify_user_agent
+
+
+class OpenPixelAsync:
+    def __init__(self, app):
+        """
+        Args:
+            app (Flask): The Flask app, whose context the event buffer needs.
+        """
+        self.app = app
+
+    async def get(self, request, campaign_id: int, customer_id: int):
+        """
+        The ASGI version of `OpenPixel.get`: classifies the User-Agent, appends the open event to the
+        in-process buffer and returns the cached 1x1 GIF, without any thread or database access.
+
+        Args:
+            request (AsgiRequest): The request.
+            campaign_id (int): The ID of the opened campaign.
+            customer_id (int): The ID of the customer who opened the email.
+
+        Returns:
+            tuple: The GIF, 200 and the no-cache headers.
+        """
+        try:
+            device_code = classify_user_agent(request.headers.get("User-Agent", "")[:512])
+            # The buffer starts its flusher thread with the app of the current context
+            with self.app.app_context():
+                record_open(campaign_id, customer_id, device_code)
+        except Exception as e:
+            print(e)
+        return TRANSPARENT_GIF, 200, {**PIXEL_HEADERS, "Content-Type": "image/gif"}
+
+
+class ClickRedirectAsync:
+    def __init__(self, app):
+        """
+        Args:
+            app (Flask): The Flask app, whose context the event buffer needs.
+        """
+        self.app = app
+
+    async def get(self, request, token: str):
+        """
+        The ASGI version of `ClickRedirect.get`: validates the signed token, appends the click event to the
+        in-process buffer and redirects to the original URL.
+
+        Args:
+            request (AsgiRequest): The request.
+            token (str): The signed token created when the email was rendered.
+
+        Returns:
+            tuple: An empty body, 302 and the Location header, or an error message and 404 if the token is invalid.
+        """
+        link = read_link_token(token)
+        if not link:
+            return {"message": "Link not found."}, 404
+
+        campaign_id, customer_id, link_index, url = link
+        try:
+            device_code = classify_user_agent(request.headers.get("User-Agent", "")[:512])
+            with self.app.app_context():
+                record_click(campaign_id, customer_id, link_index, device_code)
+        except Exception as e:
+            print(e)
+        return b"", 302, {"Location": iri_to_uri(url)}
@@ -5,6 +5,7 @@ from utils.errors.input.error_input_string import create_error_string
 from services.db.groups.db_op_group_by_id import get_group_by_group_id
 from services.db.customers.db_op_customers import add_new_customer, add_new_customers
 from utils.converters.convert_str_to_date import convert_str_to_date
+from utils.email_address.canonical_email import canonical_email
 
 class Customers(Resource):
     def post(self):
@@ -119,16 +120,18 @@ class Customers(Resource):
             return {"message": "At least two customers please!"}, 400
 
         #check every customer
-        emails = []
+        email_keys = set()
         the_group_id = data['customers'][0]["group_id"]
         for customer in data['customers']:
-            if customer['email'] in emails:
-                return {"message": "In this list you have two customers with the same email."}, 400
-            emails.append(customer['email'])
             inputs_error = self.handle_data(customer)
             #check fist_name, last_name, email
             if inputs_error:
                 return {"message": inputs_error}, 400
+            #check duplicate emails (by canonical key, 'Foo@Example.com' and 'foo@example.com' are the same)
+            email_key = canonical_email(customer['email'])
+            if email_key in email_keys:
+                return {"message": "In this list you have two customers with the same email."}, 400
+            email_keys.add(email_key)
             #check group_id
             if not customer["group_id"] or type(customer["group_id"]) is not int or the_group_id != customer["group_id"]:
                 return {"message": "All customers need to be with the same group_id."}, 400
@@ -0,0 +1,141 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.users.db_op_user_by_id import get_user_by_user_id
+from services.segments.segment_compiler import validate_segment
+from services.db.customers.db_op_customers_bulk import (
+    bulk_customers_filter, update_customers_bulk, delete_customers_bulk, BULK_FIELDS, MAX_BULK_CUSTOMER_IDS
+)
+from utils.errors.input.error_input_string import create_error_string
+from utils.converters.convert_str_to_date import convert_str_to_date
+
+
+class CustomersBulk(Resource):
+    def patch(self):
+        """
+        Handles PATCH requests to change the same fields of many customers at once.
+
+        The customers are either listed by ID or selected by a segment, and all of them are updated with
+        one UPDATE statement in one transaction.
+
+        Request Body:
+            - customer_ids (list[int]): The IDs of the customers (1 to MAX_BULK_CUSTOMER_IDS), or
+            - segment (dict): A segment definition (see `POST /api/segments/`).
+            - changes (dict): The new values, any of 'first_name', 'last_name', 'country', 'city' and 'birthday'
+              (validated like the fields of a single customer, 'country', 'city' and 'birthday' can be null).
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+                - 200: The number of customers updated and of their groups.
+                - 400: Invalid target or changes.
+                - 404: The admin of the segment does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Parse JSON data from the body
+            data = request.get_json(silent=True)
+
+            #check target
+            customer_filter = self.handle_target(data)
+            if isinstance(customer_filter, tuple):
+                return customer_filter
+
+            #check changes
+            changes = data.get("changes")
+            if not isinstance(changes, dict) or not changes or any(field not in BULK_FIELDS for field in changes):
+                return {"message": f"Invalid changes. Use an object with some of the fields {BULK_FIELDS}."}, 400
+            inputs_error = create_error_string([{"input_type": field, "input": value} for field, value in changes.items()])
+            if inputs_error:
+                return {"message": inputs_error}, 400
+            if changes.get("birthday") is not None:
+                changes["birthday"] = convert_str_to_date(changes["birthday"])
+
+            # Update the customers in db
+            result = update_customers_bulk(customer_filter, changes)
+            return {"message": "The customers were updated", **result}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def delete(self):
+        """
+        Handles DELETE requests to delete many customers at once.
+
+        The customers are either listed by ID or selected by a segment, and all of them are deleted with
+        one DELETE statement in one transaction.
+
+        Request Body:
+            - customer_ids (list[int]): The IDs of the customers (1 to MAX_BULK_CUSTOMER_IDS), or
+            - segment (dict): A segment definition (see `POST /api/segments/`).
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+                - 200: The number of customers deleted and of their groups.
+                - 400: Invalid target.
+                - 404: The admin of the segment does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Parse JSON data from the body
+            data = request.get_json(silent=True)
+
+            #check target
+            customer_filter = self.handle_target(data)
+            if isinstance(customer_filter, tuple):
+                return customer_filter
+
+            # Delete the customers from db
+            result = delete_customers_bulk(customer_filter)
+            return {"message": "The customers were deleted", **result}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def handle_target(self, data):
+        """
+        Validates the customers targeted by a bulk request and builds their filter.
+
+        Args:
+            data (dict): The JSON payload from the request.
+
+        Returns:
+            The filter clause of the customers, or a tuple with an error message and an HTTP status code.
+        """
+        if not isinstance(data, dict):
+            return {"message": "Invalid data. Data is required!"}, 400
+
+        customer_ids = data.get("customer_ids")
+        segment = data.get("segment")
+        if (customer_ids is None) == (segment is None):
+            return {"message": "Invalid target. Use either customer_ids or segment."}, 400
+
+        if customer_ids is not None:
+            if (not isinstance(customer_ids, list) or not 1 <= len(customer_ids) <= MAX_BULK_CUSTOMER_IDS
+                    or any(type(customer_id) is not int for customer_id in customer_ids)):
+                return {"message": f"Invalid customer_ids. Use a list of 1 to {MAX_BULK_CUSTOMER_IDS} customer ids."}, 400
+            return bulk_customers_filter(customer_ids=customer_ids)
+
+        segment_error = validate_segment(segment)
+        if segment_error:
+            return {"message": segment_error}, 400
+
+        # check if admin exist
+        from models.user_model import User
+        user: User | None = get_user_by_user_id(segment["admin_id"])
+        if not user:
+            return {"message": f"User with user_id {segment['admin_id']} does not exist."}, 404
+        return bulk_customers_filter(segment=segment)
@@ -1,8 +1,12 @@
 from flask_restful import Resource
 from flask import request
 from services.token.token_op import check_token
-from services.db.groups.db_op_group_by_id import get_group_by_group_id
-from services.db.customers.db_op_customers_group import get_customers_of_group_by_group_id_sorted
+from services.db.versions.db_op_versions import get_group_version
+from services.db.customers.db_op_customers_group import get_customers_of_group_by_group_id_sorted, CUSTOMER_FIELDS
+from utils.converters.parse_fields import parse_fields
+from services.cache.listing_cache import listing_cache
+from utils.http.etag import make_etag, is_not_modified, not_modified_response, etag_headers
+from datetime import date
 
 
 class CustomersGroup(Resource):
@@ -14,12 +18,18 @@ class CustomersGroup(Resource):
         Args:
             group_id (int): The ID of the group whose customers are to be retrieved.
 
+        Query Parameters:
+            fields (str, optional): A comma-separated list of the fields of every customer (e.g. 'customer_id,email').
+                        Allowed values: 'customer_id', 'first_name', 'last_name', 'email', 'country', 'city',
+                        'birthday', 'email_status', 'group_id'. Defaults to all of them.
+
         Returns:
             dict: A response containing a list of customers in the specified group, 
                 sorted as requested, and optionally including an 'age' field.
             HTTP Status Code:
-                - 200: Success, the customers are returned.
-                - 400: If the query parameters (`sort`, `order`, `age`) are invalid.
+                - 200: Success, the customers are returned (with an ETag header).
+                - 304: The If-None-Match header matches the ETag, the customers did not change since.
+                - 400: If the query parameters (`sort`, `order`, `age`, `fields`) are invalid.
                 - 404: If the specified group does not exist.
                 - 500: If an unexpected error occurs.
 
@@ -28,8 +38,11 @@ class CustomersGroup(Resource):
 
         Behavior:
             - Verifies the validity of the authorization token using `check_token`.
-            - Validates the `sort`, `order`, and `age` query parameters.
-            - Retrieves customers from the specified group from the database, sorted as per the query.
+            - Validates the `sort`, `order`, `age`, and `fields` query parameters.
+            - Builds the ETag from the version of the group, which is bumped by every change to its customers,
+              and answers a matching If-None-Match with a 304 without reading the customers table.
+            - Retrieves customers from the specified group from the listing cache, or from the database
+              sorted as per the query (the cache key includes the version of the group).
             - Returns a list of customers, optionally including their age.
         """
         try:
@@ -42,32 +55,41 @@ class CustomersGroup(Resource):
             sort = request.args.get("sort")
             order = request.args.get("order")
             age = request.args.get("age")
+            fields = parse_fields(request.args.get("fields"))
             
             #check Query Parameters
-            error_query_parameters = self.check_query_parameters(sort, order, age)
+            error_query_parameters = self.check_query_parameters(sort, order, age, fields)
             if error_query_parameters:
                 return error_query_parameters
             
-            # check if group exist
-            from models.group_model import Group
-            group: Group | None = get_group_by_group_id(group_id)
-            if not group:
+            # check if group exist (the version is read by primary key)
+            version = get_group_version(group_id)
+            if version is None:
                 return {"message": f"Group with group_id {group_id} does not exist."}, 404
             
-            #get groups from db
-            customers = get_customers_of_group_by_group_id_sorted(group_id, sort, order, age)
+            # check if the client already has this version (the ages change every day)
+            today = date.today().isoformat() if age == "include" else None
+            etag = make_etag("customers", group_id, f"v{version}", today)
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            
+            #get customers from the cache or the db
+            cache_key = ("customers", group_id, version, today, sort, order, age, tuple(fields) if fields else None)
+            customers = listing_cache.get_or_compute(
+                cache_key, lambda: get_customers_of_group_by_group_id_sorted(group_id, sort, order, age, fields)
+            )
             
             # Return the response with the list of groups
-            return {"message": "All the customers of the group", "customers": customers}, 200
+            return {"message": "All the customers of the group", "customers": customers}, 200, etag_headers(etag)
         except Exception as e:
             # Return a generic 500 Internal Server Error response
             print(e)
             return {"message": "An unexpected error occurred. Please try again later."}, 500
         
     
-    def check_query_parameters(self, sort: str, order: str, age: str):
+    def check_query_parameters(self, sort: str, order: str, age: str, fields: list = None):
         """
-        Validates the query parameters 'sort', 'order', and 'age' to ensure they are allowed values.
+        Validates the query parameters 'sort', 'order', 'age', and 'fields' to ensure they are allowed values.
 
         Args:
             sort (str): The field by which the records should be sorted.
@@ -76,6 +98,7 @@ class CustomersGroup(Resource):
                         Allowed values: 'high_to_low', 'low_to_high'.
             age (str): Specifies whether to include age in the query.
                         Allowed values: 'include', 'uninclude'.
+            fields (list, optional): The parsed 'fields' parameter, None if it was not sent.
 
         Returns:
             tuple: A dictionary containing the error message and HTTP status code (400) if validation fails.
@@ -85,6 +108,7 @@ class CustomersGroup(Resource):
             - If 'sort' is invalid, returns an error message specifying valid options and HTTP status code 400.
             - If 'order' is invalid, returns an error message specifying valid options and HTTP status code 400.
             - If 'age' is invalid, returns an error message specifying valid options and HTTP status code 400.
+            - If 'fields' is empty or has an unknown field, returns an error message and HTTP status code 400.
             - If all parameters are valid, returns None.
         """
         # Validate 'sort'
@@ -97,4 +121,8 @@ class CustomersGroup(Resource):
        
         # Validate 'age'
         if age not in ["include", "uninclude"]:
-            return {"message": "Invalid age. Use 'include' or 'uninclude'."}, 400
\ No newline at end of file
+            return {"message": "Invalid age. Use 'include' or 'uninclude'."}, 400
+        
+        # Validate 'fields'
+        if fields is not None and (not fields or any(field not in CUSTOMER_FIELDS for field in fields)):
+            return {"message": f"Invalid fields. Use a comma-separated list of {', '.join(CUSTOMER_FIELDS)}."}, 400
@@ -1,9 +1,14 @@
 from .customers import Customers
 from .customers_group import CustomersGroup
 from .customer_by_id import CustomerById 
+from .customers_stats import CustomersGroupStats, CustomersUserStats
+from .customers_bulk import CustomersBulk
 
 
 def init_customers_routes_resources(api):
     api.add_resource(CustomersGroup, "/api/customers/group/<int:group_id>/")
+    api.add_resource(CustomersGroupStats, "/api/customers/group/<int:group_id>/stats/")
+    api.add_resource(CustomersUserStats, "/api/customers/user/<int:user_id>/stats/")
     api.add_resource(Customers, "/api/customers/")
+    api.add_resource(CustomersBulk, "/api/customers/bulk/")
     api.add_resource(CustomerById, "/api/customers/<int:customer_id>")
\ No newline at end of file
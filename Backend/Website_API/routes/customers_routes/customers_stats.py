@@ -0,0 +1,155 @@
+from flask_restful import Resource
+from flask import request
+from datetime import date
+from services.token.token_op import check_token
+from services.db.versions.db_op_versions import get_group_version, get_user_groups_version
+from services.db.customers.db_op_customer_stats import get_customer_stats, get_group_customer_count, get_admin_customer_count, STATS_DIMENSIONS
+from services.cache.listing_cache import listing_cache
+from utils.http.etag import make_etag, is_not_modified, not_modified_response, etag_headers
+
+
+def check_stats_query_parameters(by: str, limit: int):
+    """
+    Validates the query parameters 'by' and 'limit' of the statistics endpoints.
+
+    Args:
+        by (str): The dimension, None for the count only.
+                  Allowed values: 'country', 'city', 'age', 'email_status'.
+        limit (int): The maximum number of values, 1 to 1000.
+
+    Returns:
+        tuple: A dictionary containing the error message and HTTP status code (400) if validation fails.
+            Returns None if the parameters are valid.
+    """
+    # Validate 'by'
+    if by is not None and by not in STATS_DIMENSIONS:
+        return {"message": "Invalid by. Use 'country', 'city', 'age', or 'email_status'."}, 400
+
+    # Validate 'limit'
+    if limit is None or not 1 <= limit <= 1000:
+        return {"message": "Invalid limit. Use a number between 1 and 1000."}, 400
+
+
+class CustomersGroupStats(Resource):
+    def get(self, group_id: int):
+        """
+        Handles the GET request to retrieve the number of customers of a group and, optionally,
+        how many of them have each value of a dimension (a histogram), without fetching the customers.
+
+        Args:
+            group_id (int): The ID of the group.
+
+        Query Parameters:
+            by (str, optional): The dimension of the histogram.
+                        Allowed values: 'country', 'city', 'age' (age buckets), 'email_status'.
+            limit (int, optional): The maximum number of values for 'country' and 'city', the most common first
+                        (1 to 1000, default 100).
+
+        Returns:
+            dict: A response with the number of customers, and the histogram if 'by' was sent.
+            HTTP Status Code:
+                - 200: Success (with an ETag header).
+                - 304: The If-None-Match header matches the ETag, the customers did not change since.
+                - 400: If the query parameters are invalid.
+                - 404: If the group does not exist.
+                - 500: If an unexpected error occurs.
+
+        Behavior:
+            - The count is read from the counter of the group (a primary key lookup).
+            - The histogram is computed with a GROUP BY in the database and cached in the listing cache,
+              keyed by the version of the group.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            by = request.args.get("by")
+            limit = request.args.get("limit", 100, type=int)
+
+            #check Query Parameters
+            error_query_parameters = check_stats_query_parameters(by, limit)
+            if error_query_parameters:
+                return error_query_parameters
+
+            # check if group exist (the version is read by primary key)
+            version = get_group_version(group_id)
+            if version is None:
+                return {"message": f"Group with group_id {group_id} does not exist."}, 404
+
+            # check if the client already has this version (the age buckets change every day)
+            today = date.today().isoformat() if by == "age" else None
+            etag = make_etag("customer-stats", group_id, f"v{version}", by, limit if by else None, today)
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+
+            response = {"message": "The statistics of the customers of the group", "customer_count": get_group_customer_count(group_id)}
+            if by:
+                cache_key = ("customers", group_id, version, today, "stats", by, limit)
+                response["by"] = by
+                response["buckets"] = listing_cache.get_or_compute(
+                    cache_key, lambda: get_customer_stats(by, group_id=group_id, limit=limit)
+                )
+            return response, 200, etag_headers(etag)
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+class CustomersUserStats(Resource):
+    def get(self, user_id: int):
+        """
+        Handles the GET request to retrieve the number of customers in all the groups of a user and, optionally,
+        how many of them have each value of a dimension (a histogram), without fetching the customers.
+
+        Args:
+            user_id (int): The ID of the user (the admin of the groups).
+
+        Query Parameters:
+            by (str, optional): The dimension of the histogram.
+                        Allowed values: 'country', 'city', 'age' (age buckets), 'email_status'.
+            limit (int, optional): The maximum number of values for 'country' and 'city', the most common first
+                        (1 to 1000, default 100).
+
+        Returns:
+            dict: A response with the number of customers, and the histogram if 'by' was sent.
+            HTTP Status Code:
+                - 200: Success.
+                - 400: If the query parameters are invalid.
+                - 404: If the user does not exist.
+                - 500: If an unexpected error occurs.
+
+        Behavior:
+            - The count is the sum of the counters of the user's groups.
+            - The histogram is computed with a GROUP BY over the customers of the user's groups.
+            - A customer counted in several groups is counted once per group.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            by = request.args.get("by")
+            limit = request.args.get("limit", 100, type=int)
+
+            #check Query Parameters
+            error_query_parameters = check_stats_query_parameters(by, limit)
+            if error_query_parameters:
+                return error_query_parameters
+
+            # check if user exist
+            if get_user_groups_version(user_id) is None:
+                return {"message": f"User with user_id {user_id} does not exist."}, 404
+
+            response = {"message": "The statistics of the customers of the user", "customer_count": get_admin_customer_count(user_id)}
+            if by:
+                response["by"] = by
+                response["buckets"] = get_customer_stats(by, group_admin_id=user_id, limit=limit)
+            return response, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
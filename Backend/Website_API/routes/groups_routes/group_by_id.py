@@ -97,8 +97,8 @@ class GroupById(Resource):
         This function performs the following steps:
         1. Checks the authorization token in the request header.
         2. If the token is invalid or not provided, an error response is returned.
-        3. Calls the `delete_group_by_group_id` function to delete the group with the given `group_id`.
-        4. If successful, the group is deleted and an appropriate message is returned.
+        3. Calls the `delete_group_by_group_id` function to queue the deletion of the group with the given `group_id`.
+        4. If successful, the job deleting the group (and its customers, in batches) is returned with a 202 status.
         5. In case of any errors during the process, a generic error response is returned.
 
         Args:
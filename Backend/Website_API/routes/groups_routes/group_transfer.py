@@ -0,0 +1,94 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.groups.db_op_group_by_id import get_group_by_group_id
+from services.db.groups.db_op_group_transfers import TRANSFER_OPERATIONS
+from services.db.customers.db_op_customers_bulk import MAX_BULK_CUSTOMER_IDS
+from services.db.jobs.db_op_jobs import create_job
+
+
+class GroupTransfer(Resource):
+    def post(self, group_id: int):
+        """
+        Handles POST requests to move, copy or merge the customers of a group into another group of the same admin.
+
+        The transfer runs as a background job (see `GET /api/jobs/<job_id>`), in batches of set-based statements,
+        so it works for groups of millions of customers. Customers whose email is already in the target group
+        are skipped; a merge then deletes the source group.
+
+        Request Body:
+            - operation (str): 'move', 'copy' or 'merge'.
+            - target_group_id (int): The group that receives the customers.
+            - customer_ids (list[int], optional): Only transfer these customers ('move' and 'copy').
+
+        Parameters:
+            group_id (int): The ID of the source group.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+                - 202: The job of the transfer.
+                - 400: Invalid operation, target or customer_ids.
+                - 404: The source or target group does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Parse JSON data from the body and check it
+            data = request.get_json(silent=True)
+            inputs_error = self.handle_data(group_id, data)
+            if inputs_error:
+                return {"message": inputs_error}, 400
+
+            # check if the groups exist
+            source = get_group_by_group_id(group_id)
+            target = get_group_by_group_id(data["target_group_id"])
+            for group, checked_group_id in ((source, group_id), (target, data["target_group_id"])):
+                if not group:
+                    return {"message": f"Group with group_id {checked_group_id} does not exist."}, 404
+            if source.group_admin_id != target.group_admin_id:
+                return {"message": "Invalid groups. The source and target groups must belong to the same admin."}, 400
+
+            # Queue the transfer
+            job = create_job("transfer_customers", {
+                "operation": data["operation"],
+                "source_group_id": group_id,
+                "target_group_id": data["target_group_id"],
+                "customer_ids": data.get("customer_ids"),
+            }, owner_id=source.group_admin_id)
+            return {"message": "The transfer is queued", "job": job}, 202
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def handle_data(self, group_id: int, data) -> str:
+        """
+        Validates the body of a transfer request.
+
+        Args:
+            group_id (int): The ID of the source group.
+            data (dict): The JSON payload from the request.
+
+        Returns:
+            str: An error message, or an empty string if the body is valid.
+        """
+        if not isinstance(data, dict):
+            return "Invalid data. Data is required!"
+        if data.get("operation") not in TRANSFER_OPERATIONS:
+            return f"Invalid operation. Use one of {TRANSFER_OPERATIONS}."
+        if type(data.get("target_group_id")) is not int or data["target_group_id"] == group_id:
+            return "Invalid target_group_id. Use the ID of another group."
+
+        customer_ids = data.get("customer_ids")
+        if customer_ids is not None:
+            if data["operation"] == "merge":
+                return "Invalid customer_ids. A merge transfers all the customers of the group."
+            if (not isinstance(customer_ids, list) or not 1 <= len(customer_ids) <= MAX_BULK_CUSTOMER_IDS
+                    or any(type(customer_id) is not int for customer_id in customer_ids)):
+                return f"Invalid customer_ids. Use a list of 1 to {MAX_BULK_CUSTOMER_IDS} customer ids."
+        return ""
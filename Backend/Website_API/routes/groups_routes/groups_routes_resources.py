@@ -1,8 +1,10 @@
 from .groups import Groups
 from.groups_user import GroupsUser
 from .group_by_id import GroupById
+from .group_transfer import GroupTransfer
 
 def init_groups_routes_resources(api):
     api.add_resource(GroupsUser, "/api/groups/user/<int:user_id>/")
     api.add_resource(Groups, "/api/groups/")
-    api.add_resource(GroupById, "/api/groups/<int:group_id>")
\ No newline at end of file
+    api.add_resource(GroupById, "/api/groups/<int:group_id>")
+    api.add_resource(GroupTransfer, "/api/groups/<int:group_id>/transfer/")
\ No newline at end of file
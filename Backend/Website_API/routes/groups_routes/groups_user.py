@@ -1,8 +1,11 @@
 from flask_restful import Resource
 from flask import request
-from services.db.users.db_op_user_by_id import get_user_by_user_id
+from services.db.versions.db_op_versions import get_user_groups_version
 from services.token.token_op import check_token
-from services.db.groups.db_op_groups_user import get_groups_of_user_by_user_id_sorted
+from services.db.groups.db_op_groups_user import get_groups_of_user_by_user_id_sorted, GROUP_FIELDS
+from utils.converters.parse_fields import parse_fields
+from services.cache.listing_cache import listing_cache
+from utils.http.etag import make_etag, is_not_modified, not_modified_response, etag_headers
 
 class GroupsUser(Resource):
     def get(self, user_id: int):
@@ -17,12 +20,16 @@ class GroupsUser(Resource):
                         Allowed values: 'group_name', 'group_description', 'created_at'.
             order (str): The sorting order of the results. 
                         Allowed values: 'high_to_low', 'low_to_high'.
+            fields (str, optional): A comma-separated list of the fields of every group (e.g. 'group_id,group_name').
+                        Allowed values: 'group_id', 'group_admin_id', 'group_name', 'group_description',
+                        'created_at', 'created_at_time'. Defaults to all of them.
 
         Returns:
             dict: A JSON response with a message and a list of groups or an error message.
             HTTP Status Code:
-                - 200: Successfully retrieved and sorted the groups.
-                - 400: Invalid 'sort' or 'order' parameter provided.
+                - 200: Successfully retrieved and sorted the groups (with an ETag header).
+                - 304: The If-None-Match header matches the ETag, the groups did not change since.
+                - 400: Invalid 'sort', 'order' or 'fields' parameter provided.
                 - 404: The user with the given user_id does not exist.
                 - 500: An unexpected error occurred during the request.
         """
@@ -35,46 +42,56 @@ class GroupsUser(Resource):
             # Retrieve 'sort' and 'order' from the query parameters
             sort = request.args.get("sort")
             order = request.args.get("order")
+            fields = parse_fields(request.args.get("fields"))
             
             #check Query Parameters
-            error_query_parameters = self.check_query_parameters(sort, order)
+            error_query_parameters = self.check_query_parameters(sort, order, fields)
             if error_query_parameters:
                 return error_query_parameters
             
-            # check if user exist
-            from models.user_model import User
-            user: User | None = get_user_by_user_id(user_id)
-            if not user:
+            # check if user exist (the groups version is read by primary key)
+            version = get_user_groups_version(user_id)
+            if version is None:
                 return {"message": f"User with user_id {user_id} does not exist."}, 404
             
-            #get groups from db
-            groups = get_groups_of_user_by_user_id_sorted(user_id, sort, order)
+            # check if the client already has this version of the groups
+            etag = make_etag("groups", user_id, f"v{version}")
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            
+            #get groups from the cache or the db (the cache key includes the groups version)
+            cache_key = ("groups", user_id, version, sort, order, tuple(fields) if fields else None)
+            groups = listing_cache.get_or_compute(
+                cache_key, lambda: get_groups_of_user_by_user_id_sorted(user_id, sort, order, fields)
+            )
             
             # Return the response with the list of groups
-            return {"message": "All the groups of the user", "groups": groups}, 200
+            return {"message": "All the groups of the user", "groups": groups}, 200, etag_headers(etag)
         except Exception as e:
             # Return a generic 500 Internal Server Error response
             print(e)
             return {"message": "An unexpected error occurred. Please try again later."}, 500
         
-    def check_query_parameters(self, sort: str, order: str):
+    def check_query_parameters(self, sort: str, order: str, fields: list = None):
         """
-        Validates the query parameters 'sort' and 'order' to ensure they are allowed values.
+        Validates the query parameters 'sort', 'order' and 'fields' to ensure they are allowed values.
 
         Args:
             sort (str): The field by which the groups should be sorted. 
                         Allowed values: 'group_name', 'group_description', 'created_at'.
             order (str): The sorting order of the results.
                         Allowed values: 'high_to_low', 'low_to_high'.
+            fields (list, optional): The parsed 'fields' parameter, None if it was not sent.
 
         Returns:
             tuple: A dictionary containing the error message and the HTTP status code (400) if validation fails.
-                Returns None if both 'sort' and 'order' are valid.
+                Returns None if 'sort', 'order' and 'fields' are valid.
 
         Behavior:
             - If 'sort' is invalid, returns a message specifying valid options and HTTP status code 400.
             - If 'order' is invalid, returns a message specifying valid options and HTTP status code 400.
-            - If both parameters are valid, the function returns None.
+            - If 'fields' is empty or has an unknown field, returns a message and HTTP status code 400.
+            - If all parameters are valid, the function returns None.
         """
         # Validate 'sort'
         if sort not in ["group_name", "group_description", "created_at"]:
@@ -83,3 +100,7 @@ class GroupsUser(Resource):
         # Validate 'order'
         if order not in ["high_to_low", "low_to_high"]:
             return {"message": "Invalid order. Use 'high_to_low' or 'low_to_high'."}, 400
+        
+        # Validate 'fields'
+        if fields is not None and (not fields or any(field not in GROUP_FIELDS for field in fields)):
+            return {"message": f"Invalid fields. Use a comma-separated list of {', '.join(GROUP_FIELDS)}."}, 400
@@ -0,0 +1,70 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.jobs.db_op_jobs import get_job_by_job_id, cancel_job_by_job_id
+
+
+class JobById(Resource):
+    def get(self, job_id: int):
+        """
+        Handles a GET request to retrieve the status and progress of a background job.
+
+        Parameters:
+            job_id (int): The unique identifier of the job.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+                - 200: The job, with its status ('queued', 'running', 'succeeded', 'failed' or 'cancelled'),
+                  its progress (`done` of `total`) and, once finished, its result or error.
+                - 404: The job does not exist.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            #get job from db
+            from models.job_model import Job
+            job: Job | None = get_job_by_job_id(job_id)
+            if not job:
+                return {"message": f"Job with job_id {job_id} does not exist."}, 404
+
+            return {"message": "The job", "job": job.to_dict()}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def delete(self, job_id: int):
+        """
+        Handles a DELETE request to cancel a background job.
+
+        A queued job is cancelled at once; a running job stops after its current chunk (the chunks already
+        done are kept), so its status becomes 'cancelled' shortly after.
+
+        Parameters:
+            job_id (int): The unique identifier of the job.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+                - 200: The job, cancelled or with `cancel_requested` set.
+                - 404: The job does not exist.
+                - 409: The job is already finished.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            job = cancel_job_by_job_id(job_id)
+            if isinstance(job, tuple) and "message" in job[0]:
+                return job
+
+            return {"message": "The job is cancelled" if job["status"] == "cancelled" else "The job is being cancelled", "job": job}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
@@ -0,0 +1,5 @@
+from .job_by_id import JobById
+
+
+def init_jobs_routes_resources(api):
+    api.add_resource(JobById, "/api/jobs/<int:job_id>")
@@ -0,0 +1,35 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.cache.listing_cache import listing_cache
+from utils.http.compression import compressed_bodies
+
+
+class CacheMetrics(Resource):
+    def get(self):
+        """
+        Handles GET requests to retrieve the metrics of the in-process caches of the worker that serves the request.
+
+        Returns:
+            dict: A JSON response with a message and the metrics of every cache:
+                - listings: the sorted customers / groups listings (`services/cache/listing_cache.py`).
+                - compressed_bodies: the compressed response bodies (`utils/http/compression.py`).
+            HTTP Status Code:
+                - 200: Success.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            return {
+                "message": "The metrics of the caches",
+                "listings": listing_cache.stats(),
+                "compressed_bodies": compressed_bodies.stats(),
+            }, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
@@ -0,0 +1,7 @@
+from .cache_metrics import CacheMetrics
+from .tracking_metrics import TrackingMetrics
+
+
+def init_metrics_routes_resources(api):
+    api.add_resource(CacheMetrics, "/api/metrics/cache/")
+    api.add_resource(TrackingMetrics, "/api/metrics/tracking/")
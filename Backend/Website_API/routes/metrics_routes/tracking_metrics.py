@@ -0,0 +1,35 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.tracking.open_tracking import open_events_buffer
+from services.tracking.click_tracking import click_events_buffer
+
+
+class TrackingMetrics(Resource):
+    def get(self):
+        """
+        Handles GET requests to retrieve the counters of the tracking event buffers of the worker that serves the request.
+
+        Returns:
+            dict: A JSON response with a message and the counters (`buffered`, `flushed`, `dropped`) of every buffer:
+                - opens: the open events (`services/tracking/open_tracking.py`).
+                - clicks: the click events (`services/tracking/click_tracking.py`).
+            HTTP Status Code:
+                - 200: Success.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            return {
+                "message": "The counters of the tracking buffers",
+                "opens": open_events_buffer.stats(),
+                "clicks": click_events_buffer.stats(),
+            }, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
@@ -0,0 +1,72 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.segments.db_op_snapshots import get_snapshot_by_snapshot_id, load_snapshot_customer_ids, delete_snapshot_by_snapshot_id
+
+
+class SegmentSnapshotById(Resource):
+    def get(self, snapshot_id: int):
+        """
+        Handles a GET request to retrieve a snapshot and a page of its customer ids.
+
+        Query Parameters:
+            after (int, optional): Only ids greater than this customer_id are returned. Defaults to 0.
+            limit (int, optional): The number of ids to return, 0 to 10000 (default 1000).
+
+        Parameters:
+            snapshot_id (int): The ID of the snapshot.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            after = request.args.get("after", 0, type=int)
+            limit = request.args.get("limit", 1000, type=int)
+            if after < 0 or not 0 <= limit <= 10000:
+                return {"message": "Invalid pagination. Use after >= 0 and limit between 0 and 10000."}, 400
+
+            #get snapshot from db
+            snapshot = get_snapshot_by_snapshot_id(snapshot_id)
+            if not snapshot:
+                return {"message": "Snapshot not found for the given snapshot_id."}, 404
+
+            customer_ids = load_snapshot_customer_ids(snapshot)
+            start = customer_ids.after(after)
+            page = customer_ids.slice(start, start + limit)
+            next_after = page[-1] if page and start + limit < len(customer_ids) else None
+
+            # Return the response with the snapshot
+            return {"message": "The snapshot", "snapshot": snapshot.to_dict(), "customer_ids": page, "next_after": next_after}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def delete(self, snapshot_id: int):
+        """
+        Handles the HTTP DELETE request to delete a snapshot by its `snapshot_id`.
+
+        Args:
+            snapshot_id (int): The ID of the snapshot to be deleted.
+
+        Returns:
+            tuple: A response dictionary with a message and an HTTP status code.
+        """
+        try:
+            # Step 1: Check token for authorization
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Step 2: Call the delete function to remove the snapshot from the database
+            return delete_snapshot_by_snapshot_id(snapshot_id)
+        except Exception as e:
+            # Step 3: Handle any exceptions by logging and returning a generic error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
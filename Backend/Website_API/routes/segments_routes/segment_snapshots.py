@@ -0,0 +1,114 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.users.db_op_user_by_id import get_user_by_user_id
+from services.segments.segment_compiler import validate_segment
+from services.db.segments.db_op_snapshots import create_segment_snapshot, combine_snapshots, get_snapshot_by_snapshot_id
+from services.db.segments.db_op_unique_recipients import create_unique_recipients_snapshot
+
+
+class SegmentSnapshots(Resource):
+    def post(self):
+        """
+        Handles POST requests to create a segment snapshot.
+
+        A snapshot freezes the customer ids of a segment, so a campaign that is sent (and retried) in chunks
+        always targets exactly the same customers, without evaluating the segment again.
+
+        Query Parameters:
+            action (str): Specifies the operation:
+                - 'materialize': Evaluates the segment in the request body and stores its customer ids.
+                - 'unique': Like 'materialize', but stores one customer per canonical email, so a person who is
+                            a customer of several groups receives one copy of the campaign.
+                - 'combine': Combines two snapshots of the same admin in memory.
+
+        Request Body:
+            - For 'materialize' and 'unique': A segment definition (see the segments API).
+            - For 'combine':
+                - left_snapshot_id (int): The first snapshot.
+                - right_snapshot_id (int): The second snapshot.
+                - operation (str): 'union', 'intersect', or 'exclude' (left minus right).
+
+        Returns:
+            dict: A JSON response with a message and the new snapshot.
+            HTTP Status Code:
+                - 201: The snapshot was created.
+                - 400: Invalid action or request body.
+                - 404: The admin or one of the snapshots does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Retrieve 'action' from the query parameters
+            action = request.args.get("action")
+
+            # Parse JSON data from the body
+            data = request.get_json()
+
+            if action in ["materialize", "unique"]:
+                return self.handle_materialize(data, unique=action == "unique")
+            elif action == "combine":
+                return self.handle_combine(data)
+            else:
+                return {"message": "Invalid action. Use 'materialize', 'unique' or 'combine'."}, 400
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def handle_materialize(self, segment: dict, unique: bool = False):
+        """
+        Materializes a segment into a new snapshot.
+
+        Args:
+            segment (dict): The segment definition from the request body.
+            unique (bool, optional): Keep one customer per canonical email. Defaults to False.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+        """
+        segment_error = validate_segment(segment)
+        if segment_error:
+            return {"message": segment_error}, 400
+
+        # check if admin exist
+        from models.user_model import User
+        user: User | None = get_user_by_user_id(segment["admin_id"])
+        if not user:
+            return {"message": f"User with user_id {segment['admin_id']} does not exist."}, 404
+
+        snapshot = create_unique_recipients_snapshot(segment) if unique else create_segment_snapshot(segment)
+        return {"message": "Snapshot created", "snapshot": snapshot}, 201
+
+
+    def handle_combine(self, data: dict):
+        """
+        Combines two snapshots into a new snapshot.
+
+        Args:
+            data (dict): The request body with 'left_snapshot_id', 'right_snapshot_id' and 'operation'.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+        """
+        # validate data
+        if not data or type(data.get("left_snapshot_id")) is not int or type(data.get("right_snapshot_id")) is not int:
+            return {"message": "Invalid data. left_snapshot_id and right_snapshot_id are required!"}, 400
+        if data.get("operation") not in ["union", "intersect", "exclude"]:
+            return {"message": "Invalid operation. Use 'union', 'intersect', or 'exclude'."}, 400
+
+        # check if snapshots exist
+        left = get_snapshot_by_snapshot_id(data["left_snapshot_id"])
+        right = get_snapshot_by_snapshot_id(data["right_snapshot_id"])
+        if not left or not right:
+            return {"message": "Snapshot not found for the given snapshot_id."}, 404
+        if left.admin_id != right.admin_id:
+            return {"message": "Only snapshots of the same admin can be combined."}, 400
+
+        snapshot = combine_snapshots(left, right, data["operation"])
+        return {"message": "Snapshot created", "snapshot": snapshot}, 201
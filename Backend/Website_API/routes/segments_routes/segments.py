@@ -0,0 +1,102 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.users.db_op_user_by_id import get_user_by_user_id
+from services.segments.segment_compiler import validate_segment
+from services.db.segments.db_op_segments import count_segment_customers, estimate_segment_size, get_segment_customers
+from services.db.segments.db_op_unique_recipients import count_unique_recipients
+
+
+class Segments(Resource):
+    def post(self):
+        """
+        Handles POST requests to evaluate a segment of customers.
+
+        The segment is sent in the request body and compiled to a single indexed SQL query.
+        The 'action' query parameter determines what is returned:
+        - 'count': The exact number of customers in the segment (no rows are fetched).
+        - 'count_unique': The exact number of unique recipients (canonical emails) in the segment, a customer
+                          of several groups counts once.
+        - 'estimate': The estimated number of customers, from the query planner (cached per segment).
+        - 'list': A page of the customers of the segment, ordered by customer_id.
+
+        Query Parameters:
+            action (str): 'count', 'count_unique', 'estimate', or 'list'.
+            after (int, optional): For 'list', only customers with a greater customer_id are returned.
+            limit (int, optional): For 'list', the size of the page (1 to 1000, default 100).
+
+        Request Body:
+            A segment definition, for example:
+                {
+                    "admin_id": 1,
+                    "group_ids": [3, 4],
+                    "conditions": [
+                        {"field": "country", "op": "in", "value": ["Israel", "France"]},
+                        {"field": "city", "op": "prefix", "value": "Tel"},
+                        {"field": "age", "op": "between", "value": [18, 30]}
+                    ]
+                }
+
+        Returns:
+            dict: A JSON response with a message and the count, the estimate or the customers.
+            HTTP Status Code:
+                - 200: Success.
+                - 400: Invalid action, pagination parameters or segment.
+                - 404: The admin of the segment does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Retrieve 'action' from the query parameters
+            action = request.args.get("action")
+            if action not in ["count", "count_unique", "estimate", "list"]:
+                return {"message": "Invalid action. Use 'count', 'count_unique', 'estimate', or 'list'."}, 400
+
+            # Parse JSON data from the body and check it
+            segment = request.get_json()
+            segment_error = validate_segment(segment)
+            if segment_error:
+                return {"message": segment_error}, 400
+
+            # check if admin exist
+            from models.user_model import User
+            user: User | None = get_user_by_user_id(segment["admin_id"])
+            if not user:
+                return {"message": f"User with user_id {segment['admin_id']} does not exist."}, 404
+
+            if action == "count":
+                return {"message": "The amount of customers in the segment", "amount": count_segment_customers(segment)}, 200
+            elif action == "count_unique":
+                return {"message": "The amount of unique recipients in the segment", "amount": count_unique_recipients(segment)}, 200
+            elif action == "estimate":
+                return {"message": "The estimated amount of customers in the segment", "estimate": estimate_segment_size(segment)}, 200
+            else:
+                return self.handle_list(segment)
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def handle_list(self, segment: dict):
+        """
+        Returns a page of the customers of a segment.
+
+        Args:
+            segment (dict): A valid segment definition.
+
+        Returns:
+            tuple: A JSON response (dict) and an HTTP status code (int).
+        """
+        after = request.args.get("after", 0, type=int)
+        limit = request.args.get("limit", 100, type=int)
+        if after < 0 or not 1 <= limit <= 1000:
+            return {"message": "Invalid pagination. Use after >= 0 and limit between 1 and 1000."}, 400
+
+        customers = get_segment_customers(segment, after, limit)
+        next_after = customers[-1]["customer_id"] if len(customers) == limit else None
+        return {"message": "The customers of the segment", "customers": customers, "next_after": next_after}, 200
@@ -0,0 +1,9 @@
+from .segments import Segments
+from .segment_snapshots import SegmentSnapshots
+from .segment_snapshot_by_id import SegmentSnapshotById
+
+
+def init_segments_routes_resources(api):
+    api.add_resource(Segments, "/api/segments/")
+    api.add_resource(SegmentSnapshots, "/api/segments/snapshots/")
+    api.add_resource(SegmentSnapshotById, "/api/segments/snapshots/<int:snapshot_id>")
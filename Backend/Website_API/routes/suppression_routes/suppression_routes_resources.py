@@ -0,0 +1,5 @@
+from .suppressions_user import SuppressionsUser
+
+
+def init_suppression_routes_resources(api):
+    api.add_resource(SuppressionsUser, "/api/suppressions/user/<int:user_id>/")
@@ -0,0 +1,146 @@
+from flask_restful import Resource
+from flask import request
+from services.token.token_op import check_token
+from services.db.users.db_op_user_by_id import get_user_by_user_id
+from utils.errors.input.input_validation import validate_input
+from services.db.suppression.db_op_suppressions import add_suppressions, add_suppressions_by_customer_ids, get_suppressions_after, get_amount_of_suppressions
+
+
+class SuppressionsUser(Resource):
+    def get(self, user_id: int):
+        """
+        Handles GET requests to retrieve the suppressions that apply to a user (their own and the global ones).
+
+        Query Parameters:
+            action (str): 'list' for a page of suppressions, 'amount' for their number.
+            after (int, optional): For 'list', only suppressions with a greater suppression_id are returned.
+            limit (int, optional): For 'list', the size of the page (1 to 1000, default 100).
+
+        Args:
+            user_id (int): The ID of the user (the admin of the groups).
+
+        Returns:
+            dict: A JSON response with a message and the suppressions or their amount.
+            HTTP Status Code:
+                - 200: Success.
+                - 400: Invalid query parameters.
+                - 404: The user does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            action = request.args.get("action")
+            if action not in ["list", "amount"]:
+                return {"message": "Invalid action. Use 'list' or 'amount'."}, 400
+
+            # check if user exist
+            from models.user_model import User
+            user: User | None = get_user_by_user_id(user_id)
+            if not user:
+                return {"message": f"User with user_id {user_id} does not exist."}, 404
+
+            if action == "amount":
+                return {"message": "Retrieve amount of suppressions", "amount": get_amount_of_suppressions(user_id)}, 200
+
+            after = request.args.get("after", 0, type=int)
+            limit = request.args.get("limit", 100, type=int)
+            if after < 0 or not 1 <= limit <= 1000:
+                return {"message": "Invalid pagination. Use after >= 0 and limit between 1 and 1000."}, 400
+
+            rows = get_suppressions_after(user_id, after, limit)
+            suppressions = [
+                {"suppression_id": row.suppression_id, "group_admin_id": row.group_admin_id, "customer_id": row.customer_id,
+                 "email": row.email, "reason": row.reason}
+                for row in rows
+            ]
+            next_after = suppressions[-1]["suppression_id"] if len(suppressions) == limit else None
+            return {"message": "The suppressions of the user", "suppressions": suppressions, "next_after": next_after}, 200
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def post(self, user_id: int):
+        """
+        Handles POST requests to suppress customers or email addresses for a user.
+
+        Request Body:
+            - reason (str): 'unsubscribe', 'bounce', 'complaint', or 'manual'.
+            - customer_ids (list[int], optional): Customers of the user to suppress.
+            - emails (list[str], optional): Email addresses to suppress.
+            At least one of `customer_ids` and `emails` is required, with at most 10000 items each.
+
+        Args:
+            user_id (int): The ID of the user (the admin of the groups).
+
+        Returns:
+            dict: A JSON response with a message and the number of added suppressions.
+            HTTP Status Code:
+                - 201: The suppressions were added.
+                - 400: Invalid request body.
+                - 404: The user does not exist.
+                - 500: An unexpected error occurred.
+        """
+        try:
+            #check token
+            token_check = check_token(request.headers.get("Authorization"))
+            if token_check:
+                return token_check
+
+            # Parse JSON data from the body
+            data = request.get_json()
+
+            #check data
+            data_error = self.check_data(data)
+            if data_error:
+                return {"message": data_error}, 400
+
+            # check if user exist
+            from models.user_model import User
+            user: User | None = get_user_by_user_id(user_id)
+            if not user:
+                return {"message": f"User with user_id {user_id} does not exist."}, 404
+
+            amount = 0
+            if data.get("customer_ids"):
+                amount += add_suppressions_by_customer_ids(user_id, data["customer_ids"], data["reason"])
+            if data.get("emails"):
+                amount += add_suppressions(user_id, [(email, None) for email in set(data["emails"])], data["reason"])
+
+            return {"message": "Suppressions added", "amount": amount}, 201
+        except Exception as e:
+            # Return a generic 500 Internal Server Error response
+            print(e)
+            return {"message": "An unexpected error occurred. Please try again later."}, 500
+
+
+    def check_data(self, data) -> str:
+        """
+        Validates the request body of a POST request.
+
+        Args:
+            data (dict): The JSON payload from the request.
+
+        Returns:
+            str | None: An error message string if validation fails, otherwise None.
+        """
+        if not data:
+            return "Invalid data. Data is required!"
+        if data.get("reason") not in ["unsubscribe", "bounce", "complaint", "manual"]:
+            return "Invalid reason. Use 'unsubscribe', 'bounce', 'complaint', or 'manual'."
+
+        customer_ids = data.get("customer_ids") or []
+        emails = data.get("emails") or []
+        if not isinstance(customer_ids, list) or not isinstance(emails, list) or not (customer_ids or emails):
+            return "Invalid data. customer_ids or emails is required!"
+        if len(customer_ids) > 10000 or len(emails) > 10000:
+            return "Too many items. Send at most 10000 customer_ids and 10000 emails per request."
+        if any(type(customer_id) is not int for customer_id in customer_ids):
+            return "Invalid customer_ids. Use a list of integers."
+        if not all(validate_input(email, "email") for email in emails):
+            return "Invalid emails. Use a list of valid email addresses."
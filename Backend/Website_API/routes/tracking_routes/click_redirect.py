@@ -0,0 +1,38 @@
+from flask_restful import Resource
+from flask import redirect, request
+from services.tracking.link_tokens import read_link_token
+from services.tracking.click_tracking import record_click
+from utils.user_agent.user_agent_classifier import classify_user_agent
+
+
+class ClickRedirect(Resource):
+    def get(self, token: str):
+        """
+        Handles a GET request for a tracked link of a campaign email.
+
+        Workflow:
+        1. Validates the HMAC signature of the token and decodes the campaign, customer, link index and URL.
+        2. Classifies the User-Agent of the browser (memoized, almost always a cache hit).
+        3. Appends the click event to the in-process buffer (no database access).
+        4. Redirects the customer to the original URL.
+
+        No token is required in the headers, the request comes from the browser of the customer.
+
+        Parameters:
+            token (str): The signed token created when the email was rendered.
+
+        Returns:
+            Response: A 302 redirect to the original URL.
+            tuple: An error message and HTTP status code 404 if the token is invalid.
+        """
+        link = read_link_token(token)
+        if not link:
+            return {"message": "Link not found."}, 404
+
+        campaign_id, customer_id, link_index, url = link
+        try:
+            device_code = classify_user_agent(request.headers.get("User-Agent", "")[:512])
+            record_click(campaign_id, customer_id, link_index, device_code)
+        except Exception as e:
+            print(e)
+        return redirect(url, code=302)
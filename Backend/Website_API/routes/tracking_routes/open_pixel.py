@@ -0,0 +1,45 @@
+from flask_restful import Resource
+from flask import Response, request
+from services.tracking.open_tracking import record_open
+from utils.user_agent.user_agent_classifier import classify_user_agent
+
+# Transparent 1x1 GIF, built once and served from memory on every hit
+TRANSPARENT_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+# Email clients and proxies must not cache the pixel, otherwise repeated opens are not reported
+PIXEL_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0"
+}
+
+
+class OpenPixel(Resource):
+    def get(self, campaign_id: int, customer_id: int):
+        """
+        Handles a GET request for the open-tracking pixel embedded in campaign emails.
+
+        Workflow:
+        1. Classifies the User-Agent of the email client (memoized, almost always a cache hit).
+        2. Appends the open event to the in-process buffer (no database access).
+        3. Returns the cached 1x1 GIF immediately.
+
+        No token is required, the request comes from the email client of the customer.
+        The pixel is returned even if recording the event fails, so the email always renders.
+
+        Parameters:
+            campaign_id (int): The ID of the opened campaign.
+            customer_id (int): The ID of the customer who opened the email.
+
+        Returns:
+            Response: The 1x1 GIF image with no-cache headers.
+        """
+        try:
+            device_code = classify_user_agent(request.headers.get("User-Agent", "")[:512])
+            record_open(campaign_id, customer_id, device_code)
+        except Exception as e:
+            print(e)
+        return Response(TRANSPARENT_GIF, mimetype="image/gif", headers=PIXEL_HEADERS)
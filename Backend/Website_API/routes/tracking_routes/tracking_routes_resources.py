@@ -0,0 +1,7 @@
+from .open_pixel import OpenPixel
+from .click_redirect import ClickRedirect
+
+
+def init_tracking_routes_resources(api):
+    api.add_resource(OpenPixel, "/api/tracking/open/<int:campaign_id>/<int:customer_id>")
+    api.add_resource(ClickRedirect, "/api/tracking/click/<string:token>")
@@ -1,6 +1,6 @@
 from flask_restful import Resource
 from flask import request
-from services.db.users.db_op_all_users import get_all_users, get_amount_of_users
+from services.db.users.db_op_all_users import get_users_after, get_amount_of_users
 
 class AllUsers(Resource):
     def get(self):
@@ -8,18 +8,23 @@ class AllUsers(Resource):
         Retrieves either a list of all users or the total count of users based on the 'action' query parameter.
 
         Supported actions:
-        - 'list': Returns a list of all users and their details.
+        - 'list': Returns a page of users and their details.
         - 'amount': Returns the total number of users.
 
         Query Parameters:
         - action (str): Specifies the action to be performed ('list' or 'amount').
+        - after (int, optional): For 'list', only users with a greater user_id are returned (default 0).
+        - limit (int, optional): For 'list', the size of the page (1 to 1000, default 100).
+        - email (str, optional): For 'list', only users whose email starts with this prefix (case-insensitive).
+        - estimate (str, optional): For 'amount', 'true' accepts an approximate count of a large table.
 
         Returns:
         - 200 OK: 
-            - If 'list', returns a list of all users.
-            - If 'amount', returns the total number of users.
+            - If 'list', returns a page of users and the `next_after` of the next page (None on the last page).
+            - If 'amount', returns the total number of users and whether it is an estimate.
         - 400 Bad Request: 
             - If the 'action' query parameter is missing, invalid, or contains a value other than 'list' or 'amount'.
+            - If the pagination or the estimate parameter is invalid.
         - 500 Internal Server Error: 
             - If an unexpected error occurs during processing.
 
@@ -48,15 +53,26 @@ class AllUsers(Resource):
 
     def handle_list(self):
         """
-        Retrieve a list of all users.
+        Retrieve a page of users.
         
-        This function handles the retrieval of all users and returns a JSON response 
-        with a list of users.
+        This function handles the retrieval of a page of users (keyset pagination on user_id, optionally
+        filtered by an email prefix) and returns a JSON response with the users.
         
         Returns:
-            dict: A JSON response containing the message and the list of users.
+            dict: A JSON response containing the message, the list of users and the `next_after` cursor.
+            tuple: An error message and HTTP status code (400) if the pagination is invalid.
         """
-        return {"message": "Retrieve all users", "users": get_all_users()}, 200
+        after = request.args.get("after", 0, type=int)
+        limit = request.args.get("limit", 100, type=int)
+        email_prefix = request.args.get("email")
+        if after is None or limit is None or after < 0 or not 1 <= limit <= 1000:
+            return {"message": "Invalid pagination. Use after >= 0 and limit between 1 and 1000."}, 400
+        if email_prefix is not None and not 1 <= len(email_prefix) <= 120:
+            return {"message": "Invalid email. Use a prefix of 1 to 120 characters."}, 400
+
+        users = get_users_after(after, limit, email_prefix)
+        next_after = users[-1]["user_id"] if len(users) == limit else None
+        return {"message": "Retrieve all users", "users": users, "next_after": next_after}, 200
     
 
     def handle_amount(self):
@@ -67,6 +83,12 @@ class AllUsers(Resource):
         JSON response with the count of users.
         
         Returns:
-            dict: A JSON response containing the message and the amount of users.
+            dict: A JSON response containing the message, the amount of users and whether it is an estimate.
+            tuple: An error message and HTTP status code (400) if the estimate parameter is invalid.
         """    
-        return {"message": "Retrieve amount of users", "amount": get_amount_of_users()}, 200
+        estimate = request.args.get("estimate", "false")
+        if estimate not in ["true", "false"]:
+            return {"message": "Invalid estimate. Use 'true' or 'false'."}, 400
+
+        amount, estimated = get_amount_of_users(estimate == "true")
+        return {"message": "Retrieve amount of users", "amount": amount, "estimated": estimated}, 200
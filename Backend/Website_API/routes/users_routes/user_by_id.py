@@ -48,8 +48,8 @@ class UserById(Resource):
 
         This method:
         1. Validates the authorization token provided in the request headers.
-        2. If the token is valid, it proceeds to delete the user from the database using the user_id.
-        3. Returns a success message if the deletion is successful.
+        2. If the token is valid, it queues the deletion of the user (with their groups and customers) using the user_id.
+        3. Returns the job deleting the user with a 202 status.
         4. Returns an error message if the token is invalid or if an unexpected error occurs during the process.
         """
         try:
@@ -58,7 +58,7 @@ class UserById(Resource):
             if token_check:
                 return token_check
 
-            # This function will delete the user based on the provided user_id, and return the appropriate success or error message
+            # This function will queue the deletion of the user based on the provided user_id, and return the job or the error message
             return delete_user_by_user_id(user_id)
 
         except Exception as e:
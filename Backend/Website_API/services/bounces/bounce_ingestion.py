@@ -0,0 +1,109 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from time import perf_counter
+from services.bounces.mailbox_reader import iter_raw_messages
+from services.bounces.report_parser import parse_report
+
+# Number of messages parsed and applied to the database together
+DEFAULT_BATCH_SIZE = 1000
+
+
+def parse_message(raw: bytes):
+    """
+    Parses one raw message in a worker, turning a malformed message into False instead of failing the whole batch.
+
+    Args:
+        raw (bytes): The raw message.
+
+    Returns:
+        dict | None | bool: The parsed report, None if the message is not a report, False if it could not be parsed.
+    """
+    try:
+        return parse_report(raw)
+    except Exception:
+        return False
+
+
+def ingest_bounce_reports(path: str, mailbox_format: str = None, workers: int = 4,
+                          batch_size: int = DEFAULT_BATCH_SIZE, apply_function=None) -> dict:
+    """
+    Reads DSN and ARF messages from a local maildir or mbox, parses them with a pool of worker processes,
+    and applies the hard bounces and complaints to the database in batches.
+
+    Messages are streamed from the mailbox `batch_size` at a time, so memory stays flat whatever the size
+    of the mailbox. Soft bounces (4.x.x or 'delayed') are counted but not applied.
+
+    Args:
+        path (str): The maildir directory or the mbox file.
+        mailbox_format (str, optional): 'maildir' or 'mbox'. Detected from the path when not provided.
+        workers (int, optional): The number of parsing processes, 1 or less parses in this process. Defaults to 4.
+        batch_size (int, optional): The number of messages per batch. Defaults to 1000.
+        apply_function (callable, optional): Called with `{'bounce': set, 'complaint': set}` for every batch and
+                                             returning `{'suppressed', 'customers_updated'}`.
+                                             Defaults to `apply_bounce_reports`; pass a stub to run without a database.
+
+    Returns:
+        dict: The ingestion statistics:
+            - 'messages', 'hard_bounces', 'soft_bounces', 'complaints', 'ignored', 'errors' (int): Message / recipient counts.
+            - 'suppressed', 'customers_updated' (int): The database changes.
+            - 'seconds' (float), 'messages_per_second' (float): The throughput.
+
+    Raises:
+        ValueError: If the mailbox format is invalid or the path is not a mailbox.
+    """
+    if apply_function is None:
+        from services.db.bounces.db_op_bounces import apply_bounce_reports
+        apply_function = apply_bounce_reports
+
+    stats = {
+        "messages": 0, "hard_bounces": 0, "soft_bounces": 0, "complaints": 0, "ignored": 0, "errors": 0,
+        "suppressed": 0, "customers_updated": 0,
+    }
+    messages = iter_raw_messages(path, mailbox_format)
+    started = perf_counter()
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            batch = list(islice(messages, batch_size))
+            if not batch:
+                break
+            stats["messages"] += len(batch)
+
+            # Step 1: Parse the batch, in the pool when there is one
+            if pool:
+                chunksize = max(1, len(batch) // (workers * 4))
+                reports = pool.map(parse_message, batch, chunksize=chunksize)
+            else:
+                reports = map(parse_message, batch)
+
+            # Step 2: Collect the addresses to apply
+            emails_by_kind = {"bounce": set(), "complaint": set()}
+            for report in reports:
+                if report is False:
+                    stats["errors"] += 1
+                elif report is None:
+                    stats["ignored"] += 1
+                elif report["kind"] == "complaint":
+                    stats["complaints"] += 1
+                    emails_by_kind["complaint"].update(recipient["email"] for recipient in report["recipients"])
+                else:
+                    for recipient in report["recipients"]:
+                        if recipient["permanent"]:
+                            stats["hard_bounces"] += 1
+                            emails_by_kind["bounce"].add(recipient["email"])
+                        else:
+                            stats["soft_bounces"] += 1
+
+            # Step 3: Apply the batch
+            if emails_by_kind["bounce"] or emails_by_kind["complaint"]:
+                applied = apply_function(emails_by_kind)
+                stats["suppressed"] += applied["suppressed"]
+                stats["customers_updated"] += applied["customers_updated"]
+    finally:
+        if pool:
+            pool.shutdown()
+
+    stats["seconds"] = round(perf_counter() - started, 3)
+    stats["messages_per_second"] = round(stats["messages"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+    return stats
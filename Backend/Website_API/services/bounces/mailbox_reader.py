@@ -0,0 +1,103 @@
+import os
+
+# Formats accepted by `iter_raw_messages`
+MAILBOX_FORMATS = ["maildir", "mbox"]
+
+
+def detect_mailbox_format(path: str) -> str:
+    """
+    Detects the format of a local mailbox.
+
+    Args:
+        path (str): A maildir directory (with `cur` and/or `new` sub-directories) or an mbox file.
+
+    Returns:
+        str: 'maildir' or 'mbox'.
+
+    Raises:
+        ValueError: If the path is neither a maildir nor a file.
+    """
+    if os.path.isdir(path):
+        if os.path.isdir(os.path.join(path, "cur")) or os.path.isdir(os.path.join(path, "new")):
+            return "maildir"
+        raise ValueError(f"Invalid maildir: '{path}' has no 'cur' or 'new' directory.")
+    if os.path.isfile(path):
+        return "mbox"
+    raise ValueError(f"Invalid mailbox: '{path}' does not exist.")
+
+
+def iter_maildir_messages(path: str):
+    """
+    Yields the raw messages of a maildir, one file at a time.
+
+    Args:
+        path (str): The maildir directory.
+
+    Yields:
+        bytes: The raw message.
+    """
+    for sub_directory in ("new", "cur"):
+        directory = os.path.join(path, sub_directory)
+        if not os.path.isdir(directory):
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    with open(entry.path, "rb") as message_file:
+                        yield message_file.read()
+
+
+def iter_mbox_messages(path: str):
+    """
+    Yields the raw messages of an mbox file while reading it line by line.
+
+    Unlike `mailbox.mbox`, which indexes the whole file before returning the first message,
+    only one message is held in memory at a time.
+
+    Args:
+        path (str): The mbox file.
+
+    Yields:
+        bytes: The raw message, without its 'From ' separator line and with '>From ' lines unescaped.
+    """
+    lines = []
+    previous_blank = True
+    with open(path, "rb") as mbox_file:
+        for line in mbox_file:
+            if line.startswith(b"From ") and previous_blank:
+                if lines:
+                    yield b"".join(lines)
+                lines = []
+                previous_blank = False
+                continue
+            if line.startswith(b">From "):
+                line = line[1:]
+            lines.append(line)
+            previous_blank = line in (b"\n", b"\r\n")
+    if lines:
+        yield b"".join(lines)
+
+
+def iter_raw_messages(path: str, mailbox_format: str = None):
+    """
+    Streams the raw messages of a local maildir or mbox.
+
+    Args:
+        path (str): The maildir directory or the mbox file.
+        mailbox_format (str, optional): 'maildir' or 'mbox'. Detected from the path when not provided.
+
+    Returns:
+        generator: The raw messages (bytes).
+
+    Raises:
+        ValueError: If the provided format is invalid or the path is not a mailbox.
+    """
+    # Validate format
+    if mailbox_format is None:
+        mailbox_format = detect_mailbox_format(path)
+    elif mailbox_format not in MAILBOX_FORMATS:
+        raise ValueError(f"Invalid format: '{mailbox_format}'. Must be one of {MAILBOX_FORMATS}.")
+
+    if mailbox_format == "maildir":
+        return iter_maildir_messages(path)
+    return iter_mbox_messages(path)
@@ -0,0 +1,117 @@
+import re
+from email import message_from_bytes
+from email.policy import compat32
+from email.utils import getaddresses
+
+# "rfc822; john@example.com" -> "john@example.com"
+ADDRESS_TYPE_PREFIX = re.compile(r"^\s*[\w-]+\s*;\s*")
+
+# Enhanced status code of a DSN, e.g. "5.1.1"
+STATUS_CODE = re.compile(r"([245])\.\d{1,3}\.\d{1,3}")
+
+
+def parse_report(raw: bytes) -> dict | None:
+    """
+    Parses a delivery status notification (DSN, RFC 3464) or an abuse feedback report (ARF, RFC 5965).
+
+    This function is pure (no database, no network) so it can run in a worker pool.
+
+    Args:
+        raw (bytes): The raw message, as stored in the maildir or mbox.
+
+    Returns:
+        dict | None: None if the message is not a DSN or an ARF report, otherwise a dictionary with:
+            - 'kind' (str): 'bounce' or 'complaint'.
+            - 'recipients' (list[dict]): For bounces, `{'email', 'status', 'permanent'}` per failed recipient.
+                                         For complaints, `{'email'}` of the complaining recipient.
+    """
+    message = message_from_bytes(raw, policy=compat32)
+    if message.get_content_type() != "multipart/report":
+        return None
+
+    report_type = (message.get_param("report-type") or "").lower()
+    if report_type == "delivery-status":
+        return parse_delivery_status(message)
+    elif report_type == "feedback-report":
+        return parse_feedback_report(message)
+    return None
+
+
+def clean_address(value: str) -> str:
+    """
+    Extracts a lower-cased address from a DSN / ARF header value.
+
+    Args:
+        value (str): A value like 'rfc822; John@Example.com' or '<john@example.com>'.
+
+    Returns:
+        str: The address, or an empty string.
+    """
+    if not value:
+        return ''
+    value = ADDRESS_TYPE_PREFIX.sub("", str(value)).strip().strip("<>").strip()
+    return value.lower() if "@" in value else ''
+
+
+def parse_delivery_status(message) -> dict | None:
+    """
+    Extracts the failed recipients of a DSN.
+
+    Args:
+        message (Message): A multipart/report message with report-type=delivery-status.
+
+    Returns:
+        dict | None: The bounce report, or None if no failed recipient was found.
+    """
+    recipients = []
+    for part in message.walk():
+        if part.get_content_type() != "message/delivery-status":
+            continue
+        # The first block holds the per-message fields, the next ones one block per recipient
+        blocks = part.get_payload()
+        for block in blocks[1:] if isinstance(blocks, list) else []:
+            action = (block.get("Action") or "").strip().lower()
+            if action not in ("failed", "delayed"):
+                continue
+            email = clean_address(block.get("Final-Recipient") or block.get("Original-Recipient"))
+            if not email:
+                continue
+            match = STATUS_CODE.search(block.get("Status") or "")
+            status = match.group(0) if match else ("5.0.0" if action == "failed" else "4.0.0")
+            recipients.append({"email": email, "status": status, "permanent": action == "failed" and status.startswith("5")})
+
+    return {"kind": "bounce", "recipients": recipients} if recipients else None
+
+
+def parse_feedback_report(message) -> dict | None:
+    """
+    Extracts the complaining recipient of an ARF report.
+
+    The recipient is read from the `Original-Rcpt-To` field of the report, or from the `To` header of the
+    returned original message when the field is missing.
+
+    Args:
+        message (Message): A multipart/report message with report-type=feedback-report.
+
+    Returns:
+        dict | None: The complaint report, or None if no recipient was found.
+    """
+    email = ''
+    original_headers = None
+    for part in message.walk():
+        content_type = part.get_content_type()
+        if content_type == "message/feedback-report":
+            blocks = part.get_payload()
+            for block in blocks if isinstance(blocks, list) else []:
+                email = email or clean_address(block.get("Original-Rcpt-To"))
+        elif content_type == "message/rfc822" and original_headers is None:
+            original = part.get_payload()
+            original_headers = original[0] if isinstance(original, list) and original else None
+        elif content_type == "text/rfc822-headers" and original_headers is None:
+            original_headers = message_from_bytes(part.get_payload(decode=True) or b"", policy=compat32)
+
+    if not email and original_headers is not None:
+        addresses = getaddresses(original_headers.get_all("To") or [])
+        email = clean_address(addresses[0][1]) if addresses else ''
+
+    return {"kind": "complaint", "recipients": [{"email": email}]} if email else None
@@ -0,0 +1,155 @@
+import os
+import threading
+from collections import OrderedDict
+import orjson
+from dotenv import load_dotenv
+from utils.http.json_representation import default_json
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Memory used by the cached listings (measured as their JSON size), 0 disables the cache
+LISTING_CACHE_BYTES = int(os.getenv("LISTING_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+class ListingCache:
+    """
+    An LRU cache of sorted listings (the customers of a group, the groups of a user), bounded by their size in bytes.
+
+    Keys are tuples that start with the kind of listing, the owner (group_id / user_id) and its version, followed by
+    the query parameters, e.g. `('customers', 7, 12, 'email', 'low_to_high', 'uninclude', None)`. Because the version
+    is part of the key, a listing cached before a change is never served after it, even by another worker process.
+    The write functions of services/db also call `invalidate` (through `services.db.versions`), which frees the
+    outdated listings of this process right away instead of leaving them to the LRU eviction.
+
+    The cached lists are shared by every request that hits them and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes (int): The maximum total size of the cached listings. A single listing may take up to
+                             an eighth of it, so one huge group does not evict everything else.
+        """
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 8
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._keys_by_owner = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """Returns the cached listing of the key (and marks it as recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, listing: list):
+        """Caches a listing, evicting the least recently used listings to stay under `max_bytes`."""
+        size = len(orjson.dumps(listing, default=default_json, option=orjson.OPT_NON_STR_KEYS))
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (listing, size)
+            self._keys_by_owner.setdefault(key[:2], set()).add(key)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_compute(self, key: tuple, compute):
+        """
+        Returns the cached listing of the key, or computes and caches it.
+
+        Args:
+            key (tuple): The key, `(kind, owner_id, version, *query_parameters)`.
+            compute (callable): Returns the listing on a miss.
+
+        Returns:
+            list: The listing.
+        """
+        if not self.max_bytes:
+            return compute()
+        listing = self.get(key)
+        if listing is None:
+            listing = compute()
+            self.put(key, listing)
+        return listing
+
+    async def get_or_compute_async(self, key: tuple, compute):
+        """
+        Returns the cached listing of the key, or awaits `compute()` and caches the result (used by the ASGI mode).
+
+        Args:
+            key (tuple): The key, `(kind, owner_id, version, *query_parameters)`.
+            compute (callable): Returns a coroutine of the listing on a miss.
+
+        Returns:
+            list: The listing.
+        """
+        if not self.max_bytes:
+            return await compute()
+        listing = self.get(key)
+        if listing is None:
+            listing = await compute()
+            self.put(key, listing)
+        return listing
+
+    def invalidate(self, kind: str, owner_id: int) -> int:
+        """
+        Drops every cached listing of an owner (all versions and query parameters).
+
+        Args:
+            kind (str): The kind of listing, 'customers' or 'groups'.
+            owner_id (int): The group_id (customers) or user_id (groups).
+
+        Returns:
+            int: The number of dropped listings.
+        """
+        with self._lock:
+            keys = self._keys_by_owner.get((kind, owner_id), ())
+            dropped = len(keys)
+            for key in list(keys):
+                self._remove(key)
+            self.invalidations += dropped
+            return dropped
+
+    def stats(self) -> dict:
+        """Returns the number of entries, their size, the counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: tuple):
+        """Removes a key from the entries and the owner index (the lock must be held)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry[1]
+        owner = key[:2]
+        keys = self._keys_by_owner[owner]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_owner[owner]
+
+
+listing_cache = ListingCache(LISTING_CACHE_BYTES)
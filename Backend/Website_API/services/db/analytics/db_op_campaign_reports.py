@@ -0,0 +1,78 @@
+from utils.user_agent.user_agent_classifier import describe_device_code
+
+
+def get_campaign_report(campaign_id: int, breakdown: str) -> dict:
+    """
+    Builds the report of a campaign from the rollup table only, without scanning the raw event tables.
+
+    Args:
+        campaign_id (int): The ID of the campaign.
+        breakdown (str): How to split the report.
+                    Allowed values: 'total', 'hour', 'country', 'device'.
+
+    Returns:
+        dict: The totals of the campaign (`opens`, `clicks`, `click_to_open_rate`) and, unless the breakdown
+              is 'total', a `rows` list with the same counters per hour, country or device.
+
+    Raises:
+        ValueError: If the provided breakdown is invalid.
+    """
+    from models.campaign_rollup_model import CampaignRollup, db
+    from sqlalchemy import func
+
+    # Validate breakdown to prevent grouping by an unexpected column
+    valid_breakdowns = ['total', 'hour', 'country', 'device']
+    if breakdown not in valid_breakdowns:
+        raise ValueError(f"Invalid breakdown: '{breakdown}'. Must be one of {valid_breakdowns}.")
+
+    opens = func.coalesce(func.sum(CampaignRollup.opens), 0).label('opens')
+    clicks = func.coalesce(func.sum(CampaignRollup.clicks), 0).label('clicks')
+
+    totals = (
+        db.session.query(opens, clicks)
+        .filter(CampaignRollup.campaign_id == campaign_id)
+        .one()
+    )
+    report = build_report_row({}, totals.opens, totals.clicks)
+    if breakdown == 'total':
+        return report
+
+    columns = {
+        'hour': CampaignRollup.bucket_hour,
+        'country': CampaignRollup.country,
+        'device': CampaignRollup.device_code
+    }
+    column = columns[breakdown]
+    rows = (
+        db.session.query(column, opens, clicks)
+        .filter(CampaignRollup.campaign_id == campaign_id)
+        .group_by(column)
+        .order_by(column)
+        .all()
+    )
+
+    if breakdown == 'hour':
+        report['rows'] = [build_report_row({'hour': hour}, row_opens, row_clicks) for hour, row_opens, row_clicks in rows]
+    elif breakdown == 'country':
+        report['rows'] = [build_report_row({'country': country or None}, row_opens, row_clicks) for country, row_opens, row_clicks in rows]
+    else:
+        report['rows'] = [build_report_row({'device_code': device_code, **describe_device_code(device_code)}, row_opens, row_clicks) for device_code, row_opens, row_clicks in rows]
+    return report
+
+
+def build_report_row(row: dict, opens: int, clicks: int) -> dict:
+    """
+    Adds the counters and the click-to-open rate to a report row.
+
+    Args:
+        row (dict): The dimension of the row (e.g. {'country': 'Israel'}).
+        opens (int): The number of opens.
+        clicks (int): The number of clicks.
+
+    Returns:
+        dict: The row with `opens`, `clicks` and `click_to_open_rate`.
+    """
+    row['opens'] = int(opens)
+    row['clicks'] = int(clicks)
+    row['click_to_open_rate'] = round(row['clicks'] / row['opens'], 4) if row['opens'] else None
+    return row
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+
+def add_events_to_rollups(connection, events: list, counter: str) -> int:
+    """
+    Adds a batch of tracking events to the campaign rollups, inside the transaction that inserts the raw events.
+
+    The events are aggregated in memory per campaign x hour x country x device, so a batch of thousands of
+    events becomes a handful of upserts. The country of every customer is read with a single query.
+
+    Args:
+        connection (Connection): The open connection (and transaction) of the event flusher.
+        events (list): A list of tuples `(campaign_id, customer_id, device_code, timestamp)`.
+        counter (str): The rollup column to increment. Allowed values: 'opens', 'clicks'.
+
+    Returns:
+        int: The number of rollup rows that were created or updated.
+
+    Raises:
+        ValueError: If the provided counter is invalid.
+    """
+    from models.campaign_rollup_model import CampaignRollup
+    from models.customer_model import Customer
+    from sqlalchemy import select
+    if connection.dialect.name == "sqlite":
+        # Development databases, SQLite has the same ON CONFLICT DO UPDATE
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    # Validate counter to prevent updating an unexpected column
+    valid_counters = ['opens', 'clicks']
+    if counter not in valid_counters:
+        raise ValueError(f"Invalid counter: '{counter}'. Must be one of {valid_counters}.")
+
+    if not events:
+        return 0
+
+    # Step 1: Get the country of every customer in the batch with one query
+    customer_ids = {customer_id for _, customer_id, _, _ in events}
+    countries = dict(connection.execute(
+        select(Customer.customer_id, Customer.country).where(Customer.customer_id.in_(customer_ids))
+    ).all())
+
+    # Step 2: Aggregate the events per rollup key
+    counts = {}
+    for campaign_id, customer_id, device_code, timestamp in events:
+        key = (campaign_id, int(timestamp // 3600), countries.get(customer_id) or '', device_code)
+        counts[key] = counts.get(key, 0) + 1
+
+    # Step 3: Upsert the rollups, in key order so concurrent flushers always lock rows in the same order
+    rows = [
+        {"campaign_id": campaign_id, "bucket_hour": datetime.utcfromtimestamp(hour * 3600), "country": country,
+         "device_code": device_code, "opens": 0, "clicks": 0, counter: amount}
+        for (campaign_id, hour, country, device_code), amount in sorted(counts.items())
+    ]
+    table = CampaignRollup.__table__
+    statement = insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.campaign_id, table.c.bucket_hour, table.c.country, table.c.device_code],
+        set_={counter: table.c[counter] + statement.excluded[counter]}
+    )
+    connection.execute(statement)
+    return len(rows)
@@ -0,0 +1,71 @@
+from services.suppression.email_hash import hash_email_key
+from utils.email_address.canonical_email import canonical_email
+from services.db.suppression.db_op_suppressions import add_suppressions
+from services.db.versions.db_op_versions import bump_group_versions_of_customers
+
+# Customer status set for every kind of report (a complaint is never downgraded to a bounce)
+REPORT_STATUSES = {"bounce": "bounced", "complaint": "complained"}
+
+
+def apply_bounce_reports(emails_by_kind: dict) -> dict:
+    """
+    Applies a batch of parsed hard bounces and complaints to the database.
+
+    Every address becomes a global suppression (an address that does not exist or reports spam is a risk
+    for every admin), unless it is already globally suppressed for the same reason, and the status of
+    every customer with that address (compared by canonical key) is updated with one UPDATE per kind.
+    The whole batch is committed in one transaction, so a suppressed address never keeps an 'active' customer.
+
+    Args:
+        emails_by_kind (dict): The lower-cased addresses of the batch per kind, e.g. `{'bounce': {...}, 'complaint': {...}}`.
+
+    Returns:
+        dict: `{'suppressed': int, 'customers_updated': int}` for the batch.
+
+    Raises:
+        ValueError: If a kind is invalid.
+    """
+    from models.customer_model import Customer, db
+    from models.suppression_model import Suppression
+    from sqlalchemy import update
+
+    # Validate kinds
+    for kind in emails_by_kind:
+        if kind not in REPORT_STATUSES:
+            raise ValueError(f"Invalid kind: '{kind}'. Must be one of {list(REPORT_STATUSES)}.")
+
+    suppressed = 0
+    customers_updated = 0
+    for kind in ("bounce", "complaint"):
+        emails = emails_by_kind.get(kind)
+        if not emails:
+            continue
+
+        # Step 1: Skip the addresses that are already globally suppressed for this reason
+        email_keys = {canonical_email(email) for email in emails}
+        hashes = {hash_email_key(email_key): email_key for email_key in email_keys}
+        existing = {
+            email_hash for (email_hash,) in db.session.query(Suppression.email_hash)
+            .filter(Suppression.group_admin_id.is_(None), Suppression.reason == kind,
+                    Suppression.email_hash.in_(hashes))
+        }
+        suppressed += add_suppressions(None, [(email, None) for email_hash, email in hashes.items()
+                                              if email_hash not in existing], kind, commit=False)
+
+        # Step 2: Update the status of the customers with these addresses in one statement (served by the email_key index),
+        # only customers whose status actually changes are written
+        previous_statuses = ['active'] if kind == "bounce" else ['active', 'bounced']
+        statement = (
+            update(Customer)
+            .where(Customer.email_key.in_(email_keys), Customer.email_status.in_(previous_statuses))
+            .values(email_status=REPORT_STATUSES[kind])
+            .execution_options(synchronize_session=False)
+        )
+        updated = db.session.execute(statement).rowcount
+        if updated:
+            # The groups of these addresses serve a new customers list
+            bump_group_versions_of_customers(Customer.email_key.in_(email_keys))
+        customers_updated += updated
+
+    db.session.commit()
+    return {"suppressed": suppressed, "customers_updated": customers_updated}
@@ -1,3 +1,6 @@
+from services.db.versions.db_op_versions import bump_group_versions
+
+
 def get_customer_by_customer_id(customer_id: int):
     """
     Retrieves a customer from the database by its customer_id.
@@ -32,6 +35,7 @@ def change_customer_by_customer_id(customer_id: int, first_name: str, last_name:
     """
     
     from models.customer_model import Customer, db
+    from utils.email_address.canonical_email import canonical_email
     # Step 1: Query the customer from the database by customer_id
     customer = Customer.query.filter_by(customer_id=customer_id).first()
     
@@ -40,7 +44,7 @@ def change_customer_by_customer_id(customer_id: int, first_name: str, last_name:
         return {"message": "Customer not found for the given customer_id."}, 404
 
     # Step 3: Check if another customer with the same email and group_id exists
-    existing_customer = Customer.query.filter_by(email=email, group_id=customer.group_id).first()
+    existing_customer = Customer.query.filter_by(email_key=canonical_email(email), group_id=customer.group_id).first()
     if existing_customer and existing_customer.customer_id != customer_id:
         return {"message": "A customer with this email and group ID already exists."}, 400
 
@@ -50,6 +54,7 @@ def change_customer_by_customer_id(customer_id: int, first_name: str, last_name:
     customer.email = email
     customer.country = country
     customer.city = city
+    bump_group_versions([customer.group_id])
 
     # Step 5: Commit the changes to the database
     db.session.commit()
@@ -85,6 +90,7 @@ def delete_customer_by_customer_id(customer_id: int):
 
     # Step 3: Delete the customer from the database
     db.session.delete(customer)
+    bump_group_versions([customer.group_id], customer_delta=-1)
 
     # Step 4: Commit the transaction to apply the deletion
     db.session.commit()
@@ -0,0 +1,167 @@
+from datetime import date
+
+# Dimensions the customers can be counted by
+STATS_DIMENSIONS = ["country", "city", "age", "email_status"]
+
+# Age buckets (label, minimum age, maximum age or None), from the youngest; customers without a birthday are 'unknown'
+AGE_BUCKETS = [
+    ("0-17", 0, 17),
+    ("18-24", 18, 24),
+    ("25-34", 25, 34),
+    ("35-44", 35, 44),
+    ("45-54", 45, 54),
+    ("55-64", 55, 64),
+    ("65+", 65, None),
+]
+
+
+def latest_birthday_for_age(age: int, today: date) -> date:
+    """
+    Returns the latest birthday of someone who is at least `age` years old today (see `calculate_age`).
+
+    Args:
+        age (int): The age.
+        today (date): The current date.
+
+    Returns:
+        date: The date `age` years before today (February 28 for a February 29 in a non-leap year).
+    """
+    try:
+        return today.replace(year=today.year - age)
+    except ValueError:
+        return today.replace(year=today.year - age, day=28)
+
+
+def age_bucket_expression(birthday_column, today: date):
+    """
+    Builds a SQL CASE expression that maps a birthday to the label of its age bucket.
+
+    The ages are turned into birthday ranges in Python, so the database only compares dates
+    (which works with any database and uses the (group_id, birthday) index).
+
+    Args:
+        birthday_column: The birthday column.
+        today (date): The date the ages are computed at.
+
+    Returns:
+        The CASE expression.
+    """
+    from sqlalchemy import case
+
+    whens = [(birthday_column.is_(None), "unknown")]
+    for label, minimum_age, maximum_age in AGE_BUCKETS:
+        # Older than maximum_age means born on or before the latest birthday for maximum_age + 1
+        condition = birthday_column <= latest_birthday_for_age(minimum_age, today)
+        if maximum_age is not None:
+            condition &= birthday_column > latest_birthday_for_age(maximum_age + 1, today)
+        whens.append((condition, label))
+    return case(*whens, else_="unknown")
+
+
+def get_customer_stats(by: str, group_id: int = None, group_admin_id: int = None, limit: int = 100) -> [dict]: # type: ignore
+    """
+    Counts the customers of a group, or of all the groups of an admin, per value of a dimension with a GROUP BY,
+    without fetching the customers.
+
+    Args:
+        by (str): The dimension. Allowed values: 'country', 'city', 'age' (age buckets), 'email_status'.
+        group_id (int, optional): The ID of the group.
+        group_admin_id (int, optional): The ID of the admin, used when `group_id` is not given.
+        limit (int, optional): The maximum number of values returned for 'country' and 'city', the most common first.
+                               Defaults to 100.
+
+    Returns:
+        list[dict]: `[{'value': ..., 'count': int}, ...]`, the age buckets from the youngest (then 'unknown'),
+                    the other dimensions from the most common value (null values have a `None` value).
+
+    Raises:
+        ValueError: If the dimension is invalid or neither `group_id` nor `group_admin_id` is given.
+    """
+    from models.customer_model import Customer, db
+    from models.group_model import Group
+    from sqlalchemy import func
+
+    # Validate dimension
+    if by not in STATS_DIMENSIONS:
+        raise ValueError(f"Invalid dimension: '{by}'. Must be one of {STATS_DIMENSIONS}.")
+    if group_id is None and group_admin_id is None:
+        raise ValueError("Either group_id or group_admin_id must be given.")
+
+    # Step 1: The value counted, the label of the age bucket for 'age'
+    value = age_bucket_expression(Customer.birthday, date.today()) if by == "age" else getattr(Customer, by)
+    value = value.label("value")
+    count = func.count(Customer.customer_id)
+
+    # Step 2: Count the customers of the group, or of the admin's groups
+    query = db.session.query(value, count)
+    if group_id is not None:
+        query = query.filter(Customer.group_id == group_id)
+    else:
+        query = query.join(Group, Group.group_id == Customer.group_id).filter(Group.group_admin_id == group_admin_id)
+    query = query.group_by(value)
+
+    # Step 3: Order the values
+    if by == "age":
+        order = [label for label, _, _ in AGE_BUCKETS] + ["unknown"]
+        counts = dict(query.all())
+        return [{"value": label, "count": counts[label]} for label in order if label in counts]
+    rows = query.order_by(count.desc(), value).limit(limit).all()
+    return [{"value": row[0], "count": row[1]} for row in rows]
+
+
+def get_group_customer_count(group_id: int) -> int | None:
+    """
+    Reads the number of customers of a group from its counter (a primary key lookup).
+
+    Args:
+        group_id (int): The ID of the group.
+
+    Returns:
+        int | None: The number of customers, or None if the group does not exist.
+    """
+    from models.group_model import Group, db
+    return db.session.query(Group.customer_count).filter(Group.group_id == group_id).scalar()
+
+
+def get_admin_customer_count(group_admin_id: int) -> int:
+    """
+    Sums the customer counters of the groups of an admin (served by the group_admin_id index).
+
+    Args:
+        group_admin_id (int): The ID of the admin.
+
+    Returns:
+        int: The number of customers in all the admin's groups.
+    """
+    from models.group_model import Group, db
+    from sqlalchemy import func
+    return db.session.query(func.coalesce(func.sum(Group.customer_count), 0)).filter(Group.group_admin_id == group_admin_id).scalar()
+
+
+def recount_group_customers() -> int:
+    """
+    Recomputes the customer counter of every group from the customers table, in one statement.
+
+    Used to initialize the counters of an existing database, or to repair them after customers were changed
+    outside of the API.
+
+    Returns:
+        int: The number of groups whose counter was updated.
+    """
+    from models.customer_model import Customer, db
+    from models.group_model import Group
+    from sqlalchemy import func, select, update
+
+    customer_count = (
+        select(func.count(Customer.customer_id))
+        .where(Customer.group_id == Group.group_id)
+        .scalar_subquery()
+    )
+    updated = db.session.execute(
+        update(Group)
+        .where(Group.customer_count != customer_count)
+        .values(customer_count=customer_count, version=Group.version + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return updated
@@ -1,10 +1,14 @@
+from services.db.versions.db_op_versions import bump_group_versions
+
+
 def add_new_customer(data: dict):
     """"
     Adds a new customer to the database if no existing customer with the same email and group_id is found.
 
     This function accepts a dictionary containing customer details and creates a new
     customer record in the database using the provided information, but only if a customer
-    with the same email and group_id does not already exist. It commits the changes to persist the 
+    with the same email and group_id does not already exist. Emails are compared by their canonical
+    key, so 'Foo@Example.com' and 'foo@example.com' are the same customer. It commits the changes to persist the 
     new customer if no conflict is found.
 
     Args:
@@ -21,10 +25,11 @@ def add_new_customer(data: dict):
          dict: A dictionary representation of the newly added customer or an error message if the customer already exists.
     """
     from models.customer_model import Customer, db
+    from utils.email_address.canonical_email import canonical_email
     
     # Check if a customer with the same email and group_id already exists
     existing_customer = Customer.query.filter_by(
-        email=data['email'], group_id=data['group_id']
+        email_key=canonical_email(data['email']), group_id=data['group_id']
     ).first()
 
     if existing_customer:
@@ -41,6 +46,7 @@ def add_new_customer(data: dict):
         birthday=data.get('birthday', None)
     )
     db.session.add(new_customer)
+    bump_group_versions([data['group_id']], customer_delta=1)
     db.session.commit()
     return new_customer.to_dict()
 
@@ -51,6 +57,7 @@ def add_new_customers(customers_list: list, group_id: int) -> dict:
 
     This function accepts a list of customer dictionaries and adds each customer
     to the database if no existing customer with the same email and group_id is found.
+    Emails are compared by their canonical key, with a single query for the whole list.
     It returns a dict with list, including added customers and any errors encountered.
 
     Args:
@@ -67,18 +74,20 @@ def add_new_customers(customers_list: list, group_id: int) -> dict:
         dict: A dict with list inside, each one representing the result for a customer. or error dict 
     """
     from models.customer_model import Customer, db
+    from utils.email_address.canonical_email import canonical_email
 
-    results = []
+    # Check if customers with the same emails and group_id already exist
+    email_keys = {canonical_email(customer_data['email']): customer_data['email'] for customer_data in customers_list}
+    existing_customer = (
+        db.session.query(Customer.email_key)
+        .filter(Customer.group_id == group_id, Customer.email_key.in_(email_keys))
+        .first()
+    )
+    if existing_customer:
+        return {'message': f"Customer with email {email_keys[existing_customer.email_key]} already exists in the group."}
 
+    new_customers = []
     for customer_data in customers_list:
-        # Check if a customer with the same email and group_id already exists
-        existing_customer = Customer.query.filter_by(
-            email=customer_data['email'], group_id=group_id
-        ).first()
-
-        if existing_customer:
-            return {'message': f'Customer with email {customer_data['email']} already exists in the group.'}
-
         # Create and add the new customer
         new_customer = Customer(
             group_id=group_id,
@@ -90,10 +99,14 @@ def add_new_customers(customers_list: list, group_id: int) -> dict:
             birthday=customer_data.get('birthday', None)
         )
         db.session.add(new_customer)
+        new_customers.append(new_customer)
 
-        # Append success result to results
-        results.append(new_customer.to_dict())
+    # Flush so the customer_id and the default email_status are in the results
+    db.session.flush()
+    results = [new_customer.to_dict() for new_customer in new_customers]
 
     # Commit all changes at once
+    if results:
+        bump_group_versions([group_id], customer_delta=len(results))
     db.session.commit()
     return {"customers": results}
\ No newline at end of file
@@ -0,0 +1,124 @@
+from services.db.versions.db_op_versions import bump_group_versions, bump_group_versions_by_delta
+
+# Fields of a customer that can be changed in bulk (the email is unique per group, so it is only changed one by one)
+BULK_FIELDS = ["first_name", "last_name", "country", "city", "birthday"]
+
+# Upper bound of the customer IDs of one bulk request
+MAX_BULK_CUSTOMER_IDS = 10000
+
+
+def bulk_customers_filter(customer_ids: list = None, segment: dict = None):
+    """
+    Builds the WHERE clause of a bulk operation: the customers with the given IDs, or the customers of a segment.
+
+    A segment is applied as a subquery (`customer_id IN (SELECT ...)`), so its customers are never loaded.
+
+    Args:
+        customer_ids (list, optional): The IDs of the customers.
+        segment (dict, optional): A valid segment definition (see `validate_segment`).
+
+    Returns:
+        The SQLAlchemy clause over the customers table.
+
+    Raises:
+        ValueError: If neither or both of customer_ids and segment are given.
+    """
+    from models.customer_model import Customer
+    from services.db.segments.db_op_segments import build_segment_query
+
+    if (customer_ids is None) == (segment is None):
+        raise ValueError("Invalid target. Use either customer_ids or segment.")
+    if customer_ids is not None:
+        return Customer.customer_id.in_(sorted(set(customer_ids)))
+    return Customer.customer_id.in_(build_segment_query(segment, [Customer.customer_id]))
+
+
+def execute_by_group(statement, customer_filter) -> dict:
+    """
+    Executes an UPDATE or DELETE of customers and counts the rows it changed in every group.
+
+    The counts must describe the rows the statement changed, not the rows a separate SELECT saw before it: a customer
+    added or deleted concurrently would make the customer counters drift, or leave a group changed without a new
+    version. On PostgreSQL the statement returns the groups of its rows (`WITH changed AS (... RETURNING group_id)
+    SELECT group_id, count(*) ...`, counted in the database). Other databases lock the rows with
+    `SELECT ... FOR UPDATE` before the statement (SQLite locks the whole database at the first write anyway).
+
+    Args:
+        statement: The UPDATE or DELETE over the customers table, filtered by `customer_filter`.
+        customer_filter: The clause of `bulk_customers_filter`.
+
+    Returns:
+        dict: The number of customers changed by group_id.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import select, func
+
+    statement = statement.execution_options(synchronize_session=False)
+    if db.engine.dialect.name == "postgresql":
+        changed = statement.returning(Customer.group_id).cte("changed")
+        return dict(db.session.execute(select(changed.c.group_id, func.count()).group_by(changed.c.group_id)).all())
+
+    counts = dict(
+        db.session.query(Customer.group_id, func.count(Customer.customer_id))
+        .filter(customer_filter)
+        .group_by(Customer.group_id)
+        .with_for_update()
+        .all()
+    )
+    db.session.execute(statement)
+    return counts
+
+
+def update_customers_bulk(customer_filter, changes: dict) -> dict:
+    """
+    Applies the same changes to every customer matching a filter, with one UPDATE in one transaction.
+
+    Args:
+        customer_filter: The clause of `bulk_customers_filter`.
+        changes (dict): The new values by field, fields in `BULK_FIELDS` (birthday as a date).
+
+    Returns:
+        dict: `{'updated': int, 'groups': int}`, the number of customers updated and of groups they belong to.
+
+    Raises:
+        ValueError: If a field is invalid.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import update
+
+    # Validate fields
+    invalid_fields = [field for field in changes if field not in BULK_FIELDS]
+    if not changes or invalid_fields:
+        raise ValueError(f"Invalid fields: {invalid_fields}. Must be in {BULK_FIELDS}.")
+
+    # Step 1: Update all the customers in one statement, counting them by group
+    counts = execute_by_group(update(Customer).where(customer_filter).values(**changes), customer_filter)
+
+    # Step 2: Bump the versions of the groups whose lists changed and commit everything together
+    bump_group_versions(counts)
+    db.session.commit()
+    return {"updated": sum(counts.values()), "groups": len(counts)}
+
+
+def delete_customers_bulk(customer_filter) -> dict:
+    """
+    Deletes every customer matching a filter, with one DELETE in one transaction.
+
+    The customer counters of the groups are decreased by the number of customers deleted from each of them.
+
+    Args:
+        customer_filter: The clause of `bulk_customers_filter`.
+
+    Returns:
+        dict: `{'deleted': int, 'groups': int}`, the number of customers deleted and of groups they belonged to.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import delete
+
+    # Step 1: Delete all the customers in one statement, counting them by group
+    counts = execute_by_group(delete(Customer).where(customer_filter), customer_filter)
+
+    # Step 2: Update the versions and counters of the groups and commit everything together
+    bump_group_versions_by_delta({group_id: -count for group_id, count in counts.items()})
+    db.session.commit()
+    return {"deleted": sum(counts.values()), "groups": len(counts)}
@@ -1,8 +1,18 @@
-def get_customers_of_group_by_group_id_sorted(group_id: int, sort: str, order: str, age: str) -> [dict]: # type: ignore
+from datetime import date
+from utils.converters.calculate_age import calculate_age
+
+# Fields of a customer returned by the list endpoints (the keys of `Customer.to_dict`)
+CUSTOMER_FIELDS = ["customer_id", "first_name", "last_name", "email", "country", "city", "birthday", "email_status", "group_id"]
+
+
+def get_customers_of_group_by_group_id_sorted(group_id: int, sort: str, order: str, age: str, fields: list = None) -> [dict]: # type: ignore
     """
     Retrieves customers of a specific group, sorted based on the specified field and order, 
     and optionally includes the 'age' field.
 
+    Only the requested columns are selected, as plain rows that are turned into dictionaries directly:
+    no ORM object is created (no identity map, no attribute instrumentation) for what is only serialized.
+
     Args:
         group_id (int): The ID of the group whose customers are to be retrieved.
         sort (str): The field by which the results should be sorted.
@@ -11,21 +21,48 @@ def get_customers_of_group_by_group_id_sorted(group_id: int, sort: str, order: s
                     Allowed values: 'high_to_low' (descending) or 'low_to_high' (ascending).
         age (str): Whether to include the 'age' field in the results.
                     Allowed values: 'include' (includes age), 'uninclude' (excludes age).
+        fields (list, optional): The fields of every customer (a sparse fieldset), in this order.
+                    Allowed values: the names in `CUSTOMER_FIELDS`. Defaults to all of them.
 
     Returns:
         list[dict]: A list of dictionaries representing the customers in the specified group,
                     sorted by the specified field and order, and optionally including the 'age' field.
 
     Raises:
-        ValueError: If the provided sort field, order, or age option is invalid.
+        ValueError: If the provided sort field, order, age option, or fields are invalid.
 
     Behavior:
         - If 'age' is 'include', the function includes the 'age' field in the customer dictionary.
         - If 'age' is 'uninclude', the function omits the 'age' field from the customer dictionary.
         - If 'sort' or 'order' is invalid, a ValueError is raised.
     """
-    from models.customer_model import Customer, db
-    from sqlalchemy import desc, asc
+    from models.customer_model import db
+
+    statement, fields, columns = customers_of_group_statement(group_id, sort, order, age, fields)
+    rows = db.session.execute(statement).all()
+    return customers_from_rows(rows, fields, columns, age)
+
+
+def customers_of_group_statement(group_id: int, sort: str, order: str, age: str, fields: list = None) -> tuple:
+    """
+    Builds the SELECT of `get_customers_of_group_by_group_id_sorted`, so the same query is executed
+    by the Flask API (with the session) and by the ASGI mode (with the async engine).
+
+    Args:
+        group_id (int): The ID of the group.
+        sort (str): The field by which the results should be sorted.
+        order (str): 'high_to_low' or 'low_to_high'.
+        age (str): 'include' or 'uninclude'.
+        fields (list, optional): The fields of every customer. Defaults to all of them.
+
+    Returns:
+        tuple: The statement, the fields, and the selected columns (the fields, and the birthday for the age).
+
+    Raises:
+        ValueError: If the provided sort field, order, age option, or fields are invalid.
+    """
+    from models.customer_model import Customer
+    from sqlalchemy import desc, asc, select
 
     # Validate sort field to prevent SQL injection
     valid_sort_fields = ["first_name", "last_name", "email", "country", "city", "birthday"]
@@ -42,18 +79,42 @@ def get_customers_of_group_by_group_id_sorted(group_id: int, sort: str, order: s
     if age not in valid_age:
         raise ValueError(f"Invalid age: '{age}'. Must be one of {valid_age}.")
 
+    # Validate fields
+    fields = fields or CUSTOMER_FIELDS
+    invalid_fields = [field for field in fields if field not in CUSTOMER_FIELDS]
+    if invalid_fields:
+        raise ValueError(f"Invalid fields: {invalid_fields}. Must be in {CUSTOMER_FIELDS}.")
+
     # Determine the sorting order
     sort_order = desc if order == 'high_to_low' else asc
 
-    customers = (
-            db.session.query(Customer)
-            .filter(Customer.group_id == group_id)
+    # The birthday is selected last when only needed for the age, so zip(fields, row) leaves it out
+    columns = list(fields) if age == "uninclude" or "birthday" in fields else [*fields, "birthday"]
+    statement = (
+            select(*[getattr(Customer, column) for column in columns])
+            .where(Customer.group_id == group_id)
             .order_by(sort_order(getattr(Customer, sort)))
-            .all()
         )
-   
-    # Convert customers to a list of dictionaries, including or excluding age as requested
+    return statement, fields, columns
+
+
+def customers_from_rows(rows, fields: list, columns: list, age: str) -> [dict]: # type: ignore
+    """
+    Converts the rows of `customers_of_group_statement` to dictionaries, including or excluding the age.
+
+    Args:
+        rows (list): The rows.
+        fields (list): The fields of every customer.
+        columns (list): The selected columns.
+        age (str): 'include' or 'uninclude'.
+
+    Returns:
+        list[dict]: The customers.
+    """
+    # Convert rows to a list of dictionaries, including or excluding age as requested
     if age == "include":
-        return [customer.to_dict_with_age() for customer in customers]
+        today = date.today()
+        birthday_index = columns.index("birthday")
+        return [{**dict(zip(fields, row)), "age": calculate_age(row[birthday_index], today)} for row in rows]
     else:
-        return [customer.to_dict() for customer in customers]
+        return [dict(zip(fields, row)) for row in rows]
@@ -0,0 +1,127 @@
+from utils.email_address.canonical_email import canonical_email, email_domain
+from services.db.versions.db_op_versions import bump_group_versions_by_delta
+
+# Number of customers read and updated per batch by the backfill
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_email_keys(batch_size: int = BACKFILL_BATCH_SIZE, progress=None) -> dict:
+    """
+    Recomputes the canonical email key and domain of every customer, in customer_id order and in batches.
+
+    Used once for the customers created before the `email_key` / `email_domain` columns existed, and again
+    whenever the canonicalization rules change. Only the rows whose key or domain actually changes are
+    updated, with one executemany UPDATE per batch, and every batch is committed on its own.
+
+    Args:
+        batch_size (int, optional): The number of customers per batch. Defaults to 5000.
+        progress (callable, optional): Called with `(customer_id, scanned, updated)` after every batch.
+
+    Returns:
+        dict: `{'scanned': int, 'updated': int}`.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import bindparam, select, update
+
+    table = Customer.__table__
+    statement = (
+        update(table)
+        .where(table.c.customer_id == bindparam("b_customer_id"))
+        .values(email_key=bindparam("b_email_key"), email_domain=bindparam("b_email_domain"))
+    )
+
+    scanned = 0
+    updated = 0
+    after = 0
+    while True:
+        rows = db.session.execute(
+            select(table.c.customer_id, table.c.email, table.c.email_key, table.c.email_domain)
+            .where(table.c.customer_id > after)
+            .order_by(table.c.customer_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        changes = []
+        for customer_id, email, current_key, current_domain in rows:
+            email_key = canonical_email(email)
+            domain = email_domain(email_key)
+            if email_key != current_key or domain != current_domain:
+                changes.append({"b_customer_id": customer_id, "b_email_key": email_key, "b_email_domain": domain})
+
+        if changes:
+            db.session.execute(statement, changes)
+        db.session.commit()
+
+        scanned += len(rows)
+        updated += len(changes)
+        after = rows[-1].customer_id
+        if progress:
+            progress(after, scanned, updated)
+
+    return {"scanned": scanned, "updated": updated}
+
+
+def delete_duplicate_customers(batch_size: int = BACKFILL_BATCH_SIZE, progress=None) -> dict:
+    """
+    Deletes the customers whose canonical email key is already used by an earlier customer (lower customer_id) of
+    the same group, in customer_id order and in batches.
+
+    A customer is unique per group by email_key, but the rows created before the keys existed (or before a change
+    of the canonicalization rules) may hold duplicates, which prevent the unique index of the Customer model.
+    Every batch is committed on its own with the versions and customer counts of its groups.
+
+    Args:
+        batch_size (int, optional): The number of customers per batch. Defaults to 5000.
+        progress (callable, optional): Called with `(customer_id, scanned, deleted)` after every batch.
+
+    Returns:
+        dict: `{'scanned': int, 'deleted': int}`.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import select, delete, exists, func
+
+    table = Customer.__table__
+    earlier = table.alias("earlier")
+    is_duplicate = exists().where(earlier.c.group_id == table.c.group_id, earlier.c.email_key == table.c.email_key,
+                                  earlier.c.customer_id < table.c.customer_id)
+
+    scanned = 0
+    deleted = 0
+    after = 0
+    while True:
+        next_batch = (
+            select(table.c.customer_id)
+            .where(table.c.customer_id > after)
+            .order_by(table.c.customer_id)
+            .limit(batch_size)
+            .subquery()
+        )
+        upper, count = db.session.execute(select(func.max(next_batch.c.customer_id), func.count()).select_from(next_batch)).one()
+        if not count:
+            break
+
+        duplicates = db.session.execute(
+            select(table.c.customer_id, table.c.group_id)
+            .where(table.c.customer_id > after, table.c.customer_id <= upper, is_duplicate)
+        ).all()
+        if duplicates:
+            db.session.execute(
+                delete(table)
+                .where(table.c.customer_id.in_([customer_id for customer_id, _ in duplicates]))
+                .execution_options(synchronize_session=False)
+            )
+            deltas = {}
+            for _, group_id in duplicates:
+                deltas[group_id] = deltas.get(group_id, 0) - 1
+            bump_group_versions_by_delta(deltas)
+        db.session.commit()
+
+        scanned += count
+        deleted += len(duplicates)
+        after = upper
+        if progress:
+            progress(after, scanned, deleted)
+
+    return {"scanned": scanned, "deleted": deleted}
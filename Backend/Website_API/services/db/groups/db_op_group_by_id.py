@@ -1,3 +1,6 @@
+from services.db.versions.db_op_versions import bump_group_versions, bump_user_groups_version
+
+
 def get_group_by_group_id(group_id: int):
     """
     Retrieves a group from the database by its group_id.
@@ -44,6 +47,8 @@ def change_group_by_group_id(group_id: int, group_name: str, group_description:
     # Step 4: Update the group's name and description
     group.group_name = group_name
     group.group_description = group_description
+    bump_group_versions([group_id])
+    bump_user_groups_version(group.group_admin_id)
 
     # Step 5: Commit the changes to the database
     db.session.commit()
@@ -53,24 +58,28 @@ def change_group_by_group_id(group_id: int, group_name: str, group_description:
 
 def delete_group_by_group_id(group_id: int):
     """
-    Deletes a group from the database by its `group_id`.
+    Queues the deletion of a group by its `group_id`.
+
+    A group can hold millions of customers: deleting them in one transaction would lock them for long and
+    (through the ORM) load them all. The deletion runs as a `delete_group` job instead, which deletes the
+    customers in batches, then the group (see `delete_group_in_batches`).
 
     This function performs the following tasks:
     1. Queries the `Group` table in the database for a group with the provided `group_id`.
-    2. If the group exists, it deletes the group from the database.
-    3. Commits the transaction to apply the deletion.
-    4. Returns a success message if the deletion is successful.
-    5. If the group does not exist, returns an error message.
+    2. If the group does not exist, returns an error message.
+    3. Queues the deletion job, unless the deletion of the group is already queued or running.
+    4. Returns the job.
 
     Args:
         group_id (int): The ID of the group to be deleted.
 
     Returns:
-        dict: A response dictionary with a success message if the deletion is successful.
-        tuple: A tuple containing an error message and an HTTP status code if the group is not found.
+        tuple: A response dictionary with the job and the HTTP status code 202 if the deletion is queued,
+               or an error message and an HTTP status code if the group is not found.
     """
-    from models.group_model import Group, db
-    
+    from models.group_model import Group
+    from services.db.jobs.db_op_jobs import create_job, get_unfinished_job
+
     # Step 1: Query the group from the database by group_id
     group = Group.query.filter_by(group_id=group_id).first()
 
@@ -78,11 +87,11 @@ def delete_group_by_group_id(group_id: int):
     if not group:
         return {"message": "Group not found for the given group_id."}, 404
 
-    # Step 3: Delete the group from the database
-    db.session.delete(group)
-
-    # Step 4: Commit the transaction to apply the deletion
-    db.session.commit()
+    # Step 3: Queue the deletion, once
+    params = {"group_id": group_id}
+    job = get_unfinished_job("delete_group", params, owner_id=group.group_admin_id)
+    if not job:
+        job = create_job("delete_group", params, owner_id=group.group_admin_id)
 
-    # Step 5: Return a success message
-    return {"message": "Group successfully deleted."}, 200
+    # Step 4: Return the job
+    return {"message": "The deletion of the group is queued", "job": job}, 202
@@ -0,0 +1,88 @@
+from services.cache.listing_cache import listing_cache
+from services.db.versions.db_op_versions import bump_group_versions_by_delta, bump_user_groups_version
+
+# Number of rows deleted per statement (and per transaction)
+DELETE_BATCH_SIZE = 10000
+
+
+def delete_rows_in_batches(table, condition, batch_size: int = DELETE_BATCH_SIZE, before_commit=None, progress=None) -> int:
+    """
+    Deletes the rows of a table matching a condition, `batch_size` rows per statement, each batch in its own
+    transaction (`DELETE ... WHERE pk IN (SELECT pk ... LIMIT batch_size)`).
+
+    Nothing is loaded in Python and no transaction holds more than `batch_size` row locks, so millions of rows
+    are deleted without blocking the writers of the table for long.
+
+    Args:
+        table (Table): The table, with a single-column primary key.
+        condition: A SQLAlchemy clause over the table selecting the rows to delete.
+        batch_size (int, optional): The number of rows per statement. Defaults to DELETE_BATCH_SIZE.
+        before_commit (callable, optional): Called with the number of rows deleted by a batch, in its transaction.
+        progress (callable, optional): Called with the number of rows deleted so far after every batch.
+
+    Returns:
+        int: The number of rows deleted.
+    """
+    from extensions import db
+    from sqlalchemy import select, delete
+
+    key = list(table.primary_key.columns)[0]
+    deleted = 0
+    while True:
+        next_batch = select(key).where(condition).limit(batch_size)
+        batch_deleted = db.session.execute(
+            delete(table).where(key.in_(next_batch)).execution_options(synchronize_session=False)
+        ).rowcount
+        if batch_deleted and before_commit:
+            before_commit(batch_deleted)
+        db.session.commit()
+
+        deleted += batch_deleted
+        if progress and batch_deleted:
+            progress(deleted)
+        if batch_deleted < batch_size:
+            return deleted
+
+
+def delete_group_in_batches(group_id: int, batch_size: int = DELETE_BATCH_SIZE, progress=None) -> dict:
+    """
+    Deletes a group and its customers, the customers in batches (see `delete_rows_in_batches`), then the group.
+
+    Every batch updates the version and customer count of the group, so the group stays consistent while its
+    customers are deleted. A customer added meanwhile is deleted with the group by the `ON DELETE CASCADE`
+    of its foreign key.
+
+    Args:
+        group_id (int): The ID of the group to be deleted.
+        batch_size (int, optional): The number of customers per statement. Defaults to DELETE_BATCH_SIZE.
+        progress (callable, optional): Called with the number of customers deleted so far after every batch.
+
+    Returns:
+        dict: `{'customers': int}`, the number of customers deleted.
+
+    Raises:
+        ValueError: If the group does not exist.
+    """
+    from models.customer_model import Customer, db
+    from models.group_model import Group
+    from sqlalchemy import delete
+
+    # Step 1: Check if the group exists
+    group_admin_id = db.session.query(Group.group_admin_id).filter(Group.group_id == group_id).scalar()
+    if group_admin_id is None:
+        raise ValueError(f"Group with group_id {group_id} does not exist.")
+
+    # Step 2: Delete the customers batch by batch
+    customers = Customer.__table__
+    deleted = delete_rows_in_batches(
+        customers, customers.c.group_id == group_id, batch_size,
+        before_commit=lambda batch_deleted: bump_group_versions_by_delta({group_id: -batch_deleted}),
+        progress=progress
+    )
+
+    # Step 3: Delete the group
+    db.session.execute(delete(Group).where(Group.group_id == group_id).execution_options(synchronize_session=False))
+    bump_user_groups_version(group_admin_id)
+    db.session.commit()
+    listing_cache.invalidate("customers", group_id)
+    return {"customers": deleted}
@@ -0,0 +1,156 @@
+from services.cache.listing_cache import listing_cache
+from services.db.versions.db_op_versions import bump_group_versions_by_delta, bump_user_groups_version
+from services.db.groups.db_op_group_deletes import delete_rows_in_batches
+
+# Number of customers of the source group handled per statement (and per transaction)
+TRANSFER_BATCH_SIZE = 10000
+
+# Supported operations:
+# - move: the customers change group, the ones whose email is already in the target stay in the source
+#         (and so do the later customers of the source with the same email).
+# - copy: the customers are inserted in the target too, except the ones whose email is already there
+#         (and the later customers of the source with the same email).
+# - merge: move, then the source group is deleted (with the customers that were already in the target).
+TRANSFER_OPERATIONS = ["move", "copy", "merge"]
+
+
+def transfer_customers(operation: str, source_group_id: int, target_group_id: int, customer_ids: list = None,
+                       batch_size: int = TRANSFER_BATCH_SIZE, progress=None, after: int = 0) -> dict:
+    """
+    Moves, copies or merges the customers of a group into another group of the same admin.
+
+    The source group is walked in customer_id order, `batch_size` customers at a time, and every batch is
+    transferred with one set-based statement (`UPDATE customers SET group_id = ...` for a move,
+    `INSERT INTO customers SELECT ...` for a copy), committed with the versions and customer counters of both
+    groups. Nothing is loaded in Python except the bounds of the batches, so groups of millions of customers
+    are transferred in bounded memory and short transactions.
+
+    A customer is unique per group by canonical email (`email_key`, a unique index). Only the first customer
+    (lowest customer_id) of every email_key of the source is transferred, and it is skipped if its email is
+    already in the target group, both with `NOT EXISTS` anti-joins served by the `(email_key, group_id)` index.
+    A copy also inserts with `ON CONFLICT DO NOTHING`, for the rows the anti-join cannot see (inserted by a
+    concurrent transaction, e.g. the same batch run again by a worker whose job lease expired). A move that
+    conflicts with a concurrent insert fails on the unique index, and its batch is run again once.
+
+    Args:
+        operation (str): 'move', 'copy' or 'merge'.
+        source_group_id (int): The ID of the group whose customers are transferred.
+        target_group_id (int): The ID of the group that receives them.
+        customer_ids (list, optional): Only transfer these customers of the source group ('move' and 'copy').
+                                       Defaults to all of them.
+        batch_size (int, optional): The number of customers per statement. Defaults to TRANSFER_BATCH_SIZE.
+        progress (callable, optional): Called with `(customer_id, scanned, transferred, skipped)` after every batch,
+                                       including the batches deleted by a merge (with the final counts).
+        after (int, optional): Resume after this customer_id (the last one passed to `progress`). Defaults to 0.
+
+    Returns:
+        dict: `{'scanned': int, 'transferred': int, 'skipped': int}`, and `'deleted': int` (the skipped customers
+              deleted with the source group) for a merge.
+
+    Raises:
+        ValueError: If the operation or the groups are invalid.
+    """
+    from models.customer_model import Customer, db
+    from models.group_model import Group
+    from sqlalchemy import select, update, delete, exists, func, literal
+    from sqlalchemy.exc import IntegrityError
+
+    # Step 1: Validate the operation and the groups
+    if operation not in TRANSFER_OPERATIONS:
+        raise ValueError(f"Invalid operation: '{operation}'. Must be one of {TRANSFER_OPERATIONS}.")
+    if operation == "merge" and customer_ids is not None:
+        raise ValueError("Invalid customer_ids. A merge transfers all the customers of the group.")
+    if source_group_id == target_group_id:
+        raise ValueError("Invalid groups. The source and target groups must be different.")
+    admins = dict(db.session.query(Group.group_id, Group.group_admin_id)
+                  .filter(Group.group_id.in_([source_group_id, target_group_id])))
+    for group_id in (source_group_id, target_group_id):
+        if group_id not in admins:
+            raise ValueError(f"Group with group_id {group_id} does not exist.")
+    if admins[source_group_id] != admins[target_group_id]:
+        raise ValueError("Invalid groups. The source and target groups must belong to the same admin.")
+
+    # Step 2: Build the statement of a batch, bound to a range of customer_ids of the source group
+    customers = Customer.__table__
+    existing = customers.alias("existing")
+    earlier = customers.alias("earlier")
+
+    def in_source(table):
+        conditions = [table.c.group_id == source_group_id]
+        if customer_ids is not None:
+            conditions.append(table.c.customer_id.in_(sorted(set(customer_ids))))
+        return conditions
+
+    not_in_target = ~exists().where(existing.c.group_id == target_group_id,
+                                    existing.c.email_key == customers.c.email_key)
+    # The source may hold several customers with the same key (e.g. created before the keys existed)
+    first_of_key = ~exists().where(*in_source(earlier), earlier.c.email_key == customers.c.email_key,
+                                   earlier.c.customer_id < customers.c.customer_id)
+
+    if db.engine.dialect.name == "sqlite":
+        # Development databases, SQLite has the same ON CONFLICT DO NOTHING
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    def batch_statement(after: int, upper: int):
+        in_batch = [*in_source(customers), customers.c.customer_id > after, customers.c.customer_id <= upper,
+                    not_in_target, first_of_key]
+        if operation == "copy":
+            columns = [column for column in customers.c if column.name not in ("customer_id", "group_id")]
+            return insert(customers).from_select(
+                ["group_id", *[column.name for column in columns]],
+                select(literal(target_group_id), *columns).where(*in_batch)
+            ).on_conflict_do_nothing(index_elements=["email_key", "group_id"])
+        return update(customers).where(*in_batch).values(group_id=target_group_id)
+
+    # Step 3: Transfer the customers batch by batch
+    scanned = 0
+    transferred = 0
+    while True:
+        next_batch = (
+            select(customers.c.customer_id)
+            .where(*in_source(customers), customers.c.customer_id > after)
+            .order_by(customers.c.customer_id)
+            .limit(batch_size)
+            .subquery()
+        )
+        upper, count = db.session.execute(select(func.max(next_batch.c.customer_id), func.count()).select_from(next_batch)).one()
+        if not count:
+            break
+
+        try:
+            batch_transferred = db.session.execute(
+                batch_statement(after, upper).execution_options(synchronize_session=False)
+            ).rowcount
+        except IntegrityError:
+            # A customer with the same email was added to the target meanwhile, the anti-join now sees it
+            db.session.rollback()
+            batch_transferred = db.session.execute(
+                batch_statement(after, upper).execution_options(synchronize_session=False)
+            ).rowcount
+        if batch_transferred:
+            deltas = {target_group_id: batch_transferred}
+            if operation != "copy":
+                deltas[source_group_id] = -batch_transferred
+            bump_group_versions_by_delta(deltas)
+        db.session.commit()
+
+        scanned += count
+        transferred += batch_transferred
+        after = upper
+        if progress:
+            progress(after, scanned, transferred, scanned - transferred)
+
+    result = {"scanned": scanned, "transferred": transferred, "skipped": scanned - transferred}
+    if operation != "merge":
+        return result
+
+    # Step 4: Merge: delete the customers left in the source (already in the target) in batches, then the group
+    delete_progress = (lambda deleted: progress(after, scanned, transferred, scanned - transferred)) if progress else None
+    deleted = delete_rows_in_batches(customers, customers.c.group_id == source_group_id, batch_size, progress=delete_progress)
+    db.session.execute(delete(Group).where(Group.group_id == source_group_id).execution_options(synchronize_session=False))
+    bump_user_groups_version(admins[source_group_id])
+    db.session.commit()
+    listing_cache.invalidate("customers", source_group_id)
+    return {**result, "deleted": deleted}
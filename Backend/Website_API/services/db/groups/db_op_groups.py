@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from services.db.versions.db_op_versions import bump_user_groups_version
 
 def add_new_group(group_admin_id: int, group_name: str, group_description: str) -> dict:
     """
@@ -43,5 +44,6 @@ def add_new_group(group_admin_id: int, group_name: str, group_description: str)
         created_at_time=datetime.now().time()
     )
     db.session.add(new_group)
+    bump_user_groups_version(group_admin_id)
     db.session.commit()
     return new_group.to_dict()
\ No newline at end of file
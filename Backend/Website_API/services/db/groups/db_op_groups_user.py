@@ -1,20 +1,55 @@
-def get_groups_of_user_by_user_id_sorted(user_id: int, sort: str, order: str) -> [dict]:
+# Fields of a group returned by the list endpoints (the keys of `Group.to_dict`)
+GROUP_FIELDS = ["group_id", "group_admin_id", "group_name", "group_description", "created_at", "created_at_time"]
+
+
+def get_groups_of_user_by_user_id_sorted(user_id: int, sort: str, order: str, fields: list = None) -> [dict]:
     """
     Retrieves groups of a user by user_id and sorts them based on the specified field and order.
 
+    Only the requested columns are selected, as plain rows that are turned into dictionaries directly
+    instead of loading Group objects.
+
     Args:
         user_id (int): The ID of the user whose groups are to be retrieved.
         sort (str): The field by which the results should be sorted ('group_name', 'group_description', 'created_at').
         order (str): The sorting order ('high_to_low' or 'low_to_high').
+        fields (list, optional): The fields of every group (a sparse fieldset), in this order.
+                    Allowed values: the names in `GROUP_FIELDS`. Defaults to all of them.
 
     Returns:
         list[dict]: A list of dictionaries representing the groups, sorted as requested.
 
     Raises:
-        ValueError: If the provided sort field or order is invalid.
+        ValueError: If the provided sort field, order, or fields are invalid.
     """
-    from models.group_model import Group, db
-    from sqlalchemy import desc, asc
+    from models.group_model import db
+
+    statement, fields = groups_of_user_statement(user_id, sort, order, fields)
+    rows = db.session.execute(statement).all()
+
+    # Convert rows to a list of dictionaries
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def groups_of_user_statement(user_id: int, sort: str, order: str, fields: list = None) -> tuple:
+    """
+    Builds the SELECT of `get_groups_of_user_by_user_id_sorted`, so the same query is executed
+    by the Flask API (with the session) and by the ASGI mode (with the async engine).
+
+    Args:
+        user_id (int): The ID of the user.
+        sort (str): 'group_name', 'group_description' or 'created_at'.
+        order (str): 'high_to_low' or 'low_to_high'.
+        fields (list, optional): The fields of every group. Defaults to all of them.
+
+    Returns:
+        tuple: The statement and the fields.
+
+    Raises:
+        ValueError: If the provided sort field, order, or fields are invalid.
+    """
+    from models.group_model import Group
+    from sqlalchemy import desc, asc, select
 
     # Validate sort field to prevent SQL injection
     valid_sort_fields = ['group_name', 'created_at', 'group_description']
@@ -26,27 +61,22 @@ def get_groups_of_user_by_user_id_sorted(user_id: int, sort: str, order: str) ->
     if order not in valid_orders:
         raise ValueError(f"Invalid order: '{order}'. Must be one of {valid_orders}.")
 
+    # Validate fields
+    fields = fields or GROUP_FIELDS
+    invalid_fields = [field for field in fields if field not in GROUP_FIELDS]
+    if invalid_fields:
+        raise ValueError(f"Invalid fields: {invalid_fields}. Must be in {GROUP_FIELDS}.")
+
     # Determine the sorting order
     sort_order = desc if order == 'high_to_low' else asc
 
+    statement = select(*[getattr(Group, field) for field in fields]).where(Group.group_admin_id == user_id)
+
     # Sorting logic
     if sort == 'created_at':
         # Sort by both date and time
-        groups = (
-            db.session.query(Group)
-            .filter(Group.group_admin_id == user_id)
-            .order_by(sort_order(Group.created_at), sort_order(Group.created_at_time))
-            .all()
-        )
+        statement = statement.order_by(sort_order(Group.created_at), sort_order(Group.created_at_time))
     else:
         # Sort by the specified field
-        groups = (
-            db.session.query(Group)
-            .filter(Group.group_admin_id == user_id)
-            .order_by(sort_order(getattr(Group, sort)))
-            .all()
-        )
-
-    # Convert groups to a list of dictionaries using to_dict
-    return [group.to_dict() for group in groups]
-    
\ No newline at end of file
+        statement = statement.order_by(sort_order(getattr(Group, sort)))
+    return statement, fields
@@ -0,0 +1,302 @@
+import os
+from datetime import date, datetime, timedelta
+from dotenv import load_dotenv
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Seconds without progress report after which a running job is considered abandoned by its worker (e.g. killed)
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+
+# Number of times a job is started before an abandoned job is marked as failed
+MAX_JOB_ATTEMPTS = int(os.getenv("MAX_JOB_ATTEMPTS", "3"))
+
+# Statuses of a job, the last three are final
+JOB_STATUSES = ["queued", "running", "succeeded", "failed", "cancelled"]
+FINAL_JOB_STATUSES = ["succeeded", "failed", "cancelled"]
+
+
+def create_job(kind: str, params: dict, owner_id: int = None) -> dict:
+    """
+    Queues a new job, to be run by the next free worker (`flask --app app jobs-worker`).
+
+    Args:
+        kind (str): The kind of the job, a key of `JOB_HANDLERS`.
+        params (dict): The parameters of the handler (JSON-serializable).
+        owner_id (int, optional): The ID of the user who created the job.
+
+    Returns:
+        dict: A dictionary representation of the new job.
+
+    Raises:
+        ValueError: If the kind is invalid.
+    """
+    from models.job_model import Job, db
+    from services.jobs.job_handlers import JOB_HANDLERS
+
+    # Validate kind
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Invalid kind: '{kind}'. Must be one of {list(JOB_HANDLERS)}.")
+
+    new_job = Job(
+        kind=kind,
+        params=params,
+        owner_id=owner_id,
+        status='queued',
+        created_at=date.today(),
+        created_at_time=datetime.now().time()
+    )
+    db.session.add(new_job)
+    db.session.commit()
+    return new_job.to_dict()
+
+
+def get_unfinished_job(kind: str, params: dict, owner_id: int = None) -> dict | None:
+    """
+    Finds a queued or running job of a kind whose parameters include the given ones, so the same work
+    (e.g. the deletion of a group) is not queued twice.
+
+    Args:
+        kind (str): The kind of the job.
+        params (dict): The parameters the job must have.
+        owner_id (int, optional): The ID of the user who created the job.
+
+    Returns:
+        dict | None: A dictionary representation of the job, or None if there is none.
+    """
+    from models.job_model import Job
+
+    # The unfinished jobs of an owner are few, their parameters are compared here rather than in JSON SQL
+    jobs = Job.query.filter(Job.kind == kind, Job.owner_id == owner_id, Job.status.in_(['queued', 'running']))
+    for job in jobs.order_by(Job.job_id):
+        if all(job.params.get(key) == value for key, value in params.items()):
+            return job.to_dict()
+    return None
+
+
+def get_job_by_job_id(job_id: int):
+    """
+    Retrieves a job from the database by its job_id.
+
+    Args:
+        job_id (int): The ID of the job to be retrieved.
+
+    Returns:
+        Job | None: The job object if found, otherwise None.
+    """
+    from models.job_model import Job
+    return Job.query.get(job_id)
+
+
+def cancel_job_by_job_id(job_id: int):
+    """
+    Cancels a job: a queued job is cancelled at once, a running job stops at its next progress report.
+
+    Args:
+        job_id (int): The ID of the job to be cancelled.
+
+    Returns:
+        dict: A dictionary representation of the job if it was cancelled or is being cancelled.
+        tuple: An error message and HTTP status code (404 if the job is not found, 409 if it is already finished).
+    """
+    from models.job_model import Job, db
+
+    # Step 1: Query the job from the database by job_id, locked so a worker cannot claim it meanwhile
+    job = Job.query.filter_by(job_id=job_id).with_for_update().first()
+
+    # Step 2: Check if the job exists and is not finished
+    if not job:
+        db.session.rollback()
+        return {"message": "Job not found for the given job_id."}, 404
+    if job.status in FINAL_JOB_STATUSES:
+        db.session.rollback()
+        return {"message": f"The job is already {job.status}."}, 409
+
+    # Step 3: Cancel it, or ask its worker to
+    if job.status == 'queued':
+        job.status = 'cancelled'
+        job.finished_at = datetime.now()
+    else:
+        job.cancel_requested = True
+
+    # Step 4: Commit the changes to the database
+    db.session.commit()
+    return job.to_dict()
+
+
+def claim_next_job(worker: str) -> dict | None:
+    """
+    Claims the oldest queued job for a worker.
+
+    The job row is locked with `FOR UPDATE SKIP LOCKED`, so concurrent workers never claim the same job and
+    never wait for each other: a worker skips the rows locked by the others and takes the next one.
+
+    Args:
+        worker (str): The name of the worker (host and pid).
+
+    Returns:
+        dict | None: `{'job_id', 'kind', 'params', 'checkpoint'}` of the claimed job, or None if no job is queued.
+    """
+    from models.job_model import Job, db
+    from sqlalchemy import update
+
+    while True:
+        job_id = (
+            db.session.query(Job.job_id)
+            .filter_by(status='queued')
+            .order_by(Job.job_id)
+            .with_for_update(skip_locked=True)
+            .limit(1)
+            .scalar()
+        )
+        if job_id is None:
+            db.session.commit()
+            return None
+
+        # The status is checked again, so a job is never claimed twice where rows cannot be locked (e.g. SQLite)
+        now = datetime.now()
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.job_id == job_id, Job.status == 'queued')
+            .values(status='running', worker=worker, attempts=Job.attempts + 1,
+                    started_at=db.func.coalesce(Job.started_at, now), heartbeat_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if claimed:
+            job = db.session.query(Job.kind, Job.params, Job.checkpoint).filter(Job.job_id == job_id).one()
+            db.session.commit()
+            return {"job_id": job_id, "kind": job.kind, "params": job.params, "checkpoint": job.checkpoint}
+        db.session.commit()
+
+
+def owned_by(worker: str) -> list:
+    """
+    Builds the conditions of the writes of a worker to its job: the job is still running and still claimed by the
+    worker. A job requeued by `requeue_abandoned_jobs` (and maybe claimed by another worker) no longer matches.
+
+    Args:
+        worker (str): The name of the worker.
+
+    Returns:
+        list: The SQLAlchemy conditions.
+    """
+    from models.job_model import Job
+    return [Job.worker == worker, Job.status == 'running']
+
+
+def report_job_progress(job_id: int, worker: str, done: int, total: int = None, checkpoint: dict = None) -> bool | None:
+    """
+    Stores the progress (and checkpoint) of a running job and refreshes its heartbeat.
+
+    Args:
+        job_id (int): The ID of the job.
+        worker (str): The name of the worker running the job.
+        done (int): The units of work done.
+        total (int, optional): The units of work of the whole job, None if unknown.
+        checkpoint (dict, optional): Where the handler resumes if the job is interrupted, kept if None.
+
+    Returns:
+        bool | None: True if the cancellation of the job was requested, None if the worker lost the job
+                     (it was requeued after JOB_LEASE_SECONDS without report).
+    """
+    from models.job_model import Job, db
+    from sqlalchemy import update
+
+    values = {"done": done, "total": total, "heartbeat_at": datetime.now()}
+    if checkpoint is not None:
+        values["checkpoint"] = checkpoint
+    reported = db.session.execute(
+        update(Job)
+        .where(Job.job_id == job_id, *owned_by(worker))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not reported:
+        db.session.commit()
+        return None
+    cancel_requested = db.session.query(Job.cancel_requested).filter(Job.job_id == job_id).scalar()
+    db.session.commit()
+    return bool(cancel_requested)
+
+
+def finish_job(job_id: int, worker: str, status: str, result: dict = None, error: str = None) -> bool:
+    """
+    Marks a job as finished, unless the worker lost it (see `report_job_progress`).
+
+    Args:
+        job_id (int): The ID of the job.
+        worker (str): The name of the worker running the job.
+        status (str): 'succeeded', 'failed' or 'cancelled'.
+        result (dict, optional): The result of the handler.
+        error (str, optional): The error of a failed job.
+
+    Returns:
+        bool: False if the worker lost the job, which was left as it is.
+
+    Raises:
+        ValueError: If the status is invalid.
+    """
+    from models.job_model import Job, db
+    from sqlalchemy import update
+
+    # Validate status
+    if status not in FINAL_JOB_STATUSES:
+        raise ValueError(f"Invalid status: '{status}'. Must be one of {FINAL_JOB_STATUSES}.")
+
+    finished = db.session.execute(
+        update(Job)
+        .where(Job.job_id == job_id, *owned_by(worker))
+        .values(status=status, result=result, error=error[:500] if error else None, finished_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return bool(finished)
+
+
+def release_job(job_id: int, worker: str) -> None:
+    """
+    Puts a running job back in the queue (its worker is stopping), it resumes from its checkpoint.
+
+    Args:
+        job_id (int): The ID of the job.
+        worker (str): The name of the worker running the job.
+    """
+    from models.job_model import Job, db
+    from sqlalchemy import update
+
+    db.session.execute(
+        update(Job)
+        .where(Job.job_id == job_id, *owned_by(worker))
+        .values(status='queued', worker=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def requeue_abandoned_jobs() -> dict:
+    """
+    Requeues the running jobs whose worker stopped reporting for JOB_LEASE_SECONDS (it was killed, or its
+    machine went down), or marks them as failed after MAX_JOB_ATTEMPTS attempts.
+
+    Returns:
+        dict: `{'requeued': int, 'failed': int}`.
+    """
+    from models.job_model import Job, db
+    from sqlalchemy import update
+
+    now = datetime.now()
+    abandoned = [Job.status == 'running', Job.heartbeat_at < now - timedelta(seconds=JOB_LEASE_SECONDS)]
+    failed = db.session.execute(
+        update(Job)
+        .where(*abandoned, Job.attempts >= MAX_JOB_ATTEMPTS)
+        .values(status='failed', error="The job was abandoned by its worker too many times.", finished_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    requeued = db.session.execute(
+        update(Job)
+        .where(*abandoned)
+        .values(status='queued', worker=None)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return {"requeued": requeued, "failed": failed}
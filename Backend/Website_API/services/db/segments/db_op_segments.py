@@ -0,0 +1,115 @@
+import json
+import threading
+from time import monotonic
+from services.segments.segment_compiler import compile_conditions
+
+# Planner estimates per segment, keyed by the canonical JSON of the segment: {key: (expires_at, estimate)}
+_estimate_cache = {}
+_estimate_cache_lock = threading.Lock()
+ESTIMATE_CACHE_TTL = 60
+ESTIMATE_CACHE_SIZE = 1024
+
+# Columns returned when listing the customers of a segment
+SEGMENT_CUSTOMER_COLUMNS = ["customer_id", "group_id", "first_name", "last_name", "email", "country", "city", "birthday"]
+
+
+def build_segment_query(segment: dict, columns: list):
+    """
+    Compiles a segment into a single SELECT over customers joined with their groups.
+
+    Args:
+        segment (dict): A valid segment definition (see `validate_segment`).
+        columns (list): The columns or expressions to select.
+
+    Returns:
+        Select: The SQLAlchemy statement.
+
+    Raises:
+        ValueError: If the segment is invalid.
+    """
+    from models.customer_model import Customer
+    from models.group_model import Group
+    from sqlalchemy import select
+
+    customers_of_groups = Customer.__table__.join(Group.__table__, Customer.group_id == Group.group_id)
+    return select(*columns).select_from(customers_of_groups).where(*compile_conditions(segment))
+
+
+def count_segment_customers(segment: dict) -> int:
+    """
+    Counts the customers of a segment without fetching any row (count-only fast path).
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        int: The exact number of customers in the segment.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import func
+
+    return db.session.execute(build_segment_query(segment, [func.count(Customer.customer_id)])).scalar()
+
+
+def estimate_segment_size(segment: dict) -> int:
+    """
+    Estimates the number of customers of a segment from the query planner, without running the query.
+
+    Estimates are cached per segment for `ESTIMATE_CACHE_TTL` seconds, so targeting screens can call this
+    on every change of the segment for free.
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        int: The estimated number of customers in the segment.
+    """
+    from models.customer_model import Customer, db
+
+    key = json.dumps(segment, sort_keys=True)
+    cached = _estimate_cache.get(key)
+    if cached and cached[0] > monotonic():
+        return cached[1]
+
+    statement = build_segment_query(segment, [Customer.customer_id])
+    compiled = statement.compile(dialect=db.engine.dialect, compile_kwargs={"render_postcompile": True})
+    plan = db.session.connection().exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    # Keep the cache bounded, expired entries go first and the oldest entries after them
+    with _estimate_cache_lock:
+        if len(_estimate_cache) >= ESTIMATE_CACHE_SIZE:
+            now = monotonic()
+            for cached_key in [cached_key for cached_key, (expires_at, _) in _estimate_cache.items() if expires_at <= now]:
+                del _estimate_cache[cached_key]
+            while len(_estimate_cache) >= ESTIMATE_CACHE_SIZE:
+                del _estimate_cache[next(iter(_estimate_cache))]
+        _estimate_cache[key] = (monotonic() + ESTIMATE_CACHE_TTL, estimate)
+    return estimate
+
+
+def get_segment_customers(segment: dict, after: int = 0, limit: int = 100) -> list:
+    """
+    Retrieves a page of the customers of a segment, ordered by customer_id (keyset pagination).
+
+    Args:
+        segment (dict): A valid segment definition.
+        after (int, optional): Only customers with a greater customer_id are returned. Defaults to 0.
+        limit (int, optional): The maximum number of customers to return. Defaults to 100.
+
+    Returns:
+        list[dict]: The customers of the page.
+    """
+    from models.customer_model import Customer, db
+
+    columns = [getattr(Customer, column) for column in SEGMENT_CUSTOMER_COLUMNS]
+    statement = (
+        build_segment_query(segment, columns)
+        .where(Customer.customer_id > after)
+        .order_by(Customer.customer_id)
+        .limit(limit)
+    )
+
+    return [dict(zip(SEGMENT_CUSTOMER_COLUMNS, row)) for row in db.session.execute(statement)]
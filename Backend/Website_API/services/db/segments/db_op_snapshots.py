@@ -0,0 +1,179 @@
+from array import array
+from datetime import date, datetime
+from services.segments.customer_id_set import CustomerIdSet, CODEC_VERSION
+from services.db.segments.db_op_segments import build_segment_query
+
+# Number of ids fetched from the database cursor at a time while materializing a segment
+MATERIALIZE_FETCH_SIZE = 10000
+
+
+def get_snapshot_by_snapshot_id(snapshot_id: int):
+    """
+    Retrieves a segment snapshot from the database by its snapshot_id.
+
+    Args:
+        snapshot_id (int): The ID of the snapshot to be retrieved.
+
+    Returns:
+        SegmentSnapshot | None: The snapshot object if found, otherwise None.
+    """
+    from models.segment_snapshot_model import SegmentSnapshot
+    return SegmentSnapshot.query.get(snapshot_id)
+
+
+def load_snapshot_customer_ids(snapshot) -> CustomerIdSet:
+    """
+    Decodes the customer ids of a snapshot.
+
+    Args:
+        snapshot (SegmentSnapshot): The snapshot.
+
+    Returns:
+        CustomerIdSet: The sorted customer ids of the snapshot.
+    """
+    return CustomerIdSet.from_bytes(snapshot.customer_ids)
+
+
+def save_snapshot(admin_id: int, customer_ids: CustomerIdSet, segment: dict = None) -> dict:
+    """
+    Stores a set of customer ids as a new snapshot.
+
+    Args:
+        admin_id (int): The ID of the user that owns the snapshot.
+        customer_ids (CustomerIdSet): The customer ids of the snapshot.
+        segment (dict, optional): The segment the ids come from.
+
+    Returns:
+        dict: A dictionary representation of the new snapshot.
+    """
+    from models.segment_snapshot_model import SegmentSnapshot, db
+
+    new_snapshot = SegmentSnapshot(
+        admin_id=admin_id,
+        segment=segment,
+        size=len(customer_ids),
+        codec_version=CODEC_VERSION,
+        customer_ids=customer_ids.to_bytes(),
+        created_at=date.today(),
+        created_at_time=datetime.now().time()
+    )
+    db.session.add(new_snapshot)
+    db.session.commit()
+    return new_snapshot.to_dict()
+
+
+def create_segment_snapshot(segment: dict) -> dict:
+    """
+    Evaluates a segment once and materializes its customer ids into a snapshot.
+
+    The ids are streamed from a server-side cursor in customer_id order, straight into a compact array,
+    so no ORM object or per-row dictionary is created even for millions of customers.
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        dict: A dictionary representation of the new snapshot.
+    """
+    from models.customer_model import Customer, db
+
+    statement = (
+        build_segment_query(segment, [Customer.customer_id])
+        .order_by(Customer.customer_id)
+        .execution_options(stream_results=True)
+    )
+
+    ids = array("I")
+    for partition in db.session.execute(statement).scalars().partitions(MATERIALIZE_FETCH_SIZE):
+        ids.extend(partition)
+
+    return save_snapshot(segment["admin_id"], CustomerIdSet(ids), segment)
+
+
+def combine_snapshots(left, right, operation: str) -> dict:
+    """
+    Combines two snapshots of the same admin into a new snapshot, in memory.
+
+    Args:
+        left (SegmentSnapshot): The first snapshot.
+        right (SegmentSnapshot): The second snapshot.
+        operation (str): The set operation.
+                    Allowed values: 'union', 'intersect', 'exclude' (the ids of `left` that are not in `right`).
+
+    Returns:
+        dict: A dictionary representation of the new snapshot.
+
+    Raises:
+        ValueError: If the provided operation is invalid.
+    """
+    # Validate operation
+    valid_operations = ['union', 'intersect', 'exclude']
+    if operation not in valid_operations:
+        raise ValueError(f"Invalid operation: '{operation}'. Must be one of {valid_operations}.")
+
+    left_ids = load_snapshot_customer_ids(left)
+    right_ids = load_snapshot_customer_ids(right)
+
+    if operation == 'union':
+        customer_ids = left_ids.union(right_ids)
+    elif operation == 'intersect':
+        customer_ids = left_ids.intersection(right_ids)
+    else:
+        customer_ids = left_ids.difference(right_ids)
+
+    return save_snapshot(left.admin_id, customer_ids)
+
+
+def iter_snapshot_customers(snapshot_id: int, chunk_size: int = 1000, after: int = 0):
+    """
+    Iterates over the customers of a snapshot in chunks, in customer_id order, for the send engine.
+
+    The snapshot fixes who receives the campaign: retries and resumed sends see exactly the same recipients.
+    Customers deleted after the snapshot was taken are skipped.
+
+    Args:
+        snapshot_id (int): The ID of the snapshot.
+        chunk_size (int, optional): The number of customers per chunk. Defaults to 1000.
+        after (int, optional): Resume after this customer_id (e.g. the last one of a checkpoint). Defaults to 0.
+
+    Yields:
+        list[dict]: The customers of the chunk (`customer_id`, `email`, `email_key`, `first_name`, `last_name`, `group_id`).
+    """
+    from models.customer_model import Customer, db
+
+    snapshot = get_snapshot_by_snapshot_id(snapshot_id)
+    if not snapshot:
+        return
+    customer_ids = load_snapshot_customer_ids(snapshot)
+
+    columns = [Customer.customer_id, Customer.email, Customer.email_key, Customer.first_name, Customer.last_name, Customer.group_id]
+    keys = ["customer_id", "email", "email_key", "first_name", "last_name", "group_id"]
+    start = customer_ids.after(after)
+    for position in range(start, len(customer_ids), chunk_size):
+        chunk = customer_ids.slice(position, position + chunk_size)
+        rows = (
+            db.session.query(*columns)
+            .filter(Customer.customer_id.in_(chunk))
+            .order_by(Customer.customer_id)
+            .all()
+        )
+        yield [dict(zip(keys, row)) for row in rows]
+
+
+def delete_snapshot_by_snapshot_id(snapshot_id: int):
+    """
+    Deletes a segment snapshot from the database by its `snapshot_id`.
+
+    Args:
+        snapshot_id (int): The ID of the snapshot to be deleted.
+
+    Returns:
+        tuple: A response dictionary with a message and an HTTP status code.
+    """
+    from models.segment_snapshot_model import SegmentSnapshot, db
+
+    deleted = SegmentSnapshot.query.filter_by(snapshot_id=snapshot_id).delete()
+    db.session.commit()
+    if not deleted:
+        return {"message": "Snapshot not found for the given snapshot_id."}, 404
+    return {"message": "Snapshot successfully deleted."}, 200
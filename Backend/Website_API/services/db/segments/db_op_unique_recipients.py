@@ -0,0 +1,162 @@
+import heapq
+from array import array
+from services.segments.customer_id_set import CustomerIdSet
+from services.db.segments.db_op_segments import build_segment_query, estimate_segment_size
+from services.db.segments.db_op_snapshots import save_snapshot
+
+# Number of customers per hash partition: every partition is deduplicated by its own query, so the sort (or hash
+# aggregate) of the database stays around this size whatever the size of the segment
+DEDUP_PARTITION_SIZE = 1000000
+
+# Number of rows fetched from the database cursor at a time
+RECIPIENT_FETCH_SIZE = 10000
+
+# Columns of the recipients, the same as `iter_snapshot_customers`
+RECIPIENT_COLUMNS = ["customer_id", "email", "email_key", "first_name", "last_name", "group_id"]
+
+
+def count_dedup_partitions(segment: dict) -> int:
+    """
+    Chooses the number of hash partitions of a segment from its estimated size (see `estimate_segment_size`).
+
+    Only PostgreSQL partitions (by `hashtext(email_key)`), other databases deduplicate in a single pass.
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        int: The number of partitions, at least 1.
+    """
+    from extensions import db
+
+    if db.engine.dialect.name != "postgresql":
+        return 1
+    return max(1, -(-estimate_segment_size(segment) // DEDUP_PARTITION_SIZE))
+
+
+def in_dedup_partition(partition: int, partitions: int):
+    """
+    Builds the condition selecting the customers of one hash partition. A canonical email always falls in the same
+    partition, so the partitions can be deduplicated independently.
+
+    Args:
+        partition (int): The partition, from 0 to `partitions - 1`.
+        partitions (int): The number of partitions.
+
+    Returns:
+        The SQLAlchemy condition (True for a single partition).
+    """
+    from models.customer_model import Customer
+    from sqlalchemy import func, true
+
+    if partitions == 1:
+        return true()
+    # hashtext is signed, the mask keeps the modulo non-negative
+    return func.hashtext(Customer.email_key).op("&")(0x7FFFFFFF) % partitions == partition
+
+
+def iter_unique_recipients(segment: dict, chunk_size: int = 1000, partitions: int = None):
+    """
+    Iterates over the customers of a segment with one customer per canonical email, in chunks, for the send engine.
+
+    The same person is often a customer of several groups of the admin (in the same or in different spellings of
+    the address). Only the first customer (lowest customer_id) of every `email_key` is kept, so one person
+    receives one copy of a campaign.
+
+    The deduplication runs in the database: on PostgreSQL with `SELECT DISTINCT ON (email_key)` per hash
+    partition of the emails, elsewhere with one stream sorted by email_key whose repeated keys are skipped here.
+    The rows are streamed from a server-side cursor, so memory stays bounded by `chunk_size` whatever the
+    size of the segment.
+
+    Args:
+        segment (dict): A valid segment definition.
+        chunk_size (int, optional): The number of recipients per chunk. Defaults to 1000.
+        partitions (int, optional): The number of hash partitions. Defaults to `count_dedup_partitions(segment)`.
+
+    Yields:
+        list[dict]: The recipients of the chunk, ordered by email_key within a partition.
+    """
+    from models.customer_model import Customer, db
+
+    columns = [getattr(Customer, column) for column in RECIPIENT_COLUMNS]
+    distinct_on = db.engine.dialect.name == "postgresql"
+    if partitions is None:
+        partitions = count_dedup_partitions(segment)
+
+    chunk = []
+    for partition in range(partitions):
+        statement = (
+            build_segment_query(segment, columns)
+            .where(in_dedup_partition(partition, partitions))
+            .order_by(Customer.email_key, Customer.customer_id)
+            .execution_options(stream_results=True)
+        )
+        if distinct_on:
+            statement = statement.distinct(Customer.email_key)
+
+        last_email_key = None
+        for rows in db.session.execute(statement).partitions(RECIPIENT_FETCH_SIZE):
+            for row in rows:
+                if row.email_key == last_email_key:
+                    continue
+                last_email_key = row.email_key
+                chunk.append(dict(zip(RECIPIENT_COLUMNS, row)))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+def count_unique_recipients(segment: dict) -> int:
+    """
+    Counts the canonical emails of a segment (`COUNT(DISTINCT email_key)`), the number of copies of a campaign.
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        int: The exact number of unique recipients of the segment.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import func
+
+    return db.session.execute(build_segment_query(segment, [func.count(Customer.email_key.distinct())])).scalar()
+
+
+def create_unique_recipients_snapshot(segment: dict) -> dict:
+    """
+    Evaluates a segment once and materializes the customer ids of its unique recipients into a snapshot
+    (see `iter_unique_recipients`), so the send engine iterates, retries and resumes them with
+    `iter_snapshot_customers` like any snapshot.
+
+    Every partition keeps the lowest customer_id of each email (`MIN(customer_id) ... GROUP BY email_key`), in
+    customer_id order. The sorted ids of the partitions are merged into one compact array (4 bytes per recipient).
+
+    Args:
+        segment (dict): A valid segment definition.
+
+    Returns:
+        dict: A dictionary representation of the new snapshot.
+    """
+    from models.customer_model import Customer, db
+    from sqlalchemy import func
+
+    first_customer_id = func.min(Customer.customer_id)
+    partitions = count_dedup_partitions(segment)
+    partition_ids = []
+    for partition in range(partitions):
+        statement = (
+            build_segment_query(segment, [first_customer_id])
+            .where(in_dedup_partition(partition, partitions))
+            .group_by(Customer.email_key)
+            .order_by(first_customer_id)
+            .execution_options(stream_results=True)
+        )
+        ids = array("I")
+        for rows in db.session.execute(statement).scalars().partitions(RECIPIENT_FETCH_SIZE):
+            ids.extend(rows)
+        partition_ids.append(ids)
+
+    customer_ids = partition_ids[0] if partitions == 1 else array("I", heapq.merge(*partition_ids))
+    return save_snapshot(segment["admin_id"], CustomerIdSet(customer_ids), {**segment, "unique": True})
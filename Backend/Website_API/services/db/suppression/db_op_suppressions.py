@@ -0,0 +1,116 @@
+from datetime import date, datetime
+from services.suppression.email_hash import hash_email
+
+# Valid reasons of a suppression
+SUPPRESSION_REASONS = ["unsubscribe", "bounce", "complaint", "manual"]
+
+
+def add_suppressions(group_admin_id: int | None, entries: list, reason: str, commit: bool = True) -> int:
+    """
+    Adds suppressions with a single multi-row insert.
+
+    Args:
+        group_admin_id (int | None): The admin the addresses are suppressed for, None for every admin.
+        entries (list): A list of tuples `(email, customer_id)`, customer_id may be None.
+        reason (str): The reason of the suppressions.
+                    Allowed values: 'unsubscribe', 'bounce', 'complaint', 'manual'.
+        commit (bool, optional): Commit the insert. Defaults to True, False leaves it in the transaction of the caller.
+
+    Returns:
+        int: The number of added suppressions.
+
+    Raises:
+        ValueError: If the provided reason is invalid.
+    """
+    from models.suppression_model import Suppression, db
+
+    # Validate reason
+    if reason not in SUPPRESSION_REASONS:
+        raise ValueError(f"Invalid reason: '{reason}'. Must be one of {SUPPRESSION_REASONS}.")
+
+    if not entries:
+        return 0
+
+    today = date.today()
+    now = datetime.now().time()
+    rows = [
+        {"group_admin_id": group_admin_id, "customer_id": customer_id, "email": email, "email_hash": hash_email(email),
+         "reason": reason, "created_at": today, "created_at_time": now}
+        for email, customer_id in entries
+    ]
+    db.session.execute(Suppression.__table__.insert(), rows)
+    if commit:
+        db.session.commit()
+    return len(rows)
+
+
+def add_suppressions_by_customer_ids(group_admin_id: int, customer_ids: list, reason: str) -> int:
+    """
+    Suppresses customers of an admin, by their ids. Ids of customers that do not belong to the admin are ignored.
+
+    Args:
+        group_admin_id (int): The admin the customers belong to.
+        customer_ids (list): The ids of the customers.
+        reason (str): The reason of the suppressions.
+
+    Returns:
+        int: The number of added suppressions.
+    """
+    from models.customer_model import Customer, db
+    from models.group_model import Group
+
+    rows = (
+        db.session.query(Customer.email, Customer.customer_id)
+        .join(Group, Customer.group_id == Group.group_id)
+        .filter(Group.group_admin_id == group_admin_id, Customer.customer_id.in_(set(customer_ids)))
+        .all()
+    )
+    return add_suppressions(group_admin_id, [(email, customer_id) for email, customer_id in rows], reason)
+
+
+def get_suppressions_after(group_admin_id: int, after: int, limit: int = 10000) -> list:
+    """
+    Retrieves the suppressions that apply to an admin (their own and the global ones), in suppression_id order.
+
+    Used both for incremental refreshes of the send workers and for pagination.
+
+    Args:
+        group_admin_id (int): The admin.
+        after (int): Only suppressions with a greater suppression_id are returned.
+        limit (int, optional): The maximum number of suppressions. Defaults to 10000.
+
+    Returns:
+        list[Row]: Rows with `suppression_id`, `group_admin_id`, `customer_id`, `email`, `email_hash` and `reason`.
+    """
+    from models.suppression_model import Suppression, db
+    from sqlalchemy import or_
+
+    return (
+        db.session.query(Suppression.suppression_id, Suppression.group_admin_id, Suppression.customer_id,
+                         Suppression.email, Suppression.email_hash, Suppression.reason)
+        .filter(or_(Suppression.group_admin_id == group_admin_id, Suppression.group_admin_id.is_(None)))
+        .filter(Suppression.suppression_id > after)
+        .order_by(Suppression.suppression_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_amount_of_suppressions(group_admin_id: int) -> int:
+    """
+    Counts the suppressions that apply to an admin.
+
+    Args:
+        group_admin_id (int): The admin.
+
+    Returns:
+        int: The number of suppressions.
+    """
+    from models.suppression_model import Suppression, db
+    from sqlalchemy import func, or_
+
+    return (
+        db.session.query(func.count(Suppression.suppression_id))
+        .filter(or_(Suppression.group_admin_id == group_admin_id, Suppression.group_admin_id.is_(None)))
+        .scalar()
+    )
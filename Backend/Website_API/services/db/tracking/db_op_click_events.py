@@ -0,0 +1,29 @@
+from datetime import datetime
+from services.db.analytics.db_op_rollups import add_events_to_rollups
+
+
+def insert_click_events(events: list) -> int:
+    """
+    Inserts a batch of click events into the database with a single multi-row insert,
+    and adds them to the campaign rollups in the same transaction.
+
+    This function is called by the click-events flusher thread, never from a request.
+
+    Args:
+        events (list): A list of tuples `(campaign_id, customer_id, link_index, device_code, clicked_at_timestamp)`.
+
+    Returns:
+        int: The number of inserted events.
+    """
+    from models.click_event_model import ClickEvent, db
+
+    rows = [
+        {"campaign_id": campaign_id, "customer_id": customer_id, "link_index": link_index, "device_code": device_code, "clicked_at": datetime.utcfromtimestamp(timestamp)}
+        for campaign_id, customer_id, link_index, device_code, timestamp in events
+    ]
+
+    # One transaction and one executemany for the whole batch
+    with db.engine.begin() as connection:
+        connection.execute(ClickEvent.__table__.insert(), rows)
+        add_events_to_rollups(connection, [(campaign_id, customer_id, device_code, timestamp) for campaign_id, customer_id, _, device_code, timestamp in events], "clicks")
+    return len(rows)
@@ -0,0 +1,30 @@
+from datetime import datetime
+from services.db.analytics.db_op_rollups import add_events_to_rollups
+
+
+def insert_open_events(events: list) -> int:
+    """
+    Inserts a batch of open events into the database with a single multi-row insert,
+    and adds them to the campaign rollups in the same transaction.
+
+    This function is called by the open-events flusher thread, never from a request. It uses
+    a Core insert on the engine instead of the ORM session, so no objects are created per event.
+
+    Args:
+        events (list): A list of tuples `(campaign_id, customer_id, device_code, opened_at_timestamp)`.
+
+    Returns:
+        int: The number of inserted events.
+    """
+    from models.open_event_model import OpenEvent, db
+
+    rows = [
+        {"campaign_id": campaign_id, "customer_id": customer_id, "device_code": device_code, "opened_at": datetime.utcfromtimestamp(timestamp)}
+        for campaign_id, customer_id, device_code, timestamp in events
+    ]
+
+    # One transaction and one executemany for the whole batch
+    with db.engine.begin() as connection:
+        connection.execute(OpenEvent.__table__.insert(), rows)
+        add_events_to_rollups(connection, events, "opens")
+    return len(rows)
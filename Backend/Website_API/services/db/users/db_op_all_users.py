@@ -1,25 +1,65 @@
-def get_all_users() -> list:
+# Fields of a user returned by the list endpoint (the keys of `User.to_dict`)
+USER_FIELDS = ["user_id", "first_name", "last_name", "email"]
+
+# Below this estimate the exact count is cheap enough, and the estimate of a small table is often off
+EXACT_COUNT_THRESHOLD = 100000
+
+
+def get_users_after(after: int = 0, limit: int = 100, email_prefix: str = None) -> list:
     """
-    Retrieves all users from the database.
+    Retrieves a page of users in user_id order (keyset pagination), optionally only the users whose email
+    starts with a prefix.
+
+    The page is read with `user_id > after ... LIMIT`, which walks the primary key index from the last user
+    of the previous page, so every page costs the same however deep it is (no OFFSET). The email prefix is
+    matched case-insensitively with LIKE on `lower(email)`, served by the `ix_users_email_lower_prefix` index.
+    Only the returned columns are selected (not the password).
+
+    Args:
+        after (int, optional): Only users with a greater user_id are returned. Defaults to 0 (the first page).
+        limit (int, optional): The maximum number of users. Defaults to 100.
+        email_prefix (str, optional): The beginning of the email, e.g. 'john'. Defaults to None (all users).
 
     Returns:
-        List: A list of all users in the database, or an empty list if no users exist.
+        list[dict]: The users, with the fields of `USER_FIELDS`.
     """
-    from models.user_model import User
-    users = User.query.all()  # Retrieve all users from the database
-    return [user.to_dict() for user in users]
+    from models.user_model import User, db
+    from sqlalchemy import func
+
+    query = db.session.query(*[getattr(User, field) for field in USER_FIELDS]).filter(User.user_id > after)
+    if email_prefix:
+        # Escape the LIKE wildcards so the prefix is matched literally
+        escaped = email_prefix.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+        query = query.filter(func.lower(User.email).like(escaped + "%", escape="/"))
+    rows = query.order_by(User.user_id).limit(limit).all()
+    return [dict(zip(USER_FIELDS, row)) for row in rows]
 
 
-def get_amount_of_users() -> int:
+def get_amount_of_users(estimate: bool = False) -> tuple:
     """
     Retrieve the total number of users in the database.
 
-    This function queries the 'users' table and counts the number of entries 
-    (i.e., the total number of users) using SQLAlchemy's session query 
-    method. It returns an integer representing the total count.
+    The exact count is a plain `SELECT count(user_id) FROM users`, which still reads the whole table (or its
+    primary key index). With `estimate`, the row estimate that PostgreSQL keeps in `pg_class.reltuples` (updated
+    by VACUUM / ANALYZE) is returned instead, without reading the table. The exact count is used when the
+    database is not PostgreSQL, when the table was never analyzed, or when the estimate is small enough to count.
+
+    Args:
+        estimate (bool, optional): Whether an approximate count is acceptable. Defaults to False.
 
     Returns:
-        int: The total number of users in the database.
+        tuple: The number of users and whether it is an estimate.
     """
     from models.user_model import User, db
-    return db.session.query(User).count()
\ No newline at end of file
+    from sqlalchemy import func, text
+
+    if estimate and db.engine.dialect.name == "postgresql":
+        reltuples = db.session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": User.__tablename__}
+        ).scalar()
+        # reltuples is -1 (PostgreSQL 14+) or 0 for a table that was never analyzed
+        if reltuples is not None and reltuples >= EXACT_COUNT_THRESHOLD:
+            return int(reltuples), True
+
+    return db.session.query(func.count(User.user_id)).scalar(), False
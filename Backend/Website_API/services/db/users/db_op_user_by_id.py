@@ -44,18 +44,21 @@ def change_user_col(user_id: int, new_input: str, input_type: str):
 
 def delete_user_by_user_id(user_id: int):
     """
-    This function deletes a user from the database by their user_id.
-    It checks if the user exists and then deletes them, committing the changes to the database.
+    This function queues the deletion of a user by their user_id, as a `delete_user` job that deletes their
+    groups and customers in batches, then the user (see `delete_user_in_batches`).
+    If the deletion of the user is already queued or running, it returns that job.
     If the user is not found, it returns a 404 error message.
     """
-    from models.user_model import User, db
+    from services.db.jobs.db_op_jobs import create_job, get_unfinished_job
     # Find the user by user_id
-    user_to_delete = User.query.get(user_id)
+    user_to_delete = get_user_by_user_id(user_id)
 
     if user_to_delete:
-        # Delete the user
-        db.session.delete(user_to_delete)
-        db.session.commit()
-        return {"message": "User successfully deleted"}, 200
+        # Queue the deletion of the user, once
+        params = {"user_id": user_id}
+        job = get_unfinished_job("delete_user", params, owner_id=user_id)
+        if not job:
+            job = create_job("delete_user", params, owner_id=user_id)
+        return {"message": "The deletion of the user is queued", "job": job}, 202
     else:
-        return {"message": "User not found"}, 404
\ No newline at end of file
+        return {"message": "User not found"}, 404
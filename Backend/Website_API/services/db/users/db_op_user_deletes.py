@@ -0,0 +1,54 @@
+from services.db.groups.db_op_group_deletes import DELETE_BATCH_SIZE, delete_rows_in_batches, delete_group_in_batches
+
+
+def delete_user_in_batches(user_id: int, batch_size: int = DELETE_BATCH_SIZE, progress=None) -> dict:
+    """
+    Deletes a user with their groups, customers and suppressions in batches, then the user.
+
+    The groups are deleted one after the other with `delete_group_in_batches`, so no transaction deletes more than
+    `batch_size` rows. The last rows of the user (e.g. segment snapshots) are deleted with the user by the
+    `ON DELETE CASCADE` of their foreign keys.
+
+    Args:
+        user_id (int): The ID of the user to be deleted.
+        batch_size (int, optional): The number of rows per statement. Defaults to DELETE_BATCH_SIZE.
+        progress (callable, optional): Called with the number of customers deleted so far after every batch
+                                       (of customers or of suppressions).
+
+    Returns:
+        dict: `{'groups': int, 'customers': int, 'suppressions': int}`, the number of rows deleted.
+
+    Raises:
+        ValueError: If the user does not exist.
+    """
+    from models.user_model import User, db
+    from models.group_model import Group
+    from models.suppression_model import Suppression
+    from sqlalchemy import delete
+
+    # Step 1: Check if the user exists
+    if db.session.query(User.user_id).filter(User.user_id == user_id).scalar() is None:
+        raise ValueError(f"User with user_id {user_id} does not exist.")
+
+    # Step 2: Delete the groups one by one, with their customers
+    group_ids = [group_id for (group_id,) in db.session.query(Group.group_id).filter(Group.group_admin_id == user_id).order_by(Group.group_id)]
+    db.session.commit()
+    customers = 0
+    for group_id in group_ids:
+        group_progress = (lambda deleted, before=customers: progress(before + deleted)) if progress else None
+        try:
+            customers += delete_group_in_batches(group_id, batch_size, group_progress)["customers"]
+        except ValueError:
+            # The group was deleted meanwhile (e.g. by the job of its own deletion)
+            continue
+
+    # Step 3: Delete the suppressions of the user
+    suppressions = Suppression.__table__
+    suppressions_progress = (lambda deleted: progress(customers)) if progress else None
+    suppressions_deleted = delete_rows_in_batches(suppressions, suppressions.c.group_admin_id == user_id, batch_size,
+                                                  progress=suppressions_progress)
+
+    # Step 4: Delete the user
+    db.session.execute(delete(User).where(User.user_id == user_id).execution_options(synchronize_session=False))
+    db.session.commit()
+    return {"groups": len(group_ids), "customers": customers, "suppressions": suppressions_deleted}
@@ -0,0 +1,130 @@
+from services.cache.listing_cache import listing_cache
+
+
+def bump_group_versions(group_ids, customer_delta: int = 0) -> None:
+    """
+    Increments the version of groups whose customers (or details) changed, in the current transaction,
+    and drops their cached customers listings.
+
+    The caller commits, so the new version (and customer count) becomes visible together with the change it describes.
+
+    Args:
+        group_ids (iterable): The IDs of the groups.
+        customer_delta (int, optional): The number of customers added to (or removed from, if negative)
+                                        each of the groups. Defaults to 0.
+    """
+    from models.group_model import Group, db
+    from sqlalchemy import update
+
+    group_ids = sorted(set(group_ids))
+    if not group_ids:
+        return
+    db.session.execute(
+        update(Group)
+        .where(Group.group_id.in_(group_ids))
+        .values(version=Group.version + 1, customer_count=Group.customer_count + customer_delta)
+        .execution_options(synchronize_session=False)
+    )
+    for group_id in group_ids:
+        listing_cache.invalidate("customers", group_id)
+
+
+def bump_group_versions_by_delta(customer_deltas: dict) -> None:
+    """
+    Increments the version of groups whose customers changed, each with its own change of customer count,
+    in one UPDATE of the current transaction, and drops their cached customers listings.
+
+    Args:
+        customer_deltas (dict): The number of customers added to (or removed from, if negative) each group,
+                                by group_id, e.g. `{3: -120, 4: -7}`.
+    """
+    from models.group_model import Group, db
+    from sqlalchemy import update, case
+
+    group_ids = sorted(customer_deltas)
+    if not group_ids:
+        return
+    db.session.execute(
+        update(Group)
+        .where(Group.group_id.in_(group_ids))
+        .values(version=Group.version + 1,
+                customer_count=Group.customer_count + case(customer_deltas, value=Group.group_id, else_=0))
+        .execution_options(synchronize_session=False)
+    )
+    for group_id in group_ids:
+        listing_cache.invalidate("customers", group_id)
+
+
+def bump_group_versions_of_customers(customer_filter) -> None:
+    """
+    Increments the version of every group that has customers matching a filter, in the current transaction.
+
+    Args:
+        customer_filter: A SQLAlchemy clause over the customers table (e.g. `Customer.email_key.in_(keys)`).
+    """
+    from models.customer_model import Customer, db
+
+    group_ids = [group_id for (group_id,) in db.session.query(Customer.group_id).filter(customer_filter).distinct()]
+    bump_group_versions(group_ids)
+
+
+def bump_user_groups_version(user_id: int) -> None:
+    """
+    Increments the groups version of a user whose groups changed, in the current transaction,
+    and drops the user's cached groups listings.
+
+    Args:
+        user_id (int): The ID of the user (the admin of the groups).
+    """
+    from models.user_model import User, db
+    from sqlalchemy import update
+
+    db.session.execute(
+        update(User)
+        .where(User.user_id == user_id)
+        .values(groups_version=User.groups_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    listing_cache.invalidate("groups", user_id)
+
+
+def group_version_statement(group_id: int):
+    """Builds the SELECT of `get_group_version` (also executed by the ASGI mode)."""
+    from models.group_model import Group
+    from sqlalchemy import select
+    return select(Group.version).where(Group.group_id == group_id)
+
+
+def user_groups_version_statement(user_id: int):
+    """Builds the SELECT of `get_user_groups_version` (also executed by the ASGI mode)."""
+    from models.user_model import User
+    from sqlalchemy import select
+    return select(User.groups_version).where(User.user_id == user_id)
+
+
+def get_group_version(group_id: int) -> int | None:
+    """
+    Reads the version of a group with a primary key lookup (the customers table is not touched).
+
+    Args:
+        group_id (int): The ID of the group.
+
+    Returns:
+        int | None: The version, or None if the group does not exist.
+    """
+    from models.group_model import db
+    return db.session.execute(group_version_statement(group_id)).scalar()
+
+
+def get_user_groups_version(user_id: int) -> int | None:
+    """
+    Reads the groups version of a user with a primary key lookup (the groups table is not touched).
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        int | None: The version, or None if the user does not exist.
+    """
+    from models.user_model import db
+    return db.session.execute(user_groups_version_statement(user_id)).scalar()
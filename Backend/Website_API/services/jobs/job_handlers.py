@@ -0,0 +1,109 @@
+from services.db.groups.db_op_group_transfers import transfer_customers
+from services.db.groups.db_op_group_deletes import delete_group_in_batches
+from services.db.users.db_op_user_deletes import delete_user_in_batches
+
+# Handlers of the jobs by kind, filled by `job_handler`
+JOB_HANDLERS = {}
+
+
+def job_handler(kind: str):
+    """
+    Registers a function as the handler of a kind of job.
+
+    A handler is called by a worker as `handler(params, context)` with the parameters of the job and its
+    `JobContext`, and returns the (JSON-serializable) result of the job. A long handler works in chunks,
+    committing each of them, and calls `context.report(done, total, checkpoint)` after each one: the checkpoint is
+    passed back as `context.checkpoint` when an interrupted job is started again, and the report raises
+    `JobCancelled` / `JobInterrupted` when the job must stop. Chunks must be safe to run twice, a job can be
+    interrupted between a chunk and its report.
+
+    Args:
+        kind (str): The kind of the job, stored with the job.
+
+    Returns:
+        callable: The decorator.
+    """
+    def register(handler):
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return register
+
+
+@job_handler("transfer_customers")
+def transfer_customers_job(params: dict, context) -> dict:
+    """
+    Moves, copies or merges the customers of a group (see `transfer_customers`), resumable by customer_id.
+
+    Params:
+        operation (str), source_group_id (int), target_group_id (int), customer_ids (list, optional).
+    """
+    from services.db.customers.db_op_customer_stats import get_group_customer_count
+
+    # The counts of the batches done before an interruption, and the total fixed when the job first started
+    checkpoint = context.checkpoint or {
+        "after": 0, "scanned": 0, "transferred": 0,
+        "total": len(set(params["customer_ids"])) if params.get("customer_ids") is not None
+        else get_group_customer_count(params["source_group_id"]),
+    }
+
+    def progress(after: int, scanned: int, transferred: int, skipped: int):
+        context.report(checkpoint["scanned"] + scanned, checkpoint["total"], {
+            **checkpoint, "after": after,
+            "scanned": checkpoint["scanned"] + scanned, "transferred": checkpoint["transferred"] + transferred,
+        })
+
+    result = transfer_customers(params["operation"], params["source_group_id"], params["target_group_id"],
+                                params.get("customer_ids"), progress=progress, after=checkpoint["after"])
+    result["scanned"] += checkpoint["scanned"]
+    result["transferred"] += checkpoint["transferred"]
+    result["skipped"] = result["scanned"] - result["transferred"]
+    return result
+
+
+@job_handler("delete_group")
+def delete_group_job(params: dict, context) -> dict:
+    """
+    Deletes a group and its customers in batches (see `delete_group_in_batches`).
+
+    Params:
+        group_id (int).
+    """
+    from services.db.customers.db_op_customer_stats import get_group_customer_count
+
+    total = get_group_customer_count(params["group_id"])
+    checkpoint = context.checkpoint or {"deleted": 0, "total": total}
+    if total is None:
+        # Already deleted, by this job before an interruption or by another one
+        return {"customers": checkpoint["deleted"]}
+
+    def progress(deleted: int):
+        context.report(checkpoint["deleted"] + deleted, checkpoint["total"],
+                       {**checkpoint, "deleted": checkpoint["deleted"] + deleted})
+
+    result = delete_group_in_batches(params["group_id"], progress=progress)
+    result["customers"] += checkpoint["deleted"]
+    return result
+
+
+@job_handler("delete_user")
+def delete_user_job(params: dict, context) -> dict:
+    """
+    Deletes a user with their groups, customers and suppressions in batches (see `delete_user_in_batches`).
+
+    Params:
+        user_id (int).
+    """
+    from services.db.users.db_op_user_by_id import get_user_by_user_id
+    from services.db.customers.db_op_customer_stats import get_admin_customer_count
+
+    checkpoint = context.checkpoint or {"deleted": 0, "total": get_admin_customer_count(params["user_id"])}
+    if get_user_by_user_id(params["user_id"]) is None:
+        return {"groups": None, "customers": checkpoint["deleted"], "suppressions": None}
+
+    def progress(deleted: int):
+        context.report(checkpoint["deleted"] + deleted, checkpoint["total"],
+                       {**checkpoint, "deleted": checkpoint["deleted"] + deleted})
+
+    result = delete_user_in_batches(params["user_id"], progress=progress)
+    result["customers"] += checkpoint["deleted"]
+    return result
@@ -0,0 +1,212 @@
+import os
+import signal
+import socket
+import traceback
+import multiprocessing
+from time import monotonic
+from services.jobs.job_handlers import JOB_HANDLERS
+from services.db.jobs.db_op_jobs import (
+    claim_next_job, report_job_progress, finish_job, release_job, requeue_abandoned_jobs, JOB_LEASE_SECONDS
+)
+
+# Seconds the workers of a pool get to interrupt their jobs on shutdown before they are killed
+JOB_SHUTDOWN_TIMEOUT = 30
+
+
+class JobCancelled(Exception):
+    """Raised by `JobContext.report` when the cancellation of the job was requested."""
+
+
+class JobInterrupted(Exception):
+    """Raised by `JobContext.report` when the worker is stopping, the job is requeued and resumes from its checkpoint."""
+
+
+class JobLeaseLost(JobInterrupted):
+    """
+    Raised by `JobContext.report` when the job is no longer claimed by the worker: it was requeued after
+    JOB_LEASE_SECONDS without report, and maybe claimed by another worker. The worker stops without writing the job.
+    """
+
+
+class JobContext:
+    """
+    What a handler knows about its job: its checkpoint, and how to report progress.
+    """
+
+    def __init__(self, job_id: int, worker: str, checkpoint: dict = None, stopping=None):
+        """
+        Args:
+            job_id (int): The ID of the job.
+            worker (str): The name of the worker running the job.
+            checkpoint (dict, optional): The last checkpoint reported by the handler, None on the first run.
+            stopping (callable, optional): Returns True when the worker is stopping.
+        """
+        self.job_id = job_id
+        self.worker = worker
+        self.checkpoint = checkpoint
+        self._stopping = stopping or (lambda: False)
+
+    def report(self, done: int, total: int = None, checkpoint: dict = None):
+        """
+        Stores the progress of the job and, if given, the checkpoint it resumes from.
+
+        Args:
+            done (int): The units of work done.
+            total (int, optional): The units of work of the whole job, None if unknown.
+            checkpoint (dict, optional): Where the handler resumes if the job is interrupted.
+
+        Raises:
+            JobCancelled: If the cancellation of the job was requested.
+            JobInterrupted: If the worker is stopping.
+            JobLeaseLost: If the worker lost the job.
+        """
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
+        cancel_requested = report_job_progress(self.job_id, self.worker, done, total, checkpoint)
+        if cancel_requested is None:
+            raise JobLeaseLost()
+        if cancel_requested:
+            raise JobCancelled()
+        if self._stopping():
+            raise JobInterrupted()
+
+
+def run_job(job: dict, worker: str, stopping=None) -> str:
+    """
+    Runs a claimed job with its handler and stores how it ended.
+
+    Args:
+        job (dict): The job returned by `claim_next_job`.
+        worker (str): The name of the worker that claimed the job.
+        stopping (callable, optional): Returns True when the worker is stopping.
+
+    Returns:
+        str: The final status of the job ('succeeded', 'failed' or 'cancelled'), 'queued' if it was interrupted,
+             or 'lost' if the worker lost the job (its status is left to the worker that runs it now).
+    """
+    from extensions import db
+
+    handler = JOB_HANDLERS.get(job["kind"])
+    if handler is None:
+        status, result, error = "failed", None, f"Invalid kind: '{job['kind']}'."
+    else:
+        try:
+            context = JobContext(job["job_id"], worker, job["checkpoint"], stopping)
+            status, result, error = "succeeded", handler(job["params"], context), None
+        except JobCancelled:
+            db.session.rollback()
+            status, result, error = "cancelled", None, None
+        except JobLeaseLost:
+            db.session.rollback()
+            return "lost"
+        except JobInterrupted:
+            db.session.rollback()
+            release_job(job["job_id"], worker)
+            return "queued"
+        except Exception as e:
+            # The handler's uncommitted chunk is rolled back, the committed ones stay (and the checkpoint with them)
+            traceback.print_exc()
+            db.session.rollback()
+            status, result, error = "failed", None, str(e) or type(e).__name__
+
+    if not finish_job(job["job_id"], worker, status, result=result, error=error):
+        return "lost"
+    return status
+
+
+def run_worker(worker: str, poll_interval: float = 1.0, stop_event=None, max_jobs: int = None) -> int:
+    """
+    Runs queued jobs one after the other until `stop_event` is set (or `max_jobs` jobs were run). Without
+    `stop_event`, or with `max_jobs`, the worker also stops as soon as no job is queued.
+
+    Must run inside an app context. Every JOB_LEASE_SECONDS / 2 the worker also requeues the jobs abandoned by
+    dead workers, so no separate scheduler is needed.
+
+    Args:
+        worker (str): The name of the worker, stored with the jobs it runs.
+        poll_interval (float, optional): Seconds to wait when no job is queued. Defaults to 1.0.
+        stop_event (Event, optional): Stops the worker when set, its running job is requeued at its next report.
+        max_jobs (int, optional): Stop after this number of jobs. Defaults to no limit.
+
+    Returns:
+        int: The number of jobs run.
+    """
+    stopping = stop_event.is_set if stop_event is not None else (lambda: False)
+    jobs_run = 0
+    next_requeue = 0
+    while not stopping() and (max_jobs is None or jobs_run < max_jobs):
+        if monotonic() >= next_requeue:
+            requeue_abandoned_jobs()
+            next_requeue = monotonic() + JOB_LEASE_SECONDS / 2
+
+        job = claim_next_job(worker)
+        if job is None:
+            if max_jobs is not None or stop_event is None:
+                break
+            stop_event.wait(poll_interval)
+            continue
+
+        print(f"[{worker}] job {job['job_id']} ({job['kind']}): {run_job(job, worker, stopping)}")
+        jobs_run += 1
+    return jobs_run
+
+
+def worker_process(poll_interval: float, stop_event):
+    """The entry point of a process of `run_worker_pool`: creates its own app and runs a worker in it."""
+    from app import create_app
+
+    # The pool stops its workers through the event (and kills the ones that do not stop), so Ctrl+C and
+    # SIGTERM sent to the whole process group are handled by the pool only
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    app = create_app()
+    with app.app_context():
+        run_worker(f"{socket.gethostname()}:{os.getpid()}", poll_interval, stop_event)
+
+
+def _interrupt(signum, frame):
+    """Handles SIGTERM like Ctrl+C. Setting the event from a signal handler could deadlock on its lock."""
+    raise KeyboardInterrupt()
+
+
+def run_worker_pool(processes: int, poll_interval: float = 1.0):
+    """
+    Runs `processes` worker processes until interrupted (Ctrl+C or SIGTERM), restarting the ones that die.
+
+    Every process claims jobs from the jobs table on its own, so several pools (on several machines) can share
+    the same database. The processes are spawned, not forked, so none of them inherits a connection of the pool.
+    On shutdown the running jobs are requeued at their next progress report and resume from their checkpoint.
+
+    Args:
+        processes (int): The number of worker processes.
+        poll_interval (float, optional): Seconds a worker waits when no job is queued. Defaults to 1.0.
+    """
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+
+    def start(index: int):
+        process = context.Process(target=worker_process, args=(poll_interval, stop_event), name=f"job-worker-{index}")
+        process.start()
+        return process
+
+    signal.signal(signal.SIGTERM, _interrupt)
+    workers = [start(index) for index in range(processes)]
+    try:
+        while not stop_event.is_set():
+            for index, process in enumerate(workers):
+                process.join(timeout=poll_interval / len(workers))
+                if not process.is_alive() and not stop_event.is_set():
+                    print(f"Job worker {process.pid} exited with code {process.exitcode}, restarting it")
+                    workers[index] = start(index)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        stop_event.set()
+        deadline = monotonic() + JOB_SHUTDOWN_TIMEOUT
+        for process in workers:
+            process.join(timeout=max(deadline - monotonic(), 0))
+            if process.is_alive():
+                process.kill()
@@ -0,0 +1,98 @@
+import zlib
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+# Format of the serialized sets, stored with the snapshots so it can evolve
+CODEC_VERSION = 1
+
+
+class CustomerIdSet:
+    """
+    An immutable, sorted set of customer ids backed by a compact `array('I')` (4 bytes per id).
+
+    It is the in-memory form of a segment snapshot: set operations between snapshots run in memory,
+    and the send engine walks it in chunks. Serialized, the ids are delta-encoded and zlib-compressed,
+    which turns a dense range of ids into a few bytes per thousand ids.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, sorted_ids: array = None):
+        """
+        Args:
+            sorted_ids (array, optional): An `array('I')` of unique ids in ascending order. Use `from_ids` for unsorted input.
+        """
+        self._ids = sorted_ids if sorted_ids is not None else array("I")
+
+    @classmethod
+    def from_ids(cls, ids):
+        """Creates a set from any iterable of ids (duplicates are removed)."""
+        return cls(array("I", sorted(set(ids))))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Creates a set from the output of `to_bytes`."""
+        deltas = array("I")
+        deltas.frombytes(zlib.decompress(data))
+        return cls(array("I", accumulate(deltas)))
+
+    def to_bytes(self) -> bytes:
+        """Serializes the set as zlib-compressed deltas between consecutive ids."""
+        ids = self._ids
+        if not ids:
+            return zlib.compress(b"")
+        deltas = array("I", [ids[0]])
+        deltas.extend(current - previous for previous, current in zip(ids, ids[1:]))
+        return zlib.compress(deltas.tobytes(), 6)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __contains__(self, customer_id: int):
+        index = bisect_left(self._ids, customer_id)
+        return index < len(self._ids) and self._ids[index] == customer_id
+
+    def union(self, other):
+        """Returns the ids that are in this set or in `other`."""
+        return CustomerIdSet.from_ids(set(self._ids).union(other._ids))
+
+    def intersection(self, other):
+        """Returns the ids that are in both sets."""
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        larger_ids = set(larger._ids)
+        # Iterating the sorted smaller set keeps the result sorted, no sort is needed
+        return CustomerIdSet(array("I", (customer_id for customer_id in smaller._ids if customer_id in larger_ids)))
+
+    def difference(self, other):
+        """Returns the ids of this set that are not in `other`."""
+        excluded = set(other._ids)
+        return CustomerIdSet(array("I", (customer_id for customer_id in self._ids if customer_id not in excluded)))
+
+    def chunks(self, chunk_size: int):
+        """
+        Yields the ids in ascending order, `chunk_size` ids at a time.
+
+        Args:
+            chunk_size (int): The number of ids per chunk.
+
+        Yields:
+            array: A slice of the ids.
+        """
+        ids = self._ids
+        for start in range(0, len(ids), chunk_size):
+            yield ids[start:start + chunk_size]
+
+    def after(self, customer_id: int):
+        """Returns the position of the first id greater than `customer_id`, used to resume an iteration."""
+        index = bisect_left(self._ids, customer_id)
+        if index < len(self._ids) and self._ids[index] == customer_id:
+            index += 1
+        return index
+
+    def slice(self, start: int, stop: int) -> list:
+        """Returns the ids between two positions as a list."""
+        return self._ids[start:stop].tolist()
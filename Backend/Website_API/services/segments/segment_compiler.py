@@ -0,0 +1,190 @@
+from datetime import date
+from utils.email_address.canonical_email import canonical_email, email_domain
+
+# Supported operators per customer field, every condition of a segment is ANDed with the others
+SEGMENT_OPERATORS = {
+    "country": ["eq", "in", "not_in"],
+    "city": ["eq", "in", "prefix"],
+    "email_domain": ["eq", "in", "not_in"],
+    "age": ["between", "gte", "lte"]
+}
+
+# Upper bound of the values of an 'in' / 'not_in' condition and of the groups of a segment
+MAX_SEGMENT_VALUES = 1000
+
+# Ages are compiled to birthday ranges, larger values would go before year 1
+MAX_AGE = 150
+
+
+def validate_segment(segment: dict) -> str:
+    """
+    Validates a segment definition.
+
+    A segment targets the customers of one admin, optionally restricted to some of the admin's groups:
+
+        {
+            "admin_id": 1,
+            "group_ids": [3, 4],
+            "conditions": [
+                {"field": "country", "op": "in", "value": ["Israel", "France"]},
+                {"field": "city", "op": "prefix", "value": "Tel"},
+                {"field": "email_domain", "op": "not_in", "value": ["gmail.com"]},
+                {"field": "age", "op": "between", "value": [18, 30]}
+            ]
+        }
+
+    Args:
+        segment (dict): The segment definition.
+
+    Returns:
+        str: A string containing all the error messages, or an empty string if the segment is valid.
+    """
+    if not isinstance(segment, dict):
+        return "Invalid segment. Segment is required!\n"
+
+    error: str = ''
+    if type(segment.get("admin_id")) is not int:
+        error += "Invalid segment. admin_id is required!\n"
+
+    group_ids = segment.get("group_ids")
+    if group_ids is not None and (not isinstance(group_ids, list) or not group_ids or len(group_ids) > MAX_SEGMENT_VALUES
+                                  or any(type(group_id) is not int for group_id in group_ids)):
+        error += f"Invalid group_ids. Use a list of 1 to {MAX_SEGMENT_VALUES} group ids.\n"
+
+    conditions = segment.get("conditions", [])
+    if not isinstance(conditions, list):
+        return error + "Invalid conditions. Use a list of conditions.\n"
+
+    for condition in conditions:
+        error += validate_condition(condition)
+    return error
+
+
+def validate_condition(condition: dict) -> str:
+    """
+    Validates a single condition of a segment.
+
+    Args:
+        condition (dict): A dictionary with the 'field', 'op' and 'value' keys.
+
+    Returns:
+        str: An error message, or an empty string if the condition is valid.
+    """
+    if not isinstance(condition, dict):
+        return "Invalid condition. Use {'field': ..., 'op': ..., 'value': ...}.\n"
+
+    field = condition.get("field")
+    op = condition.get("op")
+    value = condition.get("value")
+
+    if field not in SEGMENT_OPERATORS:
+        return f"Invalid condition field: '{field}'. Use 'country', 'city', 'email_domain', or 'age'.\n"
+    if op not in SEGMENT_OPERATORS[field]:
+        return f"Invalid operator '{op}' for '{field}'. Use one of {SEGMENT_OPERATORS[field]}.\n"
+
+    if op in ("in", "not_in"):
+        if not isinstance(value, list) or not value or len(value) > MAX_SEGMENT_VALUES or any(type(item) is not str for item in value):
+            return f"Invalid value for '{field} {op}'. Use a list of 1 to {MAX_SEGMENT_VALUES} strings.\n"
+    elif op == "between":
+        if (not isinstance(value, list) or len(value) != 2 or any(type(item) is not int or not 0 <= item <= MAX_AGE for item in value)
+                or value[0] > value[1]):
+            return f"Invalid value for '{field} between'. Use [min_age, max_age].\n"
+    elif field == "age":
+        if type(value) is not int or not 0 <= value <= MAX_AGE:
+            return f"Invalid value for '{field} {op}'. Use an age between 0 and {MAX_AGE}.\n"
+    elif type(value) is not str or not value:
+        return f"Invalid value for '{field} {op}'. Use a non-empty string.\n"
+    return ''
+
+
+def years_before(day: date, years: int) -> date:
+    """
+    Returns the same day `years` years earlier (February 29 becomes February 28 on non-leap years).
+
+    Args:
+        day (date): The reference day.
+        years (int): The number of years to go back.
+
+    Returns:
+        date: The shifted day.
+    """
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+def canonical_email_domain(domain: str) -> str:
+    """
+    Normalizes a domain of an 'email_domain' condition like the domains stored with the customers.
+
+    Args:
+        domain (str): The domain, e.g. 'GoogleMail.com'.
+
+    Returns:
+        str: The canonical domain, e.g. 'gmail.com'.
+    """
+    return email_domain(canonical_email("@" + domain.lstrip("@")))
+
+
+def compile_conditions(segment: dict, today: date = None) -> list:
+    """
+    Compiles a valid segment into SQLAlchemy filter clauses over the customers and groups tables.
+
+    Every condition is compiled to a clause that can use an index: ages become birthday ranges computed once
+    in Python (instead of computing the age of every row), and city prefixes become `LIKE 'prefix%'` patterns.
+
+    Args:
+        segment (dict): A segment that passed `validate_segment`.
+        today (date, optional): The reference day for age conditions. Defaults to today.
+
+    Returns:
+        list: The filter clauses, to be combined with AND.
+
+    Raises:
+        ValueError: If the segment is invalid.
+    """
+    from models.customer_model import Customer
+    from models.group_model import Group
+    from sqlalchemy import or_
+
+    error = validate_segment(segment)
+    if error:
+        raise ValueError(error)
+
+    today = today or date.today()
+    clauses = [Group.group_admin_id == segment["admin_id"]]
+    if segment.get("group_ids"):
+        clauses.append(Customer.group_id.in_(sorted(set(segment["group_ids"]))))
+
+    for condition in segment.get("conditions", []):
+        field, op, value = condition["field"], condition["op"], condition["value"]
+
+        if field == "age":
+            # Age >= n  <=>  born on or before the same day n years ago
+            # Age <= n  <=>  born after the same day n + 1 years ago
+            min_age, max_age = (value if op == "between" else (value, None) if op == "gte" else (None, value))
+            if min_age is not None:
+                clauses.append(Customer.birthday <= years_before(today, min_age))
+            if max_age is not None:
+                clauses.append(Customer.birthday > years_before(today, max_age + 1))
+            continue
+
+        if field == "email_domain":
+            # Compare with the stored canonical domains ('GoogleMail.com' -> 'gmail.com')
+            value = [canonical_email_domain(item) for item in value] if isinstance(value, list) else canonical_email_domain(value)
+
+        column = getattr(Customer, field)
+        if op == "eq":
+            clauses.append(column == value)
+        elif op == "in":
+            clauses.append(column.in_(sorted(set(value))))
+        elif op == "not_in":
+            # NOT IN is never true for NULL, but a customer without a value (e.g. no country) is in none of them
+            not_in = column.notin_(sorted(set(value)))
+            clauses.append(or_(column.is_(None), not_in) if Customer.__table__.c[field].nullable else not_in)
+        elif op == "prefix":
+            # Escape the LIKE wildcards so the prefix is matched literally
+            escaped = value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+            clauses.append(column.like(escaped + "%", escape="/"))
+    return clauses
@@ -0,0 +1,32 @@
+from hashlib import blake2b
+from utils.email_address.canonical_email import canonical_email
+
+
+def hash_email_key(email_key: str) -> int:
+    """
+    Hashes a canonical email key into a signed 64-bit integer (fits a BIGINT column).
+
+    Send workers keep the hashes of the suppressed addresses in a set of integers, which is much smaller
+    than a set of strings and makes checking a recipient a single integer lookup.
+
+    Args:
+        email_key (str): A key returned by `canonical_email` (e.g. the `email_key` column of a customer).
+
+    Returns:
+        int: The 64-bit hash of the key.
+    """
+    return int.from_bytes(blake2b(email_key.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def hash_email(email: str) -> int:
+    """
+    Hashes an email address by its canonical key, so every spelling of a suppressed address
+    ('John.Doe@Gmail.com', 'johndoe+news@gmail.com', ...) gets the same hash.
+
+    Args:
+        email (str): The email address.
+
+    Returns:
+        int: The 64-bit hash of the canonical key of the address.
+    """
+    return hash_email_key(canonical_email(email))
@@ -0,0 +1,177 @@
+import threading
+from array import array
+from time import monotonic
+from pyroaring import BitMap
+from services.suppression.email_hash import hash_email, hash_email_key
+from services.segments.customer_id_set import CustomerIdSet
+from services.db.suppression.db_op_suppressions import get_suppressions_after
+
+# Number of suppressions read per query during a refresh
+REFRESH_BATCH_SIZE = 10000
+
+# Seconds after which `get_suppression_list` refreshes a list before returning it
+REFRESH_INTERVAL = 30
+
+# Number of suppression ids below the last loaded one that every refresh reads again. On PostgreSQL the ids of
+# concurrent transactions become visible out of order (a transaction holding id 100 may commit after the one
+# holding id 101), so a refresh between the two commits would otherwise skip id 100 for good.
+REFRESH_OVERLAP = 10000
+
+# Seconds after which `get_suppression_list` reloads a list from scratch, for the rows older than the overlap
+# that became visible late and for the suppressions that were deleted (e.g. with their user)
+FULL_RELOAD_INTERVAL = 600
+
+
+class SuppressionList:
+    """
+    The suppressions of one admin (their own and the global ones), loaded in the memory of a send worker.
+
+    Suppressed customer ids are kept in a compressed roaring bitmap and suppressed addresses as a set of
+    64-bit email hashes. Filtering a batch of a million recipients is then a bitmap difference plus one
+    integer lookup per recipient, instead of a query per recipient.
+
+    `refresh` only reads the rows above the last loaded suppression_id (minus `REFRESH_OVERLAP`, the sets
+    ignore the rows read twice), `reload` reads all of them again.
+    """
+
+    def __init__(self, group_admin_id: int):
+        """
+        Args:
+            group_admin_id (int): The admin whose suppressions are loaded.
+        """
+        self.group_admin_id = group_admin_id
+        self.customer_ids = BitMap()
+        self.email_hashes = set()
+        self.last_suppression_id = 0
+        self.refreshed_at = None
+        self.reloaded_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """
+        Loads the suppressions added since the last refresh (all of them on the first call), reading again the
+        last `REFRESH_OVERLAP` ids for the rows that were committed out of order.
+
+        Returns:
+            int: The number of suppressions that were read.
+        """
+        with self._lock:
+            after = max(0, self.last_suppression_id - REFRESH_OVERLAP)
+            loaded, last_suppression_id = self._load(self.customer_ids, self.email_hashes, after)
+            self.last_suppression_id = max(self.last_suppression_id, last_suppression_id)
+            self.refreshed_at = monotonic()
+        return loaded
+
+    def reload(self) -> int:
+        """
+        Loads all the suppressions again into new sets, then replaces the current ones, so the deleted
+        suppressions are dropped and the ones missed by `refresh` are added.
+
+        Returns:
+            int: The number of suppressions that were loaded.
+        """
+        customer_ids = BitMap()
+        email_hashes = set()
+        with self._lock:
+            loaded, last_suppression_id = self._load(customer_ids, email_hashes, 0)
+            self.customer_ids = customer_ids
+            self.email_hashes = email_hashes
+            self.last_suppression_id = last_suppression_id
+            self.refreshed_at = self.reloaded_at = monotonic()
+        return loaded
+
+    def _load(self, customer_ids: BitMap, email_hashes: set, after: int) -> tuple:
+        """
+        Adds the suppressions above a suppression_id to the given sets, `REFRESH_BATCH_SIZE` rows per query.
+
+        Returns:
+            tuple: The number of rows read and the last suppression_id read (`after` if none).
+        """
+        loaded = 0
+        while True:
+            rows = get_suppressions_after(self.group_admin_id, after, REFRESH_BATCH_SIZE)
+            if not rows:
+                break
+            customer_ids.update(row.customer_id for row in rows if row.customer_id is not None)
+            email_hashes.update(row.email_hash for row in rows)
+            after = rows[-1].suppression_id
+            loaded += len(rows)
+            if len(rows) < REFRESH_BATCH_SIZE:
+                break
+        return loaded, after
+
+    def is_suppressed(self, customer_id: int = None, email: str = None) -> bool:
+        """
+        Checks a single recipient.
+
+        Args:
+            customer_id (int, optional): The ID of the customer.
+            email (str, optional): The email address of the customer.
+
+        Returns:
+            bool: True if the customer or the address is suppressed.
+        """
+        if customer_id is not None and customer_id in self.customer_ids:
+            return True
+        return email is not None and hash_email(email) in self.email_hashes
+
+    def filter_customer_ids(self, customer_ids: CustomerIdSet) -> CustomerIdSet:
+        """
+        Removes the suppressed customers from a set of customer ids (e.g. a segment snapshot) with one bitmap difference.
+
+        Args:
+            customer_ids (CustomerIdSet): The candidate recipients.
+
+        Returns:
+            CustomerIdSet: The recipients that are not suppressed by id.
+        """
+        remaining = BitMap(customer_ids) - self.customer_ids
+        return CustomerIdSet(array("I", remaining))
+
+    def filter_recipients(self, customers: list) -> list:
+        """
+        Removes the suppressed recipients from a chunk of customers, by id and by canonical email key.
+
+        The keys are the ones stored with the customers, so no address is normalized while filtering.
+
+        Args:
+            customers (list): Dictionaries with at least `customer_id` and `email_key` (e.g. a chunk of `iter_snapshot_customers`).
+
+        Returns:
+            list: The customers that are not suppressed, in the same order.
+        """
+        suppressed_ids = self.customer_ids
+        email_hashes = self.email_hashes
+        return [
+            customer for customer in customers
+            if customer["customer_id"] not in suppressed_ids and hash_email_key(customer["email_key"]) not in email_hashes
+        ]
+
+
+# One list per admin in every worker process
+_suppression_lists = {}
+_suppression_lists_lock = threading.Lock()
+
+
+def get_suppression_list(group_admin_id: int) -> SuppressionList:
+    """
+    Returns the suppression list of an admin for this worker, refreshed if it is older than `REFRESH_INTERVAL` seconds
+    and reloaded if it is older than `FULL_RELOAD_INTERVAL` seconds.
+
+    Args:
+        group_admin_id (int): The admin.
+
+    Returns:
+        SuppressionList: The up-to-date suppression list.
+    """
+    with _suppression_lists_lock:
+        suppression_list = _suppression_lists.get(group_admin_id)
+        if suppression_list is None:
+            suppression_list = _suppression_lists[group_admin_id] = SuppressionList(group_admin_id)
+
+    now = monotonic()
+    if suppression_list.reloaded_at is None or now - suppression_list.reloaded_at > FULL_RELOAD_INTERVAL:
+        suppression_list.reload()
+    elif now - suppression_list.refreshed_at > REFRESH_INTERVAL:
+        suppression_list.refresh()
+    return suppression_list
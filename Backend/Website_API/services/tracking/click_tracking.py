@@ -0,0 +1,31 @@
+import os
+from time import time
+from dotenv import load_dotenv
+from services.tracking.event_buffer import EventBuffer
+from services.db.tracking.db_op_click_events import insert_click_events
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# One buffer per worker process, shared by all the threads of that process
+click_events_buffer = EventBuffer(
+    insert_click_events,
+    capacity=int(os.getenv("TRACKING_BUFFER_CAPACITY", 100000)),
+    batch_size=int(os.getenv("TRACKING_BATCH_SIZE", 5000)),
+    flush_interval=float(os.getenv("TRACKING_FLUSH_INTERVAL", 1.0))
+)
+
+
+def record_click(campaign_id: int, customer_id: int, link_index: int, device_code: int = 0):
+    """
+    Records that a customer clicked a link of a campaign email.
+
+    The event is only appended to the in-memory buffer; it reaches the database with the next batch.
+
+    Args:
+        campaign_id (int): The ID of the campaign.
+        customer_id (int): The ID of the customer who clicked.
+        link_index (int): The position of the clicked link in the email.
+        device_code (int, optional): The device code of the browser, see `classify_user_agent`.
+    """
+    click_events_buffer.append((campaign_id, customer_id, link_index, device_code, time()))
@@ -0,0 +1,115 @@
+import os
+import atexit
+import threading
+from collections import deque
+from flask import current_app
+
+
+class EventBuffer:
+    """
+    In-process ring buffer for tracking events that are written to the database in batches.
+
+    The request path only appends a small tuple to a bounded `deque` (an atomic operation in CPython),
+    so it never waits on the database. A daemon thread drains the buffer every `flush_interval` seconds,
+    or as soon as `batch_size` events are waiting, and hands each batch to `flush_function`.
+
+    Loss is bounded on purpose: when the buffer is full the oldest events are overwritten, and a batch whose
+    insert fails is dropped. At most `capacity` events (or `flush_interval` seconds of traffic) can be lost.
+    """
+
+    def __init__(self, flush_function, capacity: int = 100000, batch_size: int = 5000, flush_interval: float = 1.0):
+        """
+        Args:
+            flush_function (callable): Receives a list of events and writes them to the database.
+            capacity (int): Maximum number of events kept in memory before the oldest are overwritten.
+            batch_size (int): Maximum number of events passed to `flush_function` at once.
+            flush_interval (float): Maximum number of seconds an event waits in the buffer.
+        """
+        self._flush_function = flush_function
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._events = deque(maxlen=capacity)
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._app = None
+        self.dropped = 0
+        self.flushed = 0
+
+    def append(self, event: tuple):
+        """
+        Adds an event to the buffer and makes sure the flusher thread of this process is running.
+
+        Args:
+            event (tuple): The event to store, in the format expected by `flush_function`.
+        """
+        events = self._events
+        if len(events) == self._capacity:
+            self.dropped += 1
+        events.append(event)
+
+        # A forked worker does not inherit the flusher thread of its parent
+        if self._pid != os.getpid():
+            self._start()
+
+        if len(events) >= self._batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Writes at most one batch of buffered events to the database.
+
+        Returns:
+            int: The number of events taken from the buffer.
+        """
+        batch = []
+        popleft = self._events.popleft
+        try:
+            while len(batch) < self._batch_size:
+                batch.append(popleft())
+        except IndexError:
+            pass
+
+        if batch:
+            try:
+                self._flush_function(batch)
+                self.flushed += len(batch)
+            except Exception as e:
+                # The batch is lost, which keeps the loss window bounded
+                print(e)
+                self.dropped += len(batch)
+        return len(batch)
+
+    def flush_all(self):
+        """Drains the whole buffer, used on shutdown."""
+        if self._app is None:
+            return
+        with self._app.app_context():
+            while self.flush():
+                pass
+
+    def stats(self) -> dict:
+        """Returns counters describing the state of the buffer."""
+        return {"buffered": len(self._events), "flushed": self.flushed, "dropped": self.dropped}
+
+    def _start(self):
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # The flusher runs outside of any request, so it keeps a reference to the app for its context
+            self._app = current_app._get_current_object()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="event-buffer-flusher", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush_all)
+
+    def _run(self):
+        with self._app.app_context():
+            while True:
+                self._wakeup.wait(self._flush_interval)
+                self._wakeup.clear()
+                # Keep flushing while full batches are waiting
+                while self.flush() >= self._batch_size:
+                    pass
@@ -0,0 +1,78 @@
+import os
+import re
+from html import unescape
+from dotenv import load_dotenv
+from services.tracking.link_tokens import SignedLink
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Public address of the API, used to build the tracked links
+TRACKING_BASE_URL = os.getenv("TRACKING_BASE_URL", "").rstrip("/")
+
+# href attributes of <a> tags pointing to http(s) destinations, mailto: and #anchors are left untouched
+LINK_PATTERN = re.compile(r"""(<a\b[^>]*?\bhref\s*=\s*)(["'])(https?://[^"']+)\2""", re.IGNORECASE)
+
+
+class TrackedTemplate:
+    """
+    The HTML of a campaign email with its links prepared for click tracking.
+
+    The HTML is scanned once per campaign: it is split into static segments around every link and each link
+    gets a `SignedLink`. Rendering the email for a customer only joins the segments with the signed tokens.
+    """
+
+    def __init__(self, html: str, campaign_id: int, base_url: str = None):
+        """
+        Args:
+            html (str): The HTML body of the campaign email.
+            campaign_id (int): The ID of the campaign.
+            base_url (str, optional): Public address of the API. Defaults to the `TRACKING_BASE_URL` environment variable.
+        """
+        self.campaign_id = campaign_id
+        self._click_prefix = f"{(base_url or TRACKING_BASE_URL).rstrip('/')}/api/tracking/click/"
+        self._segments = []
+        self.links = []
+
+        position = 0
+        for match in LINK_PATTERN.finditer(html):
+            # Everything up to and including the opening quote stays as it is
+            self._segments.append(html[position:match.start(3)])
+            self.links.append(SignedLink(campaign_id, len(self.links), unescape(match.group(3))))
+            position = match.end(3)
+        self._segments.append(html[position:])
+
+    def render(self, customer_id: int) -> str:
+        """
+        Returns the HTML of the email for one customer, with every link replaced by its tracked link.
+
+        Args:
+            customer_id (int): The ID of the customer who receives the email.
+
+        Returns:
+            str: The HTML with the tracked links.
+        """
+        segments = self._segments
+        prefix = self._click_prefix
+        parts = [segments[0]]
+        for index, link in enumerate(self.links):
+            parts.append(prefix)
+            parts.append(link.token_for(customer_id))
+            parts.append(segments[index + 1])
+        return "".join(parts)
+
+
+def rewrite_links(html: str, campaign_id: int, customer_id: int, base_url: str = None) -> str:
+    """
+    Rewrites the links of a single email. Prefer `TrackedTemplate` when rendering a campaign for many customers.
+
+    Args:
+        html (str): The HTML body of the email.
+        campaign_id (int): The ID of the campaign.
+        customer_id (int): The ID of the customer who receives the email.
+        base_url (str, optional): Public address of the API.
+
+    Returns:
+        str: The HTML with the tracked links.
+    """
+    return TrackedTemplate(html, campaign_id, base_url).render(customer_id)
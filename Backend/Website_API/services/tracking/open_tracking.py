@@ -0,0 +1,30 @@
+import os
+from time import time
+from dotenv import load_dotenv
+from services.tracking.event_buffer import EventBuffer
+from services.db.tracking.db_op_open_events import insert_open_events
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# One buffer per worker process, shared by all the threads of that process
+open_events_buffer = EventBuffer(
+    insert_open_events,
+    capacity=int(os.getenv("TRACKING_BUFFER_CAPACITY", 100000)),
+    batch_size=int(os.getenv("TRACKING_BATCH_SIZE", 5000)),
+    flush_interval=float(os.getenv("TRACKING_FLUSH_INTERVAL", 1.0))
+)
+
+
+def record_open(campaign_id: int, customer_id: int, device_code: int = 0):
+    """
+    Records that a customer opened a campaign email.
+
+    The event is only appended to the in-memory buffer; it reaches the database with the next batch.
+
+    Args:
+        campaign_id (int): The ID of the opened campaign.
+        customer_id (int): The ID of the customer who opened it.
+        device_code (int, optional): The device code of the email client, see `classify_user_agent`.
+    """
+    open_events_buffer.append((campaign_id, customer_id, device_code, time()))
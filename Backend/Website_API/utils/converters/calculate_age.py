@@ -0,0 +1,17 @@
+from datetime import date
+
+def calculate_age(birthday: date, today: date = None) -> int:
+    """
+    Calculates an age in full years from a birthday.
+
+    Args:
+        birthday (date): The birthday, may be None.
+        today (date, optional): The reference day, pass it once when calculating many ages. Defaults to today.
+
+    Returns:
+        int: The age, or None if there is no birthday.
+    """
+    if birthday is None:
+        return None
+    today = today or date.today()
+    return today.year - birthday.year - ((today.month, today.day) < (birthday.month, birthday.day))
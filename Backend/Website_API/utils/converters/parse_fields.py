@@ -0,0 +1,13 @@
+def parse_fields(fields: str) -> list:
+    """
+    Parses the `fields` query parameter of a sparse fieldset (e.g. 'customer_id,email,first_name').
+
+    Args:
+        fields (str): The comma-separated field names, may be None.
+
+    Returns:
+        list[str]: The field names in the requested order without duplicates, or None if the parameter was not sent.
+    """
+    if fields is None:
+        return None
+    return list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
@@ -0,0 +1,100 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Set EMAIL_PROVIDER_RULES=false to only normalize case and domains (run `flask backfill-email-keys` after changing it)
+APPLY_PROVIDER_RULES = os.getenv("EMAIL_PROVIDER_RULES", "true").lower() != "false"
+
+# Provider-specific rules, applied to the local part of the addresses of these domains:
+# - 'tag': the separator of sub-addresses ("john+news@gmail.com" is delivered to "john@gmail.com")
+# - 'dots': dots are ignored ("j.o.h.n@gmail.com" is delivered to "john@gmail.com")
+PROVIDER_RULES = {
+    "gmail.com": {"tag": "+", "dots": True},
+    "outlook.com": {"tag": "+", "dots": False},
+    "hotmail.com": {"tag": "+", "dots": False},
+    "live.com": {"tag": "+", "dots": False},
+    "icloud.com": {"tag": "+", "dots": False},
+    "fastmail.com": {"tag": "+", "dots": False},
+    "protonmail.com": {"tag": "+", "dots": False},
+    "proton.me": {"tag": "+", "dots": False},
+}
+
+# Domains that deliver to the same mailboxes as another domain
+DOMAIN_ALIASES = {
+    "googlemail.com": "gmail.com",
+}
+
+
+def canonical_domain(domain: str) -> str:
+    """
+    Normalizes the domain of an email address: lower-cased, without a trailing dot, in its IDNA (punycode) form.
+
+    Args:
+        domain (str): The domain, e.g. 'Bücher.Example.'.
+
+    Returns:
+        str: The canonical domain, e.g. 'xn--bcher-kva.example'.
+    """
+    domain = domain.strip().rstrip(".").lower()
+    if not domain.isascii():
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            # Keep the lower-cased form of labels that IDNA rejects, the address is still unique
+            pass
+    return domain
+
+
+def canonical_email(email: str, provider_rules: bool = None) -> str:
+    """
+    Computes the canonical key of an email address, used to detect addresses that reach the same mailbox.
+
+    The local part is lower-cased (every major provider treats it case-insensitively) and the domain is
+    normalized with `canonical_domain`. With `provider_rules`, the sub-address tags and the dots ignored
+    by the provider of the domain are removed, and domain aliases are resolved:
+
+        'John.Doe+News@GoogleMail.com' -> 'johndoe@gmail.com'
+
+    The key is computed once when the customer is written and stored in an indexed column, so duplicate
+    checks, suppressions and domain grouping compare plain strings instead of normalizing every row.
+
+    Args:
+        email (str): The email address.
+        provider_rules (bool, optional): Whether to apply the provider-specific rules.
+                                         Defaults to the EMAIL_PROVIDER_RULES setting (enabled).
+
+    Returns:
+        str: The canonical key, or the trimmed, lower-cased input if it has no '@'.
+    """
+    local_part, separator, domain = email.strip().rpartition("@")
+    if not separator:
+        return email.strip().lower()
+
+    local_part = local_part.lower()
+    domain = canonical_domain(domain)
+
+    if provider_rules is None:
+        provider_rules = APPLY_PROVIDER_RULES
+    if provider_rules:
+        domain = DOMAIN_ALIASES.get(domain, domain)
+        rules = PROVIDER_RULES.get(domain)
+        if rules:
+            local_part = local_part.split(rules["tag"], 1)[0] or local_part
+            if rules["dots"]:
+                local_part = local_part.replace(".", "") or local_part
+    return f"{local_part}@{domain}"
+
+
+def email_domain(email_key: str) -> str:
+    """
+    Returns the domain of a canonical key, used to group customers by mailbox provider.
+
+    Args:
+        email_key (str): A key returned by `canonical_email`.
+
+    Returns:
+        str: The domain, or an empty string.
+    """
+    return email_key.rpartition("@")[2]
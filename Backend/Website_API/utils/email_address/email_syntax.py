@@ -0,0 +1,120 @@
+import re
+from functools import lru_cache
+from utils.email_address.public_suffixes import PUBLIC_SUFFIXES, WILDCARD_SUFFIXES, EXCEPTION_SUFFIXES
+
+# Length limits of RFC 5321 (the address must fit a MAIL FROM / RCPT TO path)
+MAX_EMAIL_LENGTH = 254
+MAX_LOCAL_PART_LENGTH = 64
+
+# Local part: an RFC 5322 dot-atom (no leading, trailing or consecutive dots). Quoted local parts are rejected,
+# no mailbox provider hands them out and many MTAs refuse them.
+_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_LOCAL_PART = rf"{_ATOM}(?:\.{_ATOM})*"
+
+# Domain: at least two LDH labels of 1 to 63 characters that do not start or end with a hyphen,
+# the last one (the TLD) starting with a letter, which also rejects IP addresses
+_LABEL = r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+_TLD = r"[A-Za-z](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+_DOMAIN = rf"(?:{_LABEL}\.)+{_TLD}"
+
+# Compiled once, each part is validated with a single anchored match
+LOCAL_PART_PATTERN = re.compile(_LOCAL_PART, re.ASCII)
+DOMAIN_PATTERN = re.compile(_DOMAIN, re.ASCII)
+
+# Results of `check_email_domain`
+DOMAIN_INVALID = 0
+DOMAIN_VALID = 1
+DOMAIN_REGISTRABLE = 2
+
+
+def idna_domain(domain: str) -> str:
+    """
+    Converts an internationalized domain to its IDNA (punycode) form.
+
+    Args:
+        domain (str): The domain, e.g. 'bücher.de'.
+
+    Returns:
+        str: The ASCII domain, e.g. 'xn--bcher-kva.de', or an empty string if the domain is not valid IDNA.
+    """
+    try:
+        return domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return ''
+
+
+def has_public_suffix(domain: str) -> bool:
+    """
+    Checks offline (without any DNS query) that a domain can exist: it must end with a known public suffix
+    (e.g. 'com', 'co.uk') and have a registrable label before it ('example.co.uk', not 'co.uk').
+
+    Uses the bundled ICANN section of the Public Suffix List, following the algorithm of publicsuffix.org
+    except that a domain whose TLD is not listed is rejected.
+
+    Args:
+        domain (str): A syntactically valid, lower-cased ASCII domain.
+
+    Returns:
+        bool: True if the domain has a registrable part under a known public suffix.
+    """
+    labels = domain.split(".")
+    for index in range(len(labels)):
+        candidate = ".".join(labels[index:])
+        if candidate in EXCEPTION_SUFFIXES:
+            # The exception itself is registrable, its parent is the public suffix
+            return True
+        parent = ".".join(labels[index + 1:])
+        if candidate in PUBLIC_SUFFIXES or parent in WILDCARD_SUFFIXES:
+            # The longest matching rule wins: the domain needs at least one label before the suffix
+            return index > 0
+    return False
+
+
+@lru_cache(maxsize=65536)
+def check_email_domain(domain: str) -> int:
+    """
+    Validates the domain of an email address.
+
+    A list of customers shares few domains, so the result is cached per domain: the domain rules, the IDNA
+    conversion and the public suffix lookup run once per distinct domain instead of once per address.
+
+    Args:
+        domain (str): The part of the address after the last '@'.
+
+    Returns:
+        int: DOMAIN_INVALID, DOMAIN_VALID (valid syntax), or DOMAIN_REGISTRABLE (also has a known public suffix).
+    """
+    if not domain.isascii():
+        # Internationalized domain: validate its IDNA form
+        domain = idna_domain(domain)
+    if len(domain) > MAX_EMAIL_LENGTH - 2 or DOMAIN_PATTERN.fullmatch(domain) is None:
+        return DOMAIN_INVALID
+    return DOMAIN_REGISTRABLE if has_public_suffix(domain.lower()) else DOMAIN_VALID
+
+
+def is_valid_email(email: str, check_domain: bool = False) -> bool:
+    """
+    Validates the syntax of an email address with RFC-reasonable rules.
+
+    Accepted: a dot-atom local part of up to 64 characters, '@', and a domain of LDH labels (internationalized
+    domains are accepted through their IDNA form), 254 characters in total.
+    Rejected: consecutive / leading / trailing dots, labels that start or end with a hyphen, single-label
+    domains, IP literals, quoted local parts, whitespace.
+
+    The local part is checked with one precompiled match and the domain with the cached `check_email_domain`,
+    which makes validating a large import faster than the single regex `email_input` used before.
+
+    Args:
+        email (str): The email address.
+        check_domain (bool, optional): Also require a known public suffix with a registrable label
+                                       (see `has_public_suffix`). Defaults to False.
+
+    Returns:
+        bool: True if the address is valid.
+    """
+    local_part, separator, domain = email.rpartition("@")
+    if not separator or len(local_part) > MAX_LOCAL_PART_LENGTH or len(email) > MAX_EMAIL_LENGTH:
+        return False
+    if LOCAL_PART_PATTERN.fullmatch(local_part) is None:
+        return False
+    return check_email_domain(domain) >= (DOMAIN_REGISTRABLE if check_domain else DOMAIN_VALID)
@@ -1,7 +1,42 @@
-import re
+import os
 from datetime import datetime
+from functools import lru_cache
+from dotenv import load_dotenv
+from utils.email_address.email_syntax import is_valid_email
 from .countries_and_cities.countries import countries
-from .countries_and_cities.cities import cities
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Reject addresses whose domain has no known public suffix (e.g. 'john@gmail.con')
+CHECK_EMAIL_DOMAINS = os.getenv("EMAIL_DOMAIN_CHECK", "true").lower() != "false"
+
+# The country names, as a set for constant-time lookups
+COUNTRIES = frozenset(countries)
+
+
+@lru_cache(maxsize=None)
+def get_cities() -> frozenset:
+    """
+    Loads the city names on first use, as a set for constant-time lookups.
+
+    The list has about 150,000 names (about 3 MB of source), so it is imported only when a city is
+    validated instead of when the app starts; `preload_input_data` loads it ahead of time.
+
+    Returns:
+        frozenset: The city names.
+    """
+    from .countries_and_cities.cities import cities
+    return frozenset(cities)
+
+
+def preload_input_data():
+    """
+    Loads the lazily loaded validation data (the city names), called by `create_app` when PRELOAD_DATA is set
+    so that workers forked from a preloaded app share it instead of each loading its own copy.
+    """
+    get_cities()
+
 
 def not_empty_input(input: str) -> bool:
     """
@@ -13,14 +48,11 @@ def not_empty_input(input: str) -> bool:
 def email_input(input: str) -> bool:
     """
     Validates if the input string is a valid email format.
-    Uses regular expression to check if the email matches the pattern.
+    Uses the precompiled parser of `is_valid_email` and, unless EMAIL_DOMAIN_CHECK is set to false,
+    checks offline that the domain ends with a known public suffix.
     Returns True if the email format is valid, otherwise False.
     """
-    # Define a regular expression pattern for a valid email
-    pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    
-    # Use re.match to check if the email matches the pattern
-    return bool(re.match(pattern, input))
+    return is_valid_email(input, check_domain=CHECK_EMAIL_DOMAINS)
 
 def password_input(input: str) -> bool:
     """
@@ -31,27 +63,27 @@ def password_input(input: str) -> bool:
 
 def check_country(input: str) -> bool:
     """
-    Checks if the given input exists in the predefined `countries` set.
+    Checks if the given input exists in the predefined `COUNTRIES` set.
     
     Args:
         input (str): The country name to check.
 
     Returns:
-        bool: True if the input is in `countries`, False otherwise.
+        bool: True if the input is in `COUNTRIES`, False otherwise.
     """
-    return input in countries
+    return input in COUNTRIES
     
 def check_city(input: str) -> bool:
     """
-    Checks if the given input exists in the predefined `cities` set.
+    Checks if the given input exists in the predefined city set, loaded on first use by `get_cities`.
     
     Args:
         input (str): The city name to check.
 
     Returns:
-        bool: True if the input is in `cities`, False otherwise.
+        bool: True if the input is in `get_cities()`, False otherwise.
     """
-    return input in cities
+    return input in get_cities()
 
 def check_date_format(date_str: str) -> bool:
     """
@@ -0,0 +1,190 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from dotenv import load_dotenv
+from werkzeug.datastructures import Headers
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import parse_accept_header, parse_etags
+from werkzeug.routing import Map, Rule
+from werkzeug.urls import url_decode
+from utils.http.json_representation import default_json, JSON_OPTIONS
+from utils.http.compression import SUPPORTED_ENCODINGS, COMPRESSION_MIN_SIZE, compress_cached, is_compressible_type
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Threads that run the Flask (WSGI) routes of each ASGI worker, the native async routes do not use them
+ASGI_WSGI_THREADS = int(os.getenv("ASGI_WSGI_THREADS", "32"))
+
+
+class AsgiRequest:
+    """
+    The request of a native ASGI route: the method, path, query parameters and headers of the ASGI scope,
+    with the same accessors as `flask.request` for what the routes use.
+    """
+
+    def __init__(self, scope: dict):
+        """
+        Args:
+            scope (dict): The ASGI HTTP scope.
+        """
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.query_string = scope.get("query_string", b"").decode("latin-1")
+        self.args = url_decode(self.query_string)
+        self.headers = Headers([(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]])
+
+    @property
+    def full_path(self) -> str:
+        """The path and the query string, like `flask.request.full_path`."""
+        return f"{self.path}?{self.query_string}"
+
+    @property
+    def if_none_match(self):
+        """The parsed If-None-Match header."""
+        return parse_etags(self.headers.get("If-None-Match"))
+
+    @property
+    def accept_encodings(self):
+        """The parsed Accept-Encoding header."""
+        return parse_accept_header(self.headers.get("Accept-Encoding"))
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """
+    Runs a WSGI application (the Flask app) behind ASGI, in a bounded pool of threads.
+
+    `asgiref.wsgi.WsgiToAsgi` runs every request on the same thread (`sync_to_async` is thread-sensitive by default),
+    which would serialize the whole Flask API; here each request gets a thread of the pool.
+    """
+
+    def __init__(self, wsgi_application, max_workers: int = ASGI_WSGI_THREADS):
+        """
+        Args:
+            wsgi_application (callable): The WSGI application.
+            max_workers (int, optional): The number of threads. Defaults to ASGI_WSGI_THREADS.
+        """
+        super().__init__(wsgi_application)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wsgi")
+
+    async def __call__(self, scope, receive, send):
+        await ThreadPoolWsgiToAsgiInstance(self.wsgi_application, self.executor, self.duplicate_header_limit)(scope, receive, send)
+
+
+class ThreadPoolWsgiToAsgiInstance(WsgiToAsgiInstance):
+    """A request of `ThreadPoolWsgiToAsgi`, run in a thread of its executor."""
+
+    # The function wrapped by `@sync_to_async` in asgiref
+    _run_wsgi_app = WsgiToAsgiInstance.__dict__["run_wsgi_app"].func
+
+    def __init__(self, wsgi_application, executor: ThreadPoolExecutor, duplicate_header_limit: int = 100):
+        super().__init__(wsgi_application, duplicate_header_limit)
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        await sync_to_async(self._run_wsgi_app, thread_sensitive=False, executor=self.executor)(body)
+
+
+class AsgiRouter:
+    """
+    An ASGI application that serves some routes natively with async handlers and passes every other
+    request to a fallback ASGI application (the Flask app).
+
+    A native route is a class with an `async def get(self, request, **path_values)` method, like the
+    Flask-RESTful resources, that returns `data`, `(data, status)` or `(data, status, headers)`.
+    `data` is serialized to JSON like the Flask API does, unless it is already bytes.
+    """
+
+    def __init__(self, fallback):
+        """
+        Args:
+            fallback (callable): The ASGI application of the other routes.
+        """
+        self.fallback = fallback
+        self.url_map = Map()
+        self.resources = {}
+        self.shutdown_hooks = []
+
+    def add_resource(self, resource, rule: str, resource_class_kwargs: dict = None):
+        """
+        Serves the GET (and HEAD) requests of a route with a native resource.
+
+        Args:
+            resource (type): The resource class.
+            rule (str): The route, with the converters of Flask, e.g. '/api/groups/user/<int:user_id>/'.
+            resource_class_kwargs (dict, optional): The arguments of the resource constructor, like in Flask-RESTful.
+        """
+        endpoint = resource.__name__
+        self.resources[endpoint] = resource(**(resource_class_kwargs or {}))
+        self.url_map.add(Rule(rule, endpoint=endpoint, methods=["GET"]))
+
+    def on_shutdown(self, hook):
+        """Registers a coroutine function awaited when the worker shuts down."""
+        self.shutdown_hooks.append(hook)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+        if scope["type"] != "http":
+            return await self.fallback(scope, receive, send)
+
+        # Anything that is not exactly a native route (other methods, redirects of the trailing slash, ...) goes to Flask
+        try:
+            endpoint, values = self.url_map.bind("").match(scope["path"], method=scope["method"])
+        except HTTPException:
+            return await self.fallback(scope, receive, send)
+
+        request = AsgiRequest(scope)
+        result = await self.resources[endpoint].get(request, **values)
+        status, headers, body = self.make_response(request, result)
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]})
+        await send({"type": "http.response.body", "body": body if request.method != "HEAD" else b""})
+
+    def make_response(self, request: AsgiRequest, result) -> tuple:
+        """
+        Builds the status, headers and body of the value returned by a resource, compressed like the Flask responses.
+
+        Args:
+            request (AsgiRequest): The request.
+            result: `data`, `(data, status)` or `(data, status, headers)`.
+
+        Returns:
+            tuple: The status, the headers and the body.
+        """
+        if isinstance(result, tuple):
+            data, status, extra_headers = result if len(result) == 3 else (*result, None)
+        else:
+            data, status, extra_headers = result, 200, None
+        headers = Headers(extra_headers or {})
+        if isinstance(data, bytes):
+            body = data
+        else:
+            body = orjson.dumps(data, default=default_json, option=JSON_OPTIONS)
+            headers["Content-Type"] = "application/json"
+
+        if status >= 200 and status not in (204, 304) and is_compressible_type(headers.get("Content-Type", "").split(";")[0]):
+            headers.add("Vary", "Accept-Encoding")
+            encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+            if encoding and len(body) >= COMPRESSION_MIN_SIZE:
+                etag = headers.get("ETag")
+                body = compress_cached(body, encoding, (request.full_path, etag, encoding) if etag else None)
+                headers["Content-Encoding"] = encoding
+
+        if status != 304:
+            headers["Content-Length"] = str(len(body))
+        return status, headers, body
+
+    async def lifespan(self, receive, send):
+        """Handles the lifespan messages of the ASGI server (the shutdown hooks run on shutdown)."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for hook in self.shutdown_hooks:
+                    await hook()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,260 @@
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from dotenv import load_dotenv
+from flask import request
+
+# Brotli and Zstandard are used when their packages are installed, gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Load environment variables from the .env file
+load_dotenv()
+
+# Bodies smaller than this (in bytes) are sent as is, compressing them costs more than it saves
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Levels that keep compression fast enough for dynamic responses
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+# Streamed bodies are flushed to the client every time this many bytes (uncompressed) went through the compressor
+STREAM_FLUSH_BYTES = int(os.getenv("COMPRESSION_STREAM_FLUSH_BYTES", str(16 * 1024)))
+
+# Memory used by the compressed bodies of GET responses with an ETag, 0 disables the cache
+COMPRESSION_CACHE_BYTES = int(os.getenv("COMPRESSION_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+# Media types worth compressing (images such as the tracking pixel are already compact)
+COMPRESSIBLE_TYPES = {"application/json", "application/javascript", "application/xml", "image/svg+xml", "text/csv"}
+
+# Encodings in order of preference when the client accepts several with the same quality
+SUPPORTED_ENCODINGS = [encoding for encoding, available in
+                       (("br", brotli is not None), ("zstd", zstandard is not None), ("gzip", True)) if available]
+
+
+class CompressedBodyCache:
+    """
+    An LRU cache of compressed response bodies, bounded by their total size in bytes.
+
+    Bodies are keyed by the path (with its query string), the ETag and the encoding of the response: as long as
+    the ETag of a resource does not change, its compressed body is reused instead of being compressed again.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes (int): The maximum total size of the cached bodies.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> bytes | None:
+        """Returns the cached body of the key (and marks it as recently used), or None."""
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: tuple, body: bytes):
+        """Caches a body, evicting the least recently used bodies to stay under `max_bytes`."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._bodies.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._bodies[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._bodies.popitem(last=False)
+                self.size -= len(evicted)
+
+    def stats(self) -> dict:
+        """Returns the number of entries, their size, and the hit / miss counters."""
+        with self._lock:
+            return {"entries": len(self._bodies), "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+
+compressed_bodies = CompressedBodyCache(COMPRESSION_CACHE_BYTES)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses a whole body.
+
+    Args:
+        body (bytes): The body.
+        encoding (str): 'br', 'zstd' or 'gzip'.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_stream(chunks, encoding: str):
+    """
+    Compresses a streamed body chunk by chunk without buffering it. The compressor is flushed every
+    STREAM_FLUSH_BYTES of input, so the client receives data as it is produced while small chunks
+    still compress well together.
+
+    Args:
+        chunks (iterable): The chunks of the body (bytes or str).
+        encoding (str): 'br', 'zstd' or 'gzip'.
+
+    Yields:
+        bytes: The compressed chunks.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, flush, finish = compressor.process, compressor.flush, compressor.finish
+    elif encoding == "zstd":
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        compress = compressor.compress
+        flush = lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        finish = compressor.flush
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+        finish = compressor.flush
+
+    pending = 0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compress(chunk)
+            pending += len(chunk)
+            if pending >= STREAM_FLUSH_BYTES:
+                data += flush()
+                pending = 0
+            if data:
+                yield data
+        yield finish()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+
+
+def compress_cached(body: bytes, encoding: str, cache_key: tuple = None) -> bytes:
+    """
+    Compresses a whole body, reusing the compressed body cached under the key.
+
+    Args:
+        body (bytes): The body.
+        encoding (str): 'br', 'zstd' or 'gzip'.
+        cache_key (tuple, optional): `(full path, ETag, encoding)`, None to skip the cache.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if cache_key and not compressed_bodies.max_bytes:
+        cache_key = None
+    compressed = compressed_bodies.get(cache_key) if cache_key else None
+    if compressed is None:
+        compressed = compress_body(body, encoding)
+        if cache_key:
+            compressed_bodies.put(cache_key, compressed)
+    return compressed
+
+
+def is_compressible_type(mimetype: str) -> bool:
+    """Checks whether a media type is worth compressing (text, JSON, ...)."""
+    mimetype = mimetype or ""
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_TYPES
+
+
+def is_compressible(response) -> bool:
+    """
+    Checks whether a response may be compressed.
+
+    Args:
+        response (Response): The response.
+
+    Returns:
+        bool: False for bodiless or partial responses, responses that are already encoded, files and
+              media types that do not compress well.
+    """
+    if response.status_code < 200 or response.status_code in (204, 206, 304) or request.method == "HEAD":
+        return False
+    if "Content-Encoding" in response.headers or response.direct_passthrough:
+        return False
+    return is_compressible_type(response.mimetype)
+
+
+def compress_response(response):
+    """
+    Compresses a response with the best encoding accepted by the client (an `after_request` hook).
+
+    - Regular bodies are compressed when they are at least COMPRESSION_MIN_SIZE bytes.
+    - Streamed (generator) bodies are always compressed, chunk by chunk, without buffering them.
+    - The compressed bodies of GET responses with an ETag are cached, a repeated request for an unchanged
+      resource skips the compression.
+
+    Args:
+        response (Response): The response.
+
+    Returns:
+        Response: The same response, compressed when applicable.
+    """
+    if not is_compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return response
+
+    etag = response.headers.get("ETag")
+    cache_key = (request.full_path, etag, encoding) if etag and request.method == "GET" else None
+    compressed = compress_cached(body, encoding, cache_key)
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    if etag and not etag.startswith("W/"):
+        # A strong ETag identifies the exact bytes, the compressed representation needs its own
+        response.headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+    return response
+
+
+def init_compression(app):
+    """
+    Registers the response compression on the Flask application.
+
+    Args:
+        app (Flask): The Flask application.
+    """
+    app.after_request(compress_response)
@@ -0,0 +1,74 @@
+from flask import request, Response
+
+# Responses with an ETag may be stored by the browser, but must be revalidated (a conditional GET) before every use.
+# 'private' keeps shared caches from storing them, the lists are only served with a token.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a weak ETag from the parts that identify a version of a resource.
+
+    The ETag is weak because it identifies the content, not the exact bytes: the same version is served
+    compressed or not (see `compress_response`).
+
+    Args:
+        *parts: The parts, e.g. `('customers', group_id, version)`. None parts are skipped.
+
+    Returns:
+        str: The ETag, e.g. 'W/"customers-7-v12"'.
+    """
+    return 'W/"' + "-".join(str(part) for part in parts if part is not None) + '"'
+
+
+def etag_matches(etag: str, if_none_match) -> bool:
+    """
+    Checks whether a parsed If-None-Match header matches an ETag.
+
+    Args:
+        etag (str): The ETag built with `make_etag`.
+        if_none_match (ETags): The parsed header (see `werkzeug.http.parse_etags`).
+
+    Returns:
+        bool: True if the header matches the ETag (weak comparison) or is '*'.
+    """
+    return if_none_match.contains_weak(etag[3:-1])
+
+
+def is_not_modified(etag: str) -> bool:
+    """
+    Checks whether the client already has the version of a resource identified by an ETag.
+
+    Args:
+        etag (str): The ETag built with `make_etag`.
+
+    Returns:
+        bool: True if the If-None-Match header of the request matches the ETag (weak comparison) or is '*'.
+    """
+    return etag_matches(etag, request.if_none_match)
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Builds the bodiless 304 response of a conditional GET whose ETag matches.
+
+    Args:
+        etag (str): The ETag of the current version.
+
+    Returns:
+        Response: The 304 response, with the ETag and the Cache-Control of the full response.
+    """
+    return Response(status=304, headers=etag_headers(etag))
+
+
+def etag_headers(etag: str) -> dict:
+    """
+    Returns the caching headers of a response identified by an ETag.
+
+    Args:
+        etag (str): The ETag.
+
+    Returns:
+        dict: The ETag and Cache-Control headers.
+    """
+    return {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
@@ -0,0 +1,130 @@
+from functools import lru_cache
+
+# Every User-Agent is reduced to a small integer stored with the tracking events:
+#   bits 0-2  device type
+#   bits 3-6  operating system
+#   bits 7-11 email client / browser
+# The code of an unknown User-Agent is 0, and every code fits in a SMALLINT column.
+DEVICE_BITS = 3
+OS_BITS = 4
+
+DEVICES = ["unknown", "desktop", "mobile", "tablet", "proxy"]
+OPERATING_SYSTEMS = ["unknown", "windows", "macos", "ios", "android", "linux", "chromeos"]
+CLIENTS = [
+    "unknown", "gmail", "apple_mail", "outlook", "thunderbird", "yahoo_mail",
+    "chrome", "firefox", "safari", "edge", "opera", "samsung_internet"
+]
+
+# Rules are checked in order against the lower-cased User-Agent, the first matching substring wins
+CLIENT_RULES = [
+    ("googleimageproxy", "gmail"),
+    ("yahoomailproxy", "yahoo_mail"),
+    ("microsoft outlook", "outlook"),
+    ("ms-office", "outlook"),
+    ("msoffice", "outlook"),
+    ("outlook", "outlook"),
+    ("thunderbird", "thunderbird"),
+    ("samsungbrowser", "samsung_internet"),
+    ("edg/", "edge"),
+    ("edga/", "edge"),
+    ("edgios/", "edge"),
+    ("opr/", "opera"),
+    ("opera", "opera"),
+    ("firefox/", "firefox"),
+    ("fxios/", "firefox"),
+    ("crios/", "chrome"),
+    ("chrome/", "chrome"),
+    ("safari/", "safari"),
+]
+
+OS_RULES = [
+    ("iphone", "ios"),
+    ("ipad", "ios"),
+    ("ipod", "ios"),
+    ("android", "android"),
+    ("cros ", "chromeos"),  # "CrOS x86_64", the space avoids matching "Microsoft"
+    ("windows", "windows"),
+    ("macintosh", "macos"),
+    ("mac os x", "macos"),
+    ("linux", "linux"),
+]
+
+PROXY_CLIENTS = {"gmail", "yahoo_mail"}
+
+
+def encode_device_code(device: str, operating_system: str, client: str) -> int:
+    """
+    Packs a device type, an operating system and a client into a single integer.
+
+    Args:
+        device (str): One of `DEVICES`.
+        operating_system (str): One of `OPERATING_SYSTEMS`.
+        client (str): One of `CLIENTS`.
+
+    Returns:
+        int: The device code.
+    """
+    return (DEVICES.index(device)
+            | OPERATING_SYSTEMS.index(operating_system) << DEVICE_BITS
+            | CLIENTS.index(client) << (DEVICE_BITS + OS_BITS))
+
+
+def describe_device_code(device_code: int) -> dict:
+    """
+    Unpacks a device code into readable names.
+
+    Args:
+        device_code (int): A code created by `encode_device_code` or `classify_user_agent`.
+
+    Returns:
+        dict: The `device`, `os` and `client` names ('unknown' for unexpected values).
+    """
+    device = device_code & ((1 << DEVICE_BITS) - 1)
+    operating_system = (device_code >> DEVICE_BITS) & ((1 << OS_BITS) - 1)
+    client = device_code >> (DEVICE_BITS + OS_BITS)
+    return {
+        "device": DEVICES[device] if device < len(DEVICES) else "unknown",
+        "os": OPERATING_SYSTEMS[operating_system] if operating_system < len(OPERATING_SYSTEMS) else "unknown",
+        "client": CLIENTS[client] if client < len(CLIENTS) else "unknown"
+    }
+
+
+@lru_cache(maxsize=4096)
+def classify_user_agent(user_agent: str) -> int:
+    """
+    Classifies a raw User-Agent string into a device code.
+
+    The results are memoized: the number of distinct User-Agents is tiny compared to the number of
+    open and click events, so almost every call on the ingest path is a cache hit.
+
+    Args:
+        user_agent (str): The raw User-Agent header (callers should truncate it, e.g. to 512 characters).
+
+    Returns:
+        int: The device code, 0 if the User-Agent is empty.
+    """
+    if not user_agent:
+        return 0
+    ua = user_agent.lower()
+
+    client = next((name for token, name in CLIENT_RULES if token in ua), "unknown")
+    operating_system = next((name for token, name in OS_RULES if token in ua), "unknown")
+
+    # Apple Mail renders with WebKit but, unlike Safari, does not send a Safari/ or Version/ token
+    if client == "unknown" and "applewebkit" in ua and operating_system in ("macos", "ios"):
+        client = "apple_mail"
+
+    if client in PROXY_CLIENTS:
+        # Image proxies fetch the pixel on behalf of the reader, the real device and system are hidden
+        device = "proxy"
+        operating_system = "unknown"
+    elif "ipad" in ua or "tablet" in ua or (operating_system == "android" and "mobile" not in ua):
+        device = "tablet"
+    elif "mobile" in ua or operating_system in ("ios", "android"):
+        device = "mobile"
+    elif operating_system != "unknown" or client != "unknown":
+        device = "desktop"
+    else:
+        device = "unknown"
+
+    return encode_device_code(device, operating_system, client)
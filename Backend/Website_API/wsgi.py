@@ -0,0 +1,6 @@
+from app import create_app
+
+# WSGI entry point of the production server:
+#   gunicorn -c gunicorn_config.py wsgi:app
+# GUNICORN_PROFILE=cpu|io selects the workers and threads, see gunicorn_config.py
+app = create_app()